@@ -27,7 +27,9 @@ class BaseAgent:
         if tool_name not in self.tools:
             raise ValueError(f"Tool {tool_name} not found for {self.name}")
         
-        print(f"[{self.name}] Executing {tool_name} with args: {kwargs}")
+        # Keep the log line short even for batch tools that take long lists
+        args = ", ".join(f"{k}={str(v)[:50]}" for k, v in kwargs.items())
+        print(f"[{self.name}] Executing {tool_name} with args: {args}")
         return self.tools[tool_name](**kwargs)
 
     def run(self, input_data: Any) -> Any:
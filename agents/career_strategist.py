@@ -1,4 +1,5 @@
 from .base import BaseAgent
+from skills.taxonomy import get_taxonomy
 
 class CareerStrategist(BaseAgent):
     def __init__(self):
@@ -8,6 +9,7 @@ class CareerStrategist(BaseAgent):
             goal="Analyze profiles and generate professional summaries.", 
             backstory="A seasoned career counselor who knows how to highlight a candidate's strengths."
         )
+        self.taxonomy = get_taxonomy()
 
     def analyze_seniority(self, years_exp: int) -> str:
         if years_exp == 0: return "Entry-Level"
@@ -17,22 +19,8 @@ class CareerStrategist(BaseAgent):
         return "Lead/Principal"
 
     def identify_gaps(self, title: str, skills: list) -> list:
-        """Simple gap analysis based on title keywords and missing skills."""
-        title_lower = title.lower()
-        skill_names = [s.lower() for s in skills]
-        suggestions = []
-
-        if "full stack" in title_lower:
-            if not any(x in skill_names for x in ["react", "vue", "angular"]):
-                suggestions.append("Consider learning a modern frontend framework (React/Vue).")
-            if not any(x in skill_names for x in ["node", "python", "java", "c#", "php"]):
-                suggestions.append("Strengthen your backend skills (Node/Python/Java).")
-
-        if "data" in title_lower:
-             if not any(x in skill_names for x in ["sql", "pandas", "python"]):
-                suggestions.append("Data roles require strong SQL and Python foundations.")
-
-        return suggestions
+        """Gap analysis: requirements of the roles in the title that no listed skill covers."""
+        return self.taxonomy.gaps(title, skills)
 
     def run(self, profile_data: dict) -> dict:
         """
@@ -1,7 +1,11 @@
 from .base import BaseAgent
 from skills.market_research import MarketResearchSkill
 from skills.content_analysis import ContentAnalysisSkill
-import time
+from skills.taxonomy import get_taxonomy
+from scrapers.aggregator import dedupe_jobs
+from scrapers.dedup import collapse_near_duplicates
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 
 class JobScout(BaseAgent):
     def __init__(self):
@@ -13,27 +17,22 @@ class JobScout(BaseAgent):
         )
         self.add_tool("search_jobs", MarketResearchSkill.search_jobs)
         self.add_tool("analyze_match", ContentAnalysisSkill.calculated_ats_score)
+        self.add_tool("rank_matches", ContentAnalysisSkill.batch_ats_scores)
 
-        # Knowledge Base simple (Synonyms map)
-        self.synonyms = {
-            "python": ["django", "flask", "backend developer", "software engineer"],
-            "react": ["frontend developer", "javascript", "typescript", "next.js"],
-            "node": ["backend developer", "javascript", "express"],
-            "data scientist": ["data analyst", "machine learning", "python"],
-            "devops": ["sre", "cloud engineer", "aws", "docker"],
-        }
+        # Upper bound on concurrent searches; politeness per host is enforced
+        # by the scrapers' shared rate limiter, not by sleeping here.
+        self.max_workers = int(os.environ.get('JOB_SCOUT_WORKERS', 4))
+
+        # Skill/role taxonomy (skills/skill_taxonomy.json) drives query expansion
+        self.taxonomy = get_taxonomy()
+        self.max_terms = int(os.environ.get('JOB_SCOUT_MAX_TERMS', 3))
 
     def expand_query(self, query: str) -> list:
-        """Expands a single query into related terms based on knowledge base."""
-        query_lower = query.lower()
-        expanded = [query]
-        
-        for key, distinct_terms in self.synonyms.items():
-            if key in query_lower:
-                expanded.extend(distinct_terms)
-        
-        # Deduplicate and limit to 3 extra terms to avoid spamming
-        return list(dict.fromkeys(expanded))[:3]
+        """Expands a single query into related terms based on the skill taxonomy."""
+        expanded = [query] + self.taxonomy.expand(query)
+
+        # Deduplicate and limit the number of searches to avoid spamming
+        return list(dict.fromkeys(expanded))[:self.max_terms]
 
     def run(self, query: str, location: str = "", profile_data: dict = None) -> list:
         print(f"[{self.name}] Received task: Search jobs for '{query}' in '{location}'")
@@ -43,42 +42,46 @@ class JobScout(BaseAgent):
         print(f"[{self.name}] Strategy: Expanded search terms -> {search_terms}")
         
         all_jobs = []
-        seen_urls = set()
+        seen = set()
+
+        # 2. Parallel Exec: one search per term, merged as results arrive
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(search_terms)))) as pool:
+            futures = {}
+            for term in search_terms:
+                print(f"[{self.name}] Searching specifically for: '{term}'...")
+                futures[pool.submit(self.act, "search_jobs", query=term, location=location)] = term
 
-        # 2. Parallel/Sequential Exec (Sequential for now)
-        for term in search_terms:
-            print(f"[{self.name}] Searching specifically for: '{term}'...")
-            jobs = self.act("search_jobs", query=term, location=location)
-            
-            for job in jobs:
-                if job['url'] not in seen_urls:
-                    all_jobs.append(job)
-                    seen_urls.add(job['url'])
-            
-                if len(search_terms) > 1:
-                    time.sleep(2)
+            for future in as_completed(futures):
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    print(f"[{self.name}] Search for '{futures[future]}' failed: {e}")
+                    continue
 
+                all_jobs.extend(dedupe_jobs(jobs, seen))
+
+        # Same posting found through two synonyms or sources under different URLs
+        all_jobs = collapse_near_duplicates(all_jobs)
         print(f"[{self.name}] Found {len(all_jobs)} unique jobs after deductive reasoning.")
 
         # 3. Rank by Profile Match (if profile provided)
         if profile_data:
             print(f"[{self.name}] Ranking {len(all_jobs)} jobs against candidate profile...")
-            ranked_jobs = []
-            
             # Construct a simple text represention of the profile
             skills_text = " ".join([s.get('name', '') for s in profile_data.get('skills', [])])
             title_text = profile_data.get('professional_title', '')
             profile_text = f"{title_text} {skills_text}"
 
-            for job in all_jobs:
-                # Use description if available, else title + company
-                job_text = job.get('description', '') or f"{job['title']} {job['company']}"
-                
-                match_result = self.act("analyze_match", resume_text=profile_text, job_description=job_text)
-                job['match_score'] = match_result['score']
+            # Use description if available, else title + company
+            job_texts = [job.get('description', '') or f"{job['title']} {job['company']}" for job in all_jobs]
+
+            # One batch call scores every job; results come back best first
+            ranking = self.act("rank_matches", resume_text=profile_text, job_descriptions=job_texts, top_k=len(job_texts))
+            ranked_jobs = []
+            for result in ranking:
+                job = all_jobs[result['index']]
+                job['match_score'] = result['score']
                 ranked_jobs.append(job)
-            
-            # Sort by score desc
-            all_jobs = sorted(ranked_jobs, key=lambda x: x['match_score'], reverse=True)
-            
+            all_jobs = ranked_jobs
+
         return all_jobs
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
+import hmac
+import json
 import os
-
-from flask import Flask, jsonify, render_template, request, make_response
-from pdf_templates import ClassicPDF, ModernPDF, TemplateUnoPDF
-from scraper import scrape_jobs
-from models import (
-    db, Candidate, Experience, Education, Skill, Language, 
-    Certification, Project, Link, Job, Application
-)
+import re
+import time
+
+from flask import Flask, Response, jsonify, render_template, request, make_response, stream_with_context
+from sqlalchemy.orm import selectinload
+from pdf_templates import render_pdf
+from pdf_profiling import PROFILE_SECTIONS, section_stats
+from pdf_cache import pdf_cache_from_env, pdf_cache_key
+from pdf_render_pool import QueueFull, render_pool_from_env
+from bulk_export import ExportBusy, export_pool_from_env, export_zip, iter_candidates, parse_styles
+from candidate_store import insert_candidate, parse_submission
+from migrations import migrate
+from db_profiles import engine_profile
+from scrapers.aggregator import aggregator, dedupe_jobs
+from scrapers.cache import job_cache
+from scrapers.computrabajo import fetch_stats as computrabajo_fetch_stats
+from skills.keyword_cache import keyword_cache
+from skills.candidate_index import candidate_index, document_text
+from skills.ats_batch import ats_pool
+from models import db, Candidate, Job, Application
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -41,12 +54,29 @@ else:
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-db.init_app(app)
+# Pooling and SQLite PRAGMAs for where the app runs (see db_profiles.py)
+db_profile = engine_profile(app.config['SQLALCHEMY_DATABASE_URI'])
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = db_profile.options
 
-# Create tables if they don't exist (for Vercel/Prod)
+db.init_app(app)
+with app.app_context():
+    db_profile.install(db.engine)
+
+pdf_cache = pdf_cache_from_env(BASE_DIR)
+render_pool = render_pool_from_env()
+# PDF_RENDER_ASYNC=1 makes queued rendering the default for /api/download (?async=0 opts out)
+PDF_RENDER_ASYNC = os.environ.get('PDF_RENDER_ASYNC', '0')
+export_pool = export_pool_from_env()
+# /api/export hands out every stored CV, so it is off unless a token is set
+# (requests then need "Authorization: Bearer <token>"); the CLI needs none
+BULK_EXPORT_TOKEN = os.environ.get('BULK_EXPORT_TOKEN')
+
+# Create tables if they don't exist (for Vercel/Prod), then bring existing
+# databases up to date (indexes and other changes create_all() won't make)
 with app.app_context():
     try:
         db.create_all()
+        migrate(db.engine)
     except Exception as e:
         print(f"Error creating database tables: {e}")
 
@@ -67,145 +97,209 @@ def submit():
     if missing:
         return jsonify({"error": "Missing required fields", "fields": missing}), 400
 
-    created_at = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-
-    # Create Candidate
-    candidate = Candidate(
-        full_name=data.get("full_name", "").strip(),
-        professional_title=data.get("professional_title", "").strip(),
-        location=data.get("location", "").strip(),
-        phone=data.get("phone", "").strip(),
-        email=data.get("email", "").strip(),
-        linkedin=data.get("linkedin", "").strip(),
-        portfolio=data.get("portfolio", "").strip(),
-        github=data.get("github", "").strip(),
-        summary=data.get("summary", "").strip(),
-        created_at=created_at
-    )
-    db.session.add(candidate)
-    db.session.flush() # Get ID
-
-    def has_values(item: dict, fields: list[str]) -> bool:
-        return any((item.get(field) or "").strip() for field in fields)
-
-    # Experiences
-    for exp in data.get("experiences", []) or []:
-        if not has_values(exp, ["company", "role"]): continue
-        db.session.add(Experience(
-            candidate_id=candidate.id,
-            company=exp.get("company", "").strip(),
-            role=exp.get("role", "").strip(),
-            location=exp.get("location", "").strip(),
-            start_date=exp.get("start_date", "").strip(),
-            end_date=exp.get("end_date", "").strip(),
-            description=exp.get("description", "").strip()
-        ))
-
-    # Educations
-    for edu in data.get("educations", []) or []:
-        if not has_values(edu, ["institution", "degree"]): continue
-        db.session.add(Education(
-            candidate_id=candidate.id,
-            institution=edu.get("institution", "").strip(),
-            degree=edu.get("degree", "").strip(),
-            field=edu.get("field", "").strip(),
-            start_date=edu.get("start_date", "").strip(),
-            end_date=edu.get("end_date", "").strip(),
-            description=edu.get("description", "").strip()
-        ))
-
-    # Skills
-    for skill in data.get("skills", []) or []:
-        if not has_values(skill, ["name"]): continue
-        db.session.add(Skill(
-            candidate_id=candidate.id,
-            name=skill.get("name", "").strip(),
-            level=skill.get("level", "").strip()
-        ))
-
-    # Languages
-    for lang in data.get("languages", []) or []:
-        if not has_values(lang, ["name"]): continue
-        db.session.add(Language(
-            candidate_id=candidate.id,
-            name=lang.get("name", "").strip(),
-            level=lang.get("level", "").strip()
-        ))
-
-    # Certifications
-    for cert in data.get("certifications", []) or []:
-        if not has_values(cert, ["name"]): continue
-        db.session.add(Certification(
-            candidate_id=candidate.id,
-            name=cert.get("name", "").strip(),
-            issuer=cert.get("issuer", "").strip(),
-            date=cert.get("date", "").strip(),
-            url=cert.get("url", "").strip()
-        ))
-
-    # Projects
-    for proj in data.get("projects", []) or []:
-        if not has_values(proj, ["name"]): continue
-        db.session.add(Project(
-            candidate_id=candidate.id,
-            name=proj.get("name", "").strip(),
-            role=proj.get("role", "").strip(),
-            description=proj.get("description", "").strip(),
-            url=proj.get("url", "").strip(),
-            technologies=proj.get("technologies", "").strip()
-        ))
-
-    # Links
-    for link in data.get("links", []) or []:
-        if not has_values(link, ["url"]): continue
-        db.session.add(Link(
-            candidate_id=candidate.id,
-            label=link.get("label", "").strip(),
-            url=link.get("url", "").strip()
-        ))
-
+    # One multi-row INSERT per section plus the document, in one transaction
+    candidate_values, sections = parse_submission(data)
+    candidate_id, document = insert_candidate(candidate_values, sections)
     db.session.commit()
-    return jsonify({"status": "ok", "candidate_id": candidate.id})
+
+    # Keep the reverse-match index current; an index not loaded yet will
+    # pick this candidate up from the database on first use.
+    if candidate_index.loaded:
+        candidate_index.add(candidate_id, document_text(document))
+
+    return jsonify({"status": "ok", "candidate_id": candidate_id})
+
+
+# Size of the slices a PDF is handed to the WSGI server in
+PDF_STREAM_CHUNK = int(os.environ.get('PDF_STREAM_CHUNK', 64 * 1024))
+
+
+def _iter_chunks(content, size=PDF_STREAM_CHUNK):
+    view = memoryview(content)
+    for start in range(0, len(view), size):
+        yield bytes(view[start:start + size])
+
+
+def _pdf_response(content, key, filename, cache_status):
+    # Streamed in slices of the rendered buffer, so no second full copy is made
+    response = Response(_iter_chunks(content), mimetype='application/pdf', direct_passthrough=True)
+    response.headers['Content-Length'] = str(len(content))
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    response.headers['X-PDF-Cache'] = cache_status
+    response.set_etag(key)
+    # Personal data: browsers only, and always revalidate (cheap 304) since the CV can change
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _store_render(job):
+    if pdf_cache:
+        pdf_cache.set(job.key, job.content)
+        # Served from the cache from now on; the job keeps only its status
+        job.content = None
 
 
 @app.route("/api/download/<int:candidate_id>")
 def download_pdf(candidate_id):
-    candidate = db.session.get(Candidate, candidate_id)
-    if not candidate:
+    template_data = Candidate.load_document(candidate_id)
+    if template_data is None:
         return jsonify({"error": "Candidate not found"}), 404
 
-    # Convert to dictionary structure expected by template
-    template_data = {
-        "candidate": candidate.to_dict(),
-        "experiences": [x.to_dict() for x in candidate.experiences],
-        "educations": [x.to_dict() for x in candidate.educations],
-        "skills": [x.to_dict() for x in candidate.skills],
-        "languages": [x.to_dict() for x in candidate.languages],
-        "certifications": [x.to_dict() for x in candidate.certifications],
-        "projects": [x.to_dict() for x in candidate.projects],
-        "links": [x.to_dict() for x in candidate.links]
-    }
-
     style = request.args.get("style", "classic")
-    
-    if style == "modern":
-        pdf = ModernPDF(template_data)
-    elif style == "uno":
-        pdf = TemplateUnoPDF(template_data)
-    else:
-        pdf = ClassicPDF(template_data)
-        
-    pdf.generate()
+    filename = f"cv_{candidate_id}_{style}.pdf"
+
+    # Same data + style + template version => same bytes, so the content
+    # hash doubles as ETag and lets repeat downloads skip the render.
+    key = pdf_cache_key(template_data, style)
+    if request.if_none_match.contains(key):
+        response = make_response("", 304)
+        response.set_etag(key)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    content = pdf_cache.get(key) if pdf_cache else None
+    if content is not None:
+        return _pdf_response(content, key, filename, "HIT")
+
+    if request.args.get("async", PDF_RENDER_ASYNC) == "1":
+        # Opt-in: render on the worker pool and let the client poll for it
+        try:
+            job = render_pool.submit(key, template_data, style, meta={"filename": filename}, on_done=_store_render)
+        except QueueFull:
+            response = jsonify({"error": "Render queue is full, retry shortly"})
+            response.headers['Retry-After'] = '2'
+            return response, 429
+        status_url = f"/api/renders/{job.id}"
+        response = jsonify({**job.to_dict(), "status_url": status_url, "download_url": f"{status_url}/pdf"})
+        response.headers['Location'] = status_url
+        return response, 202
+
+    content = render_pdf(template_data, style)
+    if pdf_cache:
+        pdf_cache.set(key, content)
+    return _pdf_response(content, key, filename, "MISS")
+
+
+@app.route("/api/export")
+def bulk_export_route():
+    """
+    ZIP of many CVs: ?styles=classic,modern (default all) and optional
+    ?ids=1,2,3. Streamed entry by entry as renders finish (see bulk_export.py).
+    Needs BULK_EXPORT_TOKEN as a bearer token; 404 when no token is configured.
+    """
+    if not BULK_EXPORT_TOKEN:
+        return jsonify({"error": "Not found"}), 404
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(token.encode(), BULK_EXPORT_TOKEN.encode()):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        styles = parse_styles(request.args.get("styles", "all"))
+        ids = [int(i) for i in request.args.get("ids", "").split(",") if i.strip()] or None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    response = make_response(pdf.output(dest='S').encode('latin-1'))
-    response.headers['Content-Type'] = 'application/pdf'
-    response.headers['Content-Disposition'] = f'attachment; filename=cv_{candidate_id}_{style}.pdf'
+    try:
+        export_pool.acquire()
+    except ExportBusy:
+        response = jsonify({"error": "An export is already running, retry shortly"})
+        response.headers['Retry-After'] = '30'
+        return response, 429
+
+    batch_size = int(os.environ.get('BULK_EXPORT_BATCH', 100))
+    chunks = export_zip(iter_candidates(batch_size, ids), styles, workers=export_pool.workers,
+                        cache=pdf_cache, executor=export_pool.executor())
+    response = Response(stream_with_context(chunks), mimetype="application/zip", headers={
+        "Content-Disposition": "attachment; filename=cvs.zip",
+        "X-Accel-Buffering": "no"
+    })
+    # The slot is held until the stream is closed, finished or not
+    response.call_on_close(export_pool.release)
     return response
 
 
+@app.route("/api/renders/stats")
+def render_stats_route():
+    return jsonify({
+        "pool": render_pool.stats(),
+        "cache": pdf_cache.stats() if pdf_cache else None,
+        # Inline renders only (PDF_PROFILE=1); pool workers keep their own
+        "sections": section_stats.snapshot() if PROFILE_SECTIONS else None
+    })
+
+
+# Renders queued on other workers can only be polled for in the cache, so
+# a long-poll for one holds this request thread for at most this long
+RENDER_CACHE_POLL_MAX = float(os.environ.get('RENDER_CACHE_POLL_MAX', 2))
+
+
+def _cached_render(render_id, wait=0):
+    """
+    True when a render queued on another worker is done: render ids are
+    cache keys, so its PDF is in the shared cache. Polls up to `wait`
+    seconds (at most RENDER_CACHE_POLL_MAX).
+    """
+    if not pdf_cache or not re.fullmatch(r"[0-9a-f]{64}", render_id):
+        return False
+    deadline = time.monotonic() + min(wait, RENDER_CACHE_POLL_MAX)
+    while not pdf_cache.exists(render_id):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.25)
+    return True
+
+
+@app.route("/api/renders/<render_id>")
+def render_status_route(render_id):
+    """Render status; ?wait=N long-polls up to N seconds (max 30) for it to finish."""
+    try:
+        wait = min(max(float(request.args.get("wait", 0)), 0), 30)
+    except ValueError:
+        wait = 0
+    job = render_pool.wait(render_id, wait) if wait else render_pool.get(render_id)
+    if job is None:
+        if _cached_render(render_id, wait):
+            return jsonify({"render_id": render_id, "status": "done", "download_url": f"/api/renders/{render_id}/pdf"})
+        return jsonify({"error": "Render not found"}), 404
+
+    info = job.to_dict()
+    if job.status == "done":
+        return jsonify({**info, "download_url": f"/api/renders/{job.id}/pdf"})
+    if job.status == "failed":
+        return jsonify(info), 500
+    return jsonify(info), 202
+
+
+@app.route("/api/renders/<render_id>/pdf")
+def render_download_route(render_id):
+    job = render_pool.get(render_id)
+    if job is None:
+        content = pdf_cache.get(render_id) if _cached_render(render_id) else None
+        if content is None:
+            return jsonify({"error": "Render not found"}), 404
+        return _pdf_response(content, render_id, "cv.pdf", "HIT")
+    if job.status != "done":
+        return jsonify(job.to_dict()), 409
+    filename = job.meta.get("filename", "cv.pdf")
+    content = job.content
+    if content is None:
+        # Handed over to the PDF cache when it finished (see _store_render)
+        content = pdf_cache.get(job.key) if pdf_cache else None
+        if content is None:
+            return jsonify({"error": "Render expired, request the PDF again"}), 404
+        return _pdf_response(content, job.key, filename, "HIT")
+    return _pdf_response(content, job.key, filename, "RENDERED")
+
+
 @app.post("/api/generate_summary")
 def generate_summary():
     data = request.get_json(silent=True) or {}
+    if data.get("candidate_id"):
+        # Summary for a stored candidate, from its document
+        document = Candidate.load_document(data["candidate_id"])
+        if document is None:
+            return jsonify({"error": "Candidate not found"}), 404
+        data = {**document, "professional_title": document["candidate"].get("professional_title") or "Profesional"}
     
     title = data.get("professional_title", "Profesional")
     skills = data.get("skills", []) # List of dicts {name, level}
@@ -239,10 +333,201 @@ def generate_summary():
 def search_jobs_route():
     query = request.args.get('q', '')
     location = request.args.get('location', '')
-    jobs = scrape_jobs(query, location)
+    jobs, _ = aggregator.search(query, location, sources=_requested_sources())
     return jsonify(jobs)
 
 
+def _requested_sources():
+    """Optional ?sources=a,b filter; None means every enabled source."""
+    requested = request.args.get('sources', '')
+    return [n.strip() for n in requested.split(',') if n.strip()] or None
+
+
+@app.route("/api/search/stream")
+def search_jobs_stream_route():
+    """
+    NDJSON variant of /api/search. Sources run in parallel and each one's
+    jobs are written as a {"type": "batch"} line as soon as it returns,
+    followed by a final {"type": "summary"} line with per-source counts,
+    timings and errors.
+    """
+    query = request.args.get('q', '')
+    location = request.args.get('location', '')
+    sources = _requested_sources()
+
+    def generate():
+        start = time.perf_counter()
+        summary = {}
+        seen = set()
+        total = 0
+        for name, jobs, info in aggregator.iter_batches(query, location, sources):
+            jobs = dedupe_jobs(jobs, seen)
+            summary[name] = info
+            total += len(jobs)
+            yield json.dumps({"type": "batch", "source": name, "jobs": jobs}) + "\n"
+
+        yield json.dumps({
+            "type": "summary",
+            "total": total,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            "sources": summary
+        }) + "\n"
+
+    return Response(generate(), mimetype="application/x-ndjson", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+
+@app.route("/api/search/stats")
+def search_stats_route():
+    return jsonify({
+        "cache": job_cache.stats(),
+        "computrabajo": computrabajo_fetch_stats.snapshot(),
+        "keywords": keyword_cache.stats()
+    })
+
+
+@app.post("/api/candidates/match")
+def match_candidates_route():
+    """Top-k stored candidates for a job description (reverse of /api/search ranking)."""
+    data = request.get_json(silent=True) or {}
+    description = (data.get("job_description") or "").strip()
+    if not description:
+        return jsonify({"error": "Missing job_description"}), 400
+    try:
+        top_k = min(max(int(data.get("top_k", 10)), 1), 100)
+    except (TypeError, ValueError):
+        return jsonify({"error": "top_k must be an integer"}), 400
+
+    # Every worker keeps its own index: rebuild it when stale, otherwise
+    # index the candidates other workers stored since the last look
+    candidates = Candidate.query.options(
+        selectinload(Candidate.skills),
+        selectinload(Candidate.experiences),
+        selectinload(Candidate.projects)
+    )
+    candidate_index.refresh(
+        lambda: candidates,
+        lambda synced_id: candidates.filter(Candidate.id > synced_id).order_by(Candidate.id)
+    )
+
+    matches = candidate_index.top_k(description, top_k)
+    rows = {c.id: c for c in Candidate.query.filter(Candidate.id.in_([m["candidate_id"] for m in matches]))}
+    results = []
+    for match in matches:
+        candidate = rows.get(match["candidate_id"])
+        if candidate is None:
+            # Deleted since it was indexed
+            candidate_index.remove(match["candidate_id"])
+            continue
+        results.append({
+            **match,
+            "full_name": candidate.full_name,
+            "professional_title": candidate.professional_title,
+        })
+
+    return jsonify({"candidates": results, "indexed": len(candidate_index)})
+
+
+ATS_BATCH_MAX_JOBS = int(os.environ.get('ATS_BATCH_MAX_JOBS', 10000))
+ATS_BATCH_STREAM_THRESHOLD = int(os.environ.get('ATS_BATCH_STREAM_THRESHOLD', 200))
+
+
+def _resolve_audit_jobs(items):
+    """
+    Job descriptions for /api/ats/batch items: plain strings, {"description"}
+    or {"url"} of a stored Job. Returns (descriptions, errors, urls), where
+    descriptions[i] is None for items listed in errors.
+    """
+    urls = [item.get("url") for item in items
+            if isinstance(item, dict) and not item.get("description") and isinstance(item.get("url"), str)]
+    stored = {job.url: job for job in Job.query.filter(Job.url.in_([u for u in urls if u]))} if any(urls) else {}
+
+    descriptions, errors, item_urls = [], {}, []
+    for i, item in enumerate(items):
+        url = item.get("url") if isinstance(item, dict) else None
+        item_urls.append(url)
+        description = item.get("description") if isinstance(item, dict) else item
+        if description and not isinstance(description, str) or url and not isinstance(url, str):
+            descriptions.append(None)
+            errors[i] = "description and url must be strings"
+        elif isinstance(item, str):
+            descriptions.append(item)
+        elif isinstance(item, dict) and item.get("description"):
+            descriptions.append(item["description"])
+        elif url in stored:
+            job = stored[url]
+            # Same fallback as JobScout when a posting has no description
+            descriptions.append(job.description or f"{job.title} {job.company or ''}")
+        else:
+            descriptions.append(None)
+            errors[i] = "job not found" if url else "missing description or url"
+    return descriptions, errors, item_urls
+
+
+@app.post("/api/ats/batch")
+def ats_batch_route():
+    """
+    ATS audit (ResumeArchitect.audit_resume scoring) of one resume against
+    many jobs, scored on the shared process pool. Results keep input order;
+    large batches (or "stream": true) are written as NDJSON lines followed by
+    a {"type": "summary"} line.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+    resume_text = data.get("resume_text") or ""
+    candidate_id = data.get("candidate_id")
+    if not isinstance(resume_text, str):
+        return jsonify({"error": "resume_text must be a string"}), 400
+    if candidate_id is not None and (not isinstance(candidate_id, int) or isinstance(candidate_id, bool)):
+        return jsonify({"error": "candidate_id must be an integer"}), 400
+
+    resume_text = resume_text.strip()
+    if not resume_text and candidate_id:
+        document = Candidate.load_document(candidate_id)
+        if document is None:
+            return jsonify({"error": "Candidate not found"}), 404
+        resume_text = document_text(document)
+    if not resume_text:
+        return jsonify({"error": "Missing resume_text or candidate_id"}), 400
+
+    items = data.get("jobs")
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "jobs must be a non-empty list"}), 400
+    if len(items) > ATS_BATCH_MAX_JOBS:
+        return jsonify({"error": f"At most {ATS_BATCH_MAX_JOBS} jobs per request"}), 400
+
+    descriptions, errors, urls = _resolve_audit_jobs(items)
+    run = ats_pool.run(resume_text, [d for d in descriptions if d is not None])
+
+    def iter_results():
+        scored = iter(run)
+        for i, description in enumerate(descriptions):
+            if description is None:
+                result = {"index": i, "error": errors[i]}
+            else:
+                result = dict(next(scored), index=i)
+            if urls[i]:
+                result["url"] = urls[i]
+            yield result
+
+    if data.get("stream") or len(items) > ATS_BATCH_STREAM_THRESHOLD:
+        def generate():
+            for result in iter_results():
+                yield json.dumps({"type": "result", **result}) + "\n"
+            yield json.dumps({"type": "summary", **run.stats()}) + "\n"
+
+        return Response(generate(), mimetype="application/x-ndjson", headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        })
+
+    results = list(iter_results())
+    return jsonify({"results": results, **run.stats()})
+
+
 @app.post("/api/apply")
 def apply_job():
     data = request.get_json(silent=True) or {}
@@ -0,0 +1,62 @@
+"""
+Benchmark: rank N synthetic job descriptions against one profile,
+per-job calculated_ats_score loop vs the batch scorer, each with a cold
+and a warm keyword cache (skills/keyword_cache.py).
+
+    python benchmarks/bench_ats_batch.py [--jobs 5000] [--top-k 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skills.content_analysis import ContentAnalysisSkill
+from skills.keyword_cache import keyword_cache
+import skills.ats_batch  # noqa: F401  (keep the numpy import out of the timings)
+
+VOCAB = [f"skill{i}" for i in range(3000)] + ["python", "django", "flask", "docker", "aws", "react", "postgres"]
+PROFILE = "Backend Developer Python Django Flask Docker AWS Postgres REST APIs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    jobs = [" ".join(rng.choice(VOCAB) for _ in range(args.words)) for _ in range(args.jobs)]
+
+    keyword_cache.max_entries = args.jobs + 1
+    keyword_cache.max_bytes = 1 << 40
+
+    def loop():
+        return sorted(
+            ((ContentAnalysisSkill.calculated_ats_score(PROFILE, job)["score"], i) for i, job in enumerate(jobs)),
+            key=lambda x: x[0], reverse=True
+        )[:args.top_k]
+
+    def batch():
+        return ContentAnalysisSkill.batch_ats_scores(PROFILE, jobs, top_k=args.top_k)
+
+    print(f"{args.jobs} jobs x {args.words} words, top {args.top_k}")
+    baseline = None
+    for label, fn in (("per-job loop", loop), ("batch scorer", batch)):
+        keyword_cache.clear()
+        for cache_state in ("cold", "warm"):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            scores = [r[0] if isinstance(r, tuple) else r["score"] for r in result]
+            if baseline is None:
+                baseline, baseline_s = scores, elapsed
+            assert scores == baseline
+            print(f"  {label} ({cache_state}) : {elapsed * 1000:8.1f} ms  ({baseline_s / elapsed:.1f}x)")
+    print(f"  cache: {keyword_cache.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for Computrabajo listing parsing over the saved fixture pages.
+
+Compares the original full-tree parser (every field walks its whole
+select_one fallback chain) with scrapers.computrabajo.parse_listing
+(offer-container subtree only, layout detected once per page).
+
+    python benchmarks/bench_computrabajo_parse.py [--iterations N] [--parser lxml]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from scrapers.computrabajo import parse_listing, BASE_URL
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def legacy_parse_listing(content, base_url, location="", parser="html.parser"):
+    """The parser as it was before the restricted-tree rewrite."""
+    results = []
+    soup = BeautifulSoup(content, parser)
+    articles = soup.select('article.box_offer') or soup.select('div.bClick')
+    for article in articles:
+        title_elem = article.select_one('h1 a.js-o-link') or \
+                     article.select_one('h2 a.js-o-link') or \
+                     article.select_one('a.js-o-link')
+        if not title_elem: continue
+        link = title_elem.get('href', '')
+        if link and link.startswith("/"):
+            link = base_url + link
+        company_elem = article.select_one('p.fs16.fc_base.mt5 a') or \
+                       article.select_one('a.empr') or \
+                       article.select_one('p.fs16 span')
+        loc_elem = article.select_one('p.fs16 span.fc_base') or \
+                   article.select_one('span[itemprop="addressLocality"]')
+        desc_elem = article.select_one('p.fs13.fc_aux') or \
+                    article.select_one('div.fs13')
+        date_elem = article.select_one('span.fc_aux')
+        results.append({
+            'title': title_elem.text.strip(),
+            'company': company_elem.text.strip() if company_elem else "Confidencial",
+            'location': loc_elem.text.strip() if loc_elem else location,
+            'url': link,
+            'description': desc_elem.text.strip() if desc_elem else "",
+            'date_posted': date_elem.text.strip() if date_elem else "",
+            'source': 'Computrabajo',
+            'logo': ''
+        })
+    return results
+
+
+def measure(fn, content, iterations, parser):
+    with contextlib.redirect_stdout(io.StringIO()):
+        articles = len(fn(content, BASE_URL, parser=parser))
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn(content, BASE_URL, parser=parser)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        fn(content, BASE_URL, parser=parser)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return articles * iterations / elapsed, peak / 1024, articles
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--iterations", type=int, default=50)
+    arg_parser.add_argument("--parser", default="html.parser")
+    args = arg_parser.parse_args()
+
+    print(f"Parser backend: {args.parser}")
+    print(f"{'fixture':<34} {'impl':<10} {'articles':>8} {'articles/s':>12} {'peak KiB':>10}")
+    for path in sorted(FIXTURES.glob("computrabajo_*.html")):
+        content = path.read_text(encoding="utf-8")
+        for name, fn in [("legacy", legacy_parse_listing), ("strained", parse_listing)]:
+            rate, peak, articles = measure(fn, content, args.iterations, args.parser)
+            print(f"{path.stem:<34} {name:<10} {articles:>8} {rate:>12.0f} {peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: concurrent /api/submit writers (plus document readers) against
+one SQLite file, for each engine profile (db_profiles.py). Every writer and
+reader is its own process with its own engine, like gunicorn workers.
+
+    python benchmarks/bench_db_concurrency.py [--writers 4] [--readers 2] [--seconds 5]
+    python benchmarks/bench_db_concurrency.py --profiles default,sqlite,sqlite-ephemeral
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+
+from candidate_store import insert_candidate, parse_submission
+from db_profiles import build_profile
+from models import db, Candidate
+
+PROFILE = {
+    "full_name": "Bench Candidate", "email": "bench@example.com", "professional_title": "Backend Developer",
+    "summary": "Python developer " * 20,
+    "experiences": [{"company": f"Company {i}", "role": "Engineer", "description": "Built APIs " * 30} for i in range(4)],
+    "skills": [{"name": f"Skill {i}", "level": "Advanced"} for i in range(15)],
+    "projects": [{"name": f"Project {i}", "technologies": "Flask"} for i in range(4)],
+}
+
+
+def make_app(url, profile_name):
+    profile = build_profile(profile_name)
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = profile.options
+    db.init_app(app)
+    with app.app_context():
+        profile.install(db.engine)
+    return app
+
+
+def run_worker(task):
+    url, profile_name, role, seconds, seed, candidate_ids = task
+    app = make_app(url, profile_name)
+    rng = random.Random(seed)
+    ops, errors, latencies = 0, 0, []
+    with app.app_context():
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                if role == "writer":
+                    insert_candidate(*parse_submission(PROFILE))
+                    db.session.commit()
+                else:
+                    Candidate.load_document(rng.choice(candidate_ids))
+                    db.session.rollback()
+                ops += 1
+                latencies.append(time.perf_counter() - start)
+            except OperationalError:
+                # "database is locked" once busy_timeout runs out
+                db.session.rollback()
+                errors += 1
+        db.engine.dispose()
+    return role, ops, errors, latencies
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+def bench(profile_name, args):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    url = f"sqlite:///{path}"
+    try:
+        app = make_app(url, profile_name)
+        with app.app_context():
+            db.create_all()
+            seeded = []
+            for _ in range(100):
+                seeded.append(insert_candidate(*parse_submission(PROFILE))[0])
+            db.session.commit()
+            db.engine.dispose()
+
+        tasks = [(url, profile_name, "writer", args.seconds, i, seeded) for i in range(args.writers)]
+        tasks += [(url, profile_name, "reader", args.seconds, 1000 + i, seeded) for i in range(args.readers)]
+        with multiprocessing.get_context("spawn").Pool(len(tasks)) as pool:
+            results = pool.map(run_worker, tasks)
+    finally:
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+    summary = {}
+    for role in ("writer", "reader"):
+        rows = [r for r in results if r[0] == role]
+        latencies = [t for r in rows for t in r[3]]
+        summary[role] = {
+            "per_s": sum(r[1] for r in rows) / args.seconds,
+            "errors": sum(r[2] for r in rows),
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", default="default,sqlite")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers + {args.readers} readers, {args.seconds:g}s per profile")
+    print(f"{'profile':<17} {'submits/s':>10} {'p99 ms':>8} {'errors':>7} {'reads/s':>9} {'p99 ms':>8}")
+    baseline = None
+    for name in args.profiles.split(","):
+        r = bench(name, args)
+        baseline = baseline or r["writer"]["per_s"] or 1
+        print(f"{name:<17} {r['writer']['per_s']:>10.1f} {r['writer']['p99_ms']:>8.1f} {r['writer']['errors']:>7}"
+              f" {r['reader']['per_s']:>9.1f} {r['reader']['p99_ms']:>8.1f}"
+              f"  ({r['writer']['per_s'] / baseline:.1f}x writes)")
+
+
+if __name__ == "__main__":
+    main()
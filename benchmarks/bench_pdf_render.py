@@ -0,0 +1,126 @@
+"""
+Benchmark: render synthetic candidates of growing size with every template
+and report throughput, pages, output size and peak Python memory per render.
+
+    python benchmarks/bench_pdf_render.py [--sizes 1,5,10,25,50] [--repeat 5] [--sections]
+    python benchmarks/bench_pdf_render.py --save results.json
+    python benchmarks/bench_pdf_render.py --baseline results.json [--tolerance 0.25]
+
+With --baseline the run fails (exit 1) when any template/size is slower than
+the saved mean by more than the tolerance.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_profiling import SectionProfiler
+from pdf_templates import TEMPLATES, render_pdf
+
+WORDS = ("designed implemented scalable services python django postgres docker kubernetes team "
+         "delivered migrated latency reduced pipeline customers platform api features reliability").split()
+
+
+def sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def synthetic_candidate(experiences, seed=0):
+    rng = random.Random(seed)
+    return {
+        "candidate": {
+            "full_name": "Benchmark Candidate", "professional_title": "Senior Software Engineer",
+            "email": "bench@example.com", "phone": "+56 9 1234 5678", "location": "Santiago",
+            "linkedin": "https://linkedin.com/in/bench", "github": "https://github.com/bench",
+            "portfolio": "https://bench.dev", "summary": sentence(rng, 60),
+        },
+        "experiences": [
+            {"company": f"Company {i}", "role": "Engineer", "location": "Remote", "start_date": "2015",
+             "end_date": "2020", "description": sentence(rng, 80)}
+            for i in range(experiences)
+        ],
+        "educations": [
+            {"institution": f"University {i}", "degree": "BSc", "field": "Computer Science",
+             "start_date": "2008", "end_date": "2012", "description": sentence(rng, 20)}
+            for i in range(3)
+        ],
+        "skills": [{"name": w.capitalize(), "level": "Advanced"} for w in WORDS[:15]],
+        "languages": [{"name": "Spanish", "level": "Native"}, {"name": "English", "level": "C1"}],
+        "certifications": [{"name": "AWS SA", "issuer": "Amazon", "date": "2021", "url": ""}] * 2,
+        "projects": [
+            {"name": f"Project {i}", "role": "Lead", "description": sentence(rng, 40),
+             "url": "https://example.com", "technologies": "Python, Docker"}
+            for i in range(4)
+        ],
+        "links": [],
+    }
+
+
+def measure(data, style, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        content = render_pdf(data, style)
+    mean = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    render_pdf(data, style)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    profiler = SectionProfiler()
+    render_pdf(data, style, profiler=profiler)
+    pages = sum(entry["pages"] for entry in profiler.sections.values()) + 1
+    return {"ms": mean * 1000, "per_s": 1 / mean, "pages": pages, "kb": len(content) / 1024,
+            "peak_kb": peak / 1024, "sections": profiler.report()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,5,10,25,50", help="experiences per candidate")
+    parser.add_argument("--templates", default=",".join(TEMPLATES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sections", action="store_true", help="print the per-section breakdown")
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a saved JSON run")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    templates = args.templates.split(",")
+    results = {}
+
+    print(f"{'template':<9} {'exp':>4} {'ms':>8} {'renders/s':>10} {'pages':>6} {'KiB':>7} {'peak KiB':>9}")
+    for style in templates:
+        for size in sizes:
+            r = measure(synthetic_candidate(size), style, args.repeat)
+            results[f"{style}/{size}"] = r
+            print(f"{style:<9} {size:>4} {r['ms']:>8.1f} {r['per_s']:>10.1f} {r['pages']:>6} {r['kb']:>7.1f} {r['peak_kb']:>9.0f}")
+            if args.sections:
+                print("          " + ", ".join(f"{name} {s['ms']:.1f}ms/{s['pages']}p" for name, s in r["sections"].items()))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = [
+            f"{key}: {results[key]['ms']:.1f}ms vs {old['ms']:.1f}ms"
+            for key, old in baseline.items()
+            if key in results and results[key]["ms"] > old["ms"] * (1 + args.tolerance)
+        ]
+        if regressions:
+            print("Regressions:\n  " + "\n  ".join(regressions))
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
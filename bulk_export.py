@@ -0,0 +1,225 @@
+"""
+Bulk CV export: every stored candidate (or a selection) in one or more
+styles, rendered in parallel and written as a ZIP stream.
+
+    python bulk_export.py --out cvs.zip [--styles classic,modern|all] [--ids 1,2,3]
+"""
+import argparse
+import os
+import sys
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from sqlalchemy.orm import selectinload
+
+from models import db, Candidate
+from pdf_cache import pdf_cache_key
+from pdf_templates import TEMPLATES, render_pdf
+
+
+def parse_styles(value):
+    """'all' or a comma-separated list of template names; raises ValueError on unknown ones."""
+    if not value or value == "all":
+        return list(TEMPLATES)
+    styles = [s.strip() for s in value.split(",") if s.strip()]
+    unknown = [s for s in styles if s not in TEMPLATES]
+    if unknown:
+        raise ValueError(f"Unknown styles: {', '.join(unknown)}")
+    return styles
+
+
+def iter_candidates(batch_size=100, candidate_ids=None):
+    """
+    Yields (candidate_id, template_data) in id order, loading `batch_size`
+    candidates (and their CV sections, via selectinload) per query. The
+    session is cleared after each batch so memory does not grow with the
+    number of candidates. Needs an app context.
+    """
+    last_id = 0
+    options = [selectinload(getattr(Candidate, section)) for section in Candidate.CV_SECTIONS]
+    while True:
+        query = Candidate.query.options(*options).filter(Candidate.id > last_id)
+        if candidate_ids:
+            query = query.filter(Candidate.id.in_(candidate_ids))
+        batch = query.order_by(Candidate.id).limit(batch_size).all()
+        if not batch:
+            return
+        rows = [(candidate.id, candidate.template_data()) for candidate in batch]
+        last_id = batch[-1].id
+        db.session.expunge_all()
+        yield from rows
+
+
+class _ZipSink:
+    """Write-only, non-seekable target for ZipFile; drain() hands back what was written so far."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ExportBusy(Exception):
+    """Raised by ExportPool.acquire when max_exports exports are already streaming."""
+
+
+class ExportPool:
+    """
+    Render processes shared by every export this worker streams, started on
+    first use instead of once per request. Each export keeps up to
+    workers * 2 renders in flight, so at most `max_exports` may run at once;
+    acquire() raises ExportBusy beyond that so the web layer can answer 429.
+    """
+
+    def __init__(self, workers=None, max_exports=1):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_exports = max_exports
+        self._slots = threading.BoundedSemaphore(max_exports)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def acquire(self):
+        if not self._slots.acquire(blocking=False):
+            raise ExportBusy(f"{self.max_exports} exports already running")
+
+    def release(self):
+        self._slots.release()
+
+    def executor(self):
+        """The shared ProcessPoolExecutor, or None when exports render inline (1 worker)."""
+        if self.workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def export_pool_from_env():
+    """BULK_EXPORT_WORKERS (one per core) and BULK_EXPORT_CONCURRENCY (1 export at a time)."""
+    return ExportPool(
+        workers=int(os.environ.get('BULK_EXPORT_WORKERS', 0)) or None,
+        max_exports=int(os.environ.get('BULK_EXPORT_CONCURRENCY', 1)),
+    )
+
+
+def export_zip(candidates, styles, workers=None, cache=None, max_in_flight=None, executor=None):
+    """
+    Generator of ZIP bytes for `candidates` ((candidate_id, template_data)
+    pairs) in every style. Renders run on `executor` when one is given
+    (e.g. ExportPool.executor(), left running afterwards), otherwise on a
+    process pool of its own (`workers`, default one per core; 1 renders
+    inline). At most `max_in_flight` are outstanding, and each PDF is written
+    to the stream as soon as it is done, so memory stays flat however many
+    candidates there are. Cached renders are reused and new ones stored when
+    a PDFCache is given. Failed renders are listed in errors.txt at the end
+    of the archive.
+    """
+    workers = workers or int(os.environ.get('BULK_EXPORT_WORKERS', 0)) or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    sink = _ZipSink()
+    errors = []
+    owned = executor is None
+    if owned:
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    else:
+        pool = executor
+    pending = {}
+
+    def write(name, key, content):
+        if cache and key:
+            cache.set(key, content)
+        zf.writestr(name, content)
+        return sink.drain()
+
+    def collect(block):
+        if block:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        else:
+            done = [future for future in pending if future.done()]
+        for future in done:
+            name, key = pending.pop(future)
+            try:
+                yield write(name, key, future.result())
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+
+    try:
+        # PDFs are already compressed, so entries are stored as-is
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zf:
+            for candidate_id, data in candidates:
+                for style in styles:
+                    name = f"cv_{candidate_id}_{style}.pdf"
+                    key = pdf_cache_key(data, style)
+                    content = cache.get(key) if cache else None
+                    if content is not None:
+                        yield write(name, None, content)
+                    elif pool is None:
+                        try:
+                            content = render_pdf(data, style)
+                        except Exception as e:
+                            errors.append(f"{name}: {e}")
+                            continue
+                        yield write(name, key, content)
+                    else:
+                        pending[pool.submit(render_pdf, data, style)] = (name, key)
+                        yield from collect(block=len(pending) >= max_in_flight)
+
+            while pending:
+                yield from collect(block=True)
+            if errors:
+                zf.writestr("errors.txt", "\n".join(errors) + "\n")
+        yield sink.drain()
+    finally:
+        if owned and pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        elif not owned:
+            # Shared pool: only drop this export's queued renders (client went away)
+            for future in pending:
+                future.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="ZIP file to write")
+    parser.add_argument("--styles", default="all", help="comma-separated styles or 'all'")
+    parser.add_argument("--ids", default="", help="comma-separated candidate ids (default: all)")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        styles = parse_styles(args.styles)
+    except ValueError as e:
+        parser.error(str(e))
+    ids = [int(i) for i in args.ids.split(",") if i.strip()] or None
+
+    from app import app, pdf_cache
+
+    with app.app_context(), open(args.out, "wb") as out:
+        written = 0
+        for chunk in export_zip(iter_candidates(args.batch_size, ids), styles, args.workers, cache=pdf_cache):
+            out.write(chunk)
+            written += len(chunk)
+    print(f"[BulkExport] Wrote {written / 1024:.0f} KiB to {args.out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Write path of /api/submit: a submitted profile is inserted with one
+statement per table (multi-row INSERT ... RETURNING for the CV sections,
+where the backend can keep ids in row order) instead of one ORM object per row.
+"""
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from models import (
+    db, Candidate, CandidateDocument, Experience, Education, Skill, Language,
+    Certification, Project, Link
+)
+
+CANDIDATE_FIELDS = ("full_name", "professional_title", "location", "phone", "email",
+                    "linkedin", "portfolio", "github", "summary")
+
+# section -> (model, submitted fields, row is kept if any of these is non-empty)
+SUBMIT_SECTIONS = {
+    "experiences": (Experience, ("company", "role", "location", "start_date", "end_date", "description"),
+                    ("company", "role")),
+    "educations": (Education, ("institution", "degree", "field", "start_date", "end_date", "description"),
+                   ("institution", "degree")),
+    "skills": (Skill, ("name", "level"), ("name",)),
+    "languages": (Language, ("name", "level"), ("name",)),
+    "certifications": (Certification, ("name", "issuer", "date", "url"), ("name",)),
+    "projects": (Project, ("name", "role", "description", "url", "technologies"), ("name",)),
+    "links": (Link, ("label", "url"), ("url",)),
+}
+
+
+def _clean(item, fields):
+    return {field: (item.get(field) or "").strip() for field in fields}
+
+
+def parse_submission(data):
+    """
+    Splits a /api/submit payload into (candidate values, {section: [row
+    values]}), with every string stripped and empty rows dropped.
+    """
+    candidate = _clean(data, CANDIDATE_FIELDS)
+    candidate["created_at"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    sections = {}
+    for section, (_, fields, required) in SUBMIT_SECTIONS.items():
+        rows = []
+        for item in data.get(section) or []:
+            if not isinstance(item, dict):
+                continue
+            row = _clean(item, fields)
+            if any(row[field] for field in required):
+                rows.append(row)
+        sections[section] = rows
+    return candidate, sections
+
+
+def _as_dict(model, values):
+    """What model(**values).to_dict() would return once inserted."""
+    return {column.name: values.get(column.name) for column in model.__table__.columns}
+
+
+def insert_candidate(candidate, sections):
+    """
+    Inserts a parsed submission and its CandidateDocument in the current
+    transaction (the caller commits): one INSERT for the candidate, one
+    executemany INSERT ... RETURNING per non-empty section (a single
+    multi-row statement on Postgres) and one for the document.
+    Returns (candidate_id, template data).
+    """
+    candidate_id = db.session.execute(insert(Candidate).values(**candidate)).inserted_primary_key[0]
+    document = {"candidate": _as_dict(Candidate, {**candidate, "id": candidate_id})}
+
+    for section in Candidate.CV_SECTIONS:
+        model = SUBMIT_SECTIONS[section][0]
+        rows = [dict(row, candidate_id=candidate_id) for row in sections.get(section, ())]
+        if rows:
+            # RETURNING order is unspecified, and concurrent inserts need not
+            # get ids in VALUES order, so ask for them in parameter order.
+            # Postgres still sends one multi-row INSERT; SQLite falls back to
+            # one statement per row (cheap there: no round trips).
+            result = db.session.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+            for row, row_id in zip(rows, result.scalars()):
+                row["id"] = row_id
+        document[section] = [_as_dict(model, row) for row in rows]
+
+    db.session.execute(insert(CandidateDocument).values(**CandidateDocument.values_for(candidate_id, document)))
+    return candidate_id, document
@@ -0,0 +1,92 @@
+"""
+Named SQLAlchemy engine profiles, picked from the environment:
+
+    sqlite              local file (data/cv.db): WAL, synchronous=NORMAL,
+                        busy_timeout and mmap so concurrent writers wait
+                        instead of failing with "database is locked"
+    sqlite-ephemeral    /tmp/cv.db on Vercel: as above, synchronous=OFF
+                        (the file does not outlive the instance anyway)
+    postgres            long-running server: bounded pool with pre-ping,
+                        recycle and LIFO reuse
+    postgres-serverless Postgres from Vercel: NullPool, so a frozen or
+                        recycled instance never holds pooled connections
+    default             SQLAlchemy's defaults, nothing applied
+
+DB_ENGINE_PROFILE forces a profile; tuning knobs are SQLITE_BUSY_TIMEOUT_MS,
+SQLITE_SYNCHRONOUS, SQLITE_MMAP_MB, DB_POOL_SIZE, DB_MAX_OVERFLOW,
+DB_POOL_RECYCLE and DB_POOL_TIMEOUT.
+"""
+import os
+
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+
+class EngineProfile:
+    """Engine options (SQLALCHEMY_ENGINE_OPTIONS) plus PRAGMAs run on every new SQLite connection."""
+
+    def __init__(self, name, options=None, pragmas=None):
+        self.name = name
+        self.options = options or {}
+        self.pragmas = pragmas or {}
+
+    def install(self, engine):
+        if self.pragmas:
+            event.listen(engine, "connect", self._apply_pragmas)
+
+    def _apply_pragmas(self, dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        for name, value in self.pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def _sqlite_pragmas(synchronous):
+    return {
+        "journal_mode": "WAL",
+        "synchronous": os.environ.get('SQLITE_SYNCHRONOUS', synchronous),
+        "busy_timeout": int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        "mmap_size": int(float(os.environ.get('SQLITE_MMAP_MB', 64)) * 1024 * 1024),
+    }
+
+
+def _postgres_pool():
+    return {
+        "pool_size": int(os.environ.get('DB_POOL_SIZE', 5)),
+        "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        "pool_timeout": int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        "pool_recycle": int(os.environ.get('DB_POOL_RECYCLE', 300)),
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
+
+
+def build_profile(name):
+    if name == "sqlite":
+        return EngineProfile(name, pragmas=_sqlite_pragmas("NORMAL"))
+    if name == "sqlite-ephemeral":
+        return EngineProfile(name, pragmas=_sqlite_pragmas("OFF"))
+    if name == "postgres":
+        return EngineProfile(name, options=_postgres_pool())
+    if name == "postgres-serverless":
+        return EngineProfile(name, options={"poolclass": NullPool})
+    if name == "default":
+        return EngineProfile(name)
+    raise ValueError(f"Unknown DB_ENGINE_PROFILE: {name}")
+
+
+def profile_name(database_url):
+    """DB_ENGINE_PROFILE, or the profile matching the URL and platform (Vercel or not)."""
+    explicit = os.environ.get('DB_ENGINE_PROFILE')
+    if explicit:
+        return explicit
+    serverless = bool(os.environ.get('VERCEL'))
+    if database_url.startswith("sqlite"):
+        return "sqlite-ephemeral" if serverless else "sqlite"
+    if database_url.startswith("postgresql"):
+        return "postgres-serverless" if serverless else "postgres"
+    return "default"
+
+
+def engine_profile(database_url):
+    return build_profile(profile_name(database_url))
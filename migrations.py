@@ -0,0 +1,90 @@
+"""
+Versioned schema changes for databases created before a change was made:
+db.create_all() only creates missing tables, never alters existing ones.
+Applied versions are recorded in schema_migrations; every statement is
+plain SQL valid on both SQLite and Postgres and idempotent (IF NOT EXISTS),
+so a migration that races with another worker or with create_all() is harmless.
+
+    python migrations.py [--status]
+"""
+import argparse
+import sys
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+# (version, name, statements), in order. Index names match the ones
+# SQLAlchemy gives the index=True columns in models.py, so fresh databases
+# (where create_all already made them) skip them.
+MIGRATIONS = [
+    (1, "foreign key and lookup indexes", [
+        "CREATE INDEX IF NOT EXISTS ix_experiences_candidate_id ON experiences (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_educations_candidate_id ON educations (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_skills_candidate_id ON skills (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_skills_name ON skills (name)",
+        "CREATE INDEX IF NOT EXISTS ix_languages_candidate_id ON languages (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_certifications_candidate_id ON certifications (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_projects_candidate_id ON projects (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_links_candidate_id ON links (candidate_id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_candidate_id_job_id ON applications (candidate_id, job_id)",
+        "CREATE INDEX IF NOT EXISTS ix_applications_job_id ON applications (job_id)",
+    ]),
+]
+
+CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  version INTEGER PRIMARY KEY,
+  name TEXT NOT NULL,
+  applied_at TEXT NOT NULL
+)
+"""
+
+
+def applied_versions(engine):
+    with engine.begin() as conn:
+        conn.execute(text(CREATE_VERSION_TABLE))
+        return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def migrate(engine, migrations=MIGRATIONS):
+    """Applies pending migrations, each in its own transaction; returns the versions applied."""
+    done = applied_versions(engine)
+    applied = []
+    for version, name, statements in migrations:
+        if version in done:
+            continue
+        try:
+            with engine.begin() as conn:
+                for statement in statements:
+                    conn.execute(text(statement))
+                conn.execute(
+                    text("INSERT INTO schema_migrations (version, name, applied_at) VALUES (:v, :n, :t)"),
+                    {"v": version, "n": name, "t": datetime.utcnow().isoformat(timespec="seconds") + "Z"},
+                )
+        except IntegrityError:
+            # Another worker recorded it first
+            continue
+        print(f"[Migrations] Applied {version}: {name}")
+        applied.append(version)
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--status", action="store_true", help="list migrations without applying them")
+    args = parser.parse_args()
+
+    from app import app
+    from models import db
+
+    with app.app_context():
+        if not args.status:
+            migrate(db.engine)
+        done = applied_versions(db.engine)
+        for version, name, _ in MIGRATIONS:
+            print(f"{version:>4} {'applied' if version in done else 'pending':<8} {name}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
 
+import json
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 
 db = SQLAlchemy()
@@ -32,11 +35,86 @@ class Candidate(BaseModel):
     projects = db.relationship('Project', backref='candidate', cascade='all, delete-orphan')
     links = db.relationship('Link', backref='candidate', cascade='all, delete-orphan')
     applications = db.relationship('Application', backref='candidate', cascade='all, delete-orphan')
+    document = db.relationship('CandidateDocument', uselist=False, cascade='all, delete-orphan')
+
+    # Relationships rendered into the CV (see template_data)
+    CV_SECTIONS = ('experiences', 'educations', 'skills', 'languages', 'certifications', 'projects', 'links')
+
+    def template_data(self):
+        """Dictionary structure expected by pdf_templates."""
+        data = {"candidate": self.to_dict()}
+        for section in self.CV_SECTIONS:
+            data[section] = [x.to_dict() for x in getattr(self, section)]
+        return data
+
+    def refresh_document(self):
+        """
+        Rewrites this candidate's CandidateDocument from template_data() and
+        returns the data. Call it in the transaction that changed the
+        candidate (after a flush, so new rows have ids).
+        """
+        data = self.template_data()
+        values = CandidateDocument.values_for(self.id, data)
+        if self.document is None:
+            self.document = CandidateDocument(**values)
+        else:
+            for name, value in values.items():
+                setattr(self.document, name, value)
+        return data
+
+    @classmethod
+    def load_document(cls, candidate_id):
+        """
+        template_data() of a candidate, read from its CandidateDocument with one
+        primary-key lookup. When the document is missing or from an older
+        DOCUMENT_VERSION the rows are loaded eagerly (selectinload) instead and
+        the document is written back. None if there is no such candidate.
+        """
+        document = db.session.get(CandidateDocument, candidate_id)
+        if document is not None and document.version == DOCUMENT_VERSION:
+            return json.loads(document.data)
+
+        candidate = cls.query.options(
+            *[selectinload(getattr(cls, section)) for section in cls.CV_SECTIONS]
+        ).filter_by(id=candidate_id).first()
+        if candidate is None:
+            return None
+        data = candidate.refresh_document()
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[Models] Could not store document for candidate {candidate_id}: {e}")
+        return data
+
+
+# Bump when the shape of Candidate.template_data() changes: older documents
+# are then rebuilt from the rows on their next read.
+DOCUMENT_VERSION = 1
+
+
+class CandidateDocument(BaseModel):
+    """Denormalized Candidate.template_data() (JSON), one row per candidate."""
+    __tablename__ = 'candidate_documents'
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False)
+    data = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.String)
+
+    @staticmethod
+    def values_for(candidate_id, data):
+        """Column values of the document holding `data` (template_data() of the candidate)."""
+        return {
+            "candidate_id": candidate_id,
+            "version": DOCUMENT_VERSION,
+            "data": json.dumps(data, default=str, separators=(',', ':')),
+            "updated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        }
 
 class Experience(BaseModel):
     __tablename__ = 'experiences'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     company = db.Column(db.String)
     role = db.Column(db.String)
     location = db.Column(db.String)
@@ -47,7 +125,7 @@ class Experience(BaseModel):
 class Education(BaseModel):
     __tablename__ = 'educations'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     institution = db.Column(db.String)
     degree = db.Column(db.String)
     field = db.Column(db.String)
@@ -58,21 +136,21 @@ class Education(BaseModel):
 class Skill(BaseModel):
     __tablename__ = 'skills'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
-    name = db.Column(db.String)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
+    name = db.Column(db.String, index=True)
     level = db.Column(db.String)
 
 class Language(BaseModel):
     __tablename__ = 'languages'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     name = db.Column(db.String)
     level = db.Column(db.String)
 
 class Certification(BaseModel):
     __tablename__ = 'certifications'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     name = db.Column(db.String)
     issuer = db.Column(db.String)
     date = db.Column(db.String)
@@ -81,7 +159,7 @@ class Certification(BaseModel):
 class Project(BaseModel):
     __tablename__ = 'projects'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     name = db.Column(db.String)
     role = db.Column(db.String)
     description = db.Column(db.Text)
@@ -91,7 +169,7 @@ class Project(BaseModel):
 class Link(BaseModel):
     __tablename__ = 'links'
     id = db.Column(db.Integer, primary_key=True)
-    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False, index=True)
     label = db.Column(db.String)
     url = db.Column(db.String)
 
@@ -112,9 +190,11 @@ class Job(BaseModel):
 
 class Application(BaseModel):
     __tablename__ = 'applications'
+    # Also serves lookups by candidate_id alone (see migrations.py)
+    __table_args__ = (db.Index('ix_applications_candidate_id_job_id', 'candidate_id', 'job_id'),)
     id = db.Column(db.Integer, primary_key=True)
     candidate_id = db.Column(db.Integer, db.ForeignKey('candidates.id'), nullable=False)
-    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False, index=True)
     status = db.Column(db.String, default='Applied')
     tailored_cv_path = db.Column(db.String)
     date_applied = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from pdf_templates import TEMPLATE_VERSION, TEMPLATES
+
+
+def pdf_cache_key(data, style):
+    """
+    Stable content hash of what a render depends on: the template data
+    (canonical JSON), the style and TEMPLATE_VERSION. Also used as ETag.
+    """
+    style = style if style in TEMPLATES else "classic"
+    payload = json.dumps([TEMPLATE_VERSION, style, data], sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PDFCache:
+    """
+    Content-addressed cache of rendered PDFs: one `<key>.pdf` file per render
+    in `path`. Reads bump the file's mtime, and once the directory exceeds
+    `max_bytes` the least recently used files are deleted. Files are written
+    atomically, so several workers can share the directory.
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._bytes = sum(f.stat().st_size for f in self.path.glob("*.pdf"))
+
+    def _file(self, key):
+        return self.path / f"{key}.pdf"
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def get(self, key):
+        file = self._file(key)
+        try:
+            content = file.read_bytes()
+            os.utime(file)
+        except OSError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return content
+
+    def exists(self, key):
+        return self._file(key).exists()
+
+    def set(self, key, content):
+        if len(content) > self.max_bytes:
+            return
+        file = self._file(key)
+        tmp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(content)
+        previous = file.stat().st_size if file.exists() else 0
+        os.replace(tmp, file)
+        with self._lock:
+            self._bytes += len(content) - previous
+            over = self._bytes > self.max_bytes
+        if over:
+            self._evict()
+
+    def _evict(self):
+        files = []
+        for file in self.path.glob("*.pdf"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        for _, size, file in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                file.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        with self._lock:
+            # Resync with the directory, which other workers may also write to
+            self._bytes = total
+            self._stats["evictions"] += evicted
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        for file in self.path.glob("*.pdf"):
+            file.unlink(missing_ok=True)
+        with self._lock:
+            self._bytes = 0
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+def pdf_cache_from_env(base_dir):
+    """
+    PDF_CACHE_DIR (default <base_dir>/data/pdf_cache, /tmp/pdf_cache on Vercel)
+    and PDF_CACHE_MAX_MB (default 64; 0 disables the cache).
+    """
+    max_mb = float(os.environ.get('PDF_CACHE_MAX_MB', 64))
+    if max_mb <= 0:
+        return None
+    default_dir = Path("/tmp/pdf_cache") if os.environ.get('VERCEL') else Path(base_dir) / "data" / "pdf_cache"
+    return PDFCache(os.environ.get('PDF_CACHE_DIR') or default_dir, max_bytes=int(max_mb * 1024 * 1024))
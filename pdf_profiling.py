@@ -0,0 +1,79 @@
+import os
+import threading
+import time
+
+# PDF_PROFILE=1 records per-section timings of every render_pdf() call into section_stats
+PROFILE_SECTIONS = os.environ.get('PDF_PROFILE', '0') == '1'
+
+
+class SectionProfiler:
+    """
+    Collects wall time and pages spanned per section of one render.
+    BasePDF.mark_section() calls mark(name, page) when a section starts;
+    the previous section ends there (mark(None, page) just ends it).
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.sections = {}
+        self._current = None
+
+    def mark(self, name, page):
+        now = self.clock()
+        if self._current is not None:
+            current, started, start_page = self._current
+            entry = self.sections.setdefault(current, {"seconds": 0.0, "pages": 0})
+            entry["seconds"] += now - started
+            entry["pages"] += page - start_page
+        self._current = (name, now, page) if name is not None else None
+
+    def total_seconds(self):
+        return sum(entry["seconds"] for entry in self.sections.values())
+
+    def report(self):
+        """{section: {"ms", "pages"}} in the order the sections were drawn."""
+        return {
+            name: {"ms": round(entry["seconds"] * 1000, 3), "pages": entry["pages"]}
+            for name, entry in self.sections.items()
+        }
+
+
+class SectionStats:
+    """Per-template, per-section aggregate of many SectionProfiler runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def record(self, template, profiler):
+        with self._lock:
+            sections = self._data.setdefault(template, {})
+            for name, entry in profiler.sections.items():
+                agg = sections.setdefault(name, {"renders": 0, "seconds": 0.0, "max_seconds": 0.0, "pages": 0})
+                agg["renders"] += 1
+                agg["seconds"] += entry["seconds"]
+                agg["max_seconds"] = max(agg["max_seconds"], entry["seconds"])
+                agg["pages"] += entry["pages"]
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                template: {
+                    name: {
+                        "renders": agg["renders"],
+                        "ms_avg": round(agg["seconds"] / agg["renders"] * 1000, 3),
+                        "ms_max": round(agg["max_seconds"] * 1000, 3),
+                        "pages_avg": round(agg["pages"] / agg["renders"], 2),
+                    }
+                    for name, agg in sections.items()
+                }
+                for template, sections in self._data.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Shared aggregate, filled by render_pdf() when PDF_PROFILE=1
+section_stats = SectionStats()
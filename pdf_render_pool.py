@@ -0,0 +1,178 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pdf_templates import render_pdf
+
+
+class QueueFull(Exception):
+    """Raised by RenderPool.submit when max_queue renders are already pending."""
+
+
+def timed_render(data, style):
+    """Worker task: returns (pdf_bytes, render_seconds)."""
+    start = time.perf_counter()
+    content = render_pdf(data, style)
+    return content, time.perf_counter() - start
+
+
+class RenderJob:
+    def __init__(self, key, meta):
+        # The cache key doubles as render id: once the PDF is in the shared
+        # cache, any worker can answer for it (see app.render_status_route)
+        self.id = key
+        self.key = key
+        self.meta = meta
+        self.status = "queued"
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.render_seconds = None
+        self.content = None
+        self.error = None
+        self.future = None
+        self.done = threading.Event()
+
+    def to_dict(self):
+        status = self.status
+        if status == "queued" and self.future is not None and self.future.running():
+            status = "running"
+        info = {"render_id": self.id, "status": status}
+        if self.render_seconds is not None:
+            info["render_ms"] = round(self.render_seconds * 1000, 1)
+        if self.error:
+            info["error"] = self.error
+        return info
+
+
+class RenderPool:
+    """
+    Renders PDFs off the request thread on a bounded pool of worker processes.
+
+    submit() returns a RenderJob immediately, identified by the document's
+    cache key; requests for a document that is already queued share that job. At most `max_queue`
+    renders may be pending or running, further submits raise QueueFull so the
+    web layer can answer 429. Finished jobs are kept for `ttl` seconds for the
+    client to poll and download, at most `max_finished` of them (oldest
+    dropped first), since each may still hold its PDF.
+    """
+
+    def __init__(self, workers=2, max_queue=16, ttl=300, max_finished=64, render=timed_render, executor_factory=None):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.ttl = ttl
+        self.max_finished = max_finished
+        self.render = render
+        self._executor_factory = executor_factory or (lambda n: ProcessPoolExecutor(max_workers=n))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._pending_by_key = {}
+        self._render_times = deque(maxlen=200)
+        self._stats = {"submitted": 0, "coalesced": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def submit(self, key, data, style, meta=None, on_done=None):
+        """Queues a render; on_done(job) runs in the pool's callback thread when it succeeds."""
+        with self._lock:
+            self._purge()
+            job = self._pending_by_key.get(key)
+            if job is not None:
+                self._stats["coalesced"] += 1
+                return job
+            if len(self._pending_by_key) >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise QueueFull(f"{len(self._pending_by_key)} renders pending")
+
+            if self._executor is None:
+                self._executor = self._executor_factory(self.workers)
+            job = RenderJob(key, meta or {})
+            self._jobs[job.id] = job
+            self._pending_by_key[key] = job
+            self._stats["submitted"] += 1
+
+        try:
+            future = self._executor.submit(self.render, data, style)
+        except Exception:
+            with self._lock:
+                self._pending_by_key.pop(key, None)
+                self._jobs.pop(job.id, None)
+            raise
+        job.future = future
+        future.add_done_callback(lambda f: self._finish(job, f, on_done))
+        return job
+
+    def _finish(self, job, future, on_done):
+        try:
+            job.content, job.render_seconds = future.result()
+            job.status = "done"
+        except Exception as e:
+            job.status, job.error = "failed", str(e) or type(e).__name__
+            print(f"[RenderPool] Render {job.id} failed: {job.error}")
+
+        job.finished_at = time.time()
+        with self._lock:
+            self._pending_by_key.pop(job.key, None)
+            if job.status == "done":
+                self._stats["completed"] += 1
+                self._render_times.append(job.render_seconds)
+            else:
+                self._stats["failed"] += 1
+
+        if job.status == "done" and on_done:
+            try:
+                on_done(job)
+            except Exception as e:
+                print(f"[RenderPool] on_done for {job.id} failed: {e}")
+        job.done.set()
+
+    def get(self, render_id):
+        with self._lock:
+            self._purge()
+            return self._jobs.get(render_id)
+
+    def wait(self, render_id, timeout):
+        """Long-poll helper: the job once finished or after timeout seconds (None if unknown)."""
+        job = self.get(render_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def _purge(self):
+        cutoff = time.time() - self.ttl
+        finished = sorted((job for job in self._jobs.values() if job.finished_at), key=lambda job: job.finished_at)
+        overflow = len(finished) - self.max_finished
+        for i, job in enumerate(finished):
+            if i < overflow or job.finished_at < cutoff:
+                del self._jobs[job.id]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._pending_by_key)
+            stats["max_queue"] = self.max_queue
+            stats["workers"] = self.workers
+            times = sorted(self._render_times)
+        if times:
+            stats["render_ms_avg"] = round(sum(times) / len(times) * 1000, 1)
+            stats["render_ms_p95"] = round(times[min(len(times) - 1, int(len(times) * 0.95))] * 1000, 1)
+        return stats
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def render_pool_from_env():
+    """
+    PDF_RENDER_WORKERS (2), PDF_RENDER_QUEUE (16 pending renders),
+    PDF_RENDER_TTL (300s) and PDF_RENDER_KEEP (64 finished jobs).
+    """
+    return RenderPool(
+        workers=int(os.environ.get('PDF_RENDER_WORKERS', 2)),
+        max_queue=int(os.environ.get('PDF_RENDER_QUEUE', 16)),
+        ttl=int(os.environ.get('PDF_RENDER_TTL', 300)),
+        max_finished=int(os.environ.get('PDF_RENDER_KEEP', 64)),
+    )
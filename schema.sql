@@ -85,6 +85,15 @@ CREATE TABLE IF NOT EXISTS links (
   FOREIGN KEY(candidate_id) REFERENCES candidates(id) ON DELETE CASCADE
 );
 
+-- Denormalized CV (Candidate.template_data() as JSON), rewritten on every change
+CREATE TABLE IF NOT EXISTS candidate_documents (
+  candidate_id INTEGER PRIMARY KEY,
+  version INTEGER NOT NULL,
+  data TEXT NOT NULL,
+  updated_at TEXT,
+  FOREIGN KEY(candidate_id) REFERENCES candidates(id) ON DELETE CASCADE
+);
+
 CREATE TABLE IF NOT EXISTS jobs (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   title TEXT NOT NULL,
@@ -106,3 +115,15 @@ CREATE TABLE IF NOT EXISTS applications (
   tailored_cv_path TEXT,
   date_applied TEXT DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Foreign key and lookup indexes (migrations.py, version 1)
+CREATE INDEX IF NOT EXISTS ix_experiences_candidate_id ON experiences (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_educations_candidate_id ON educations (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_skills_candidate_id ON skills (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_skills_name ON skills (name);
+CREATE INDEX IF NOT EXISTS ix_languages_candidate_id ON languages (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_certifications_candidate_id ON certifications (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_projects_candidate_id ON projects (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_links_candidate_id ON links (candidate_id);
+CREATE INDEX IF NOT EXISTS ix_applications_candidate_id_job_id ON applications (candidate_id, job_id);
+CREATE INDEX IF NOT EXISTS ix_applications_job_id ON applications (job_id);
@@ -1,63 +1,214 @@
 
 import requests
 import html
+import os
+import re
+import threading
+import time
+import unicodedata
+from scrapers.rate_limit import rate_limiter
+
+FEED_URL = "https://remoteok.com/api"
+# Seconds before the snapshot is considered stale and refreshed
+FEED_TTL = int(os.environ.get('REMOTEOK_FEED_TTL', 600))
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Locations that mean "anyone can apply", kept for every location filter
+GLOBAL_LOCATIONS = {"", "worldwide", "anywhere", "remote", "global"}
+
+TOKEN_RE = re.compile(r'[a-z0-9+#.]+')
+
+
+def tokenize(text):
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', str(text)).encode('ASCII', 'ignore').decode('utf-8').lower()
+    return [t.strip('.') for t in TOKEN_RE.findall(text) if t.strip('.')]
+
+
+def to_job(item):
+    return {
+        'title': item.get('position'),
+        'company': item.get('company'),
+        'location': item.get('location'),
+        'url': item.get('apply_url') or item.get('url'),
+        'tags': item.get('tags', []),
+        'date_posted': item.get('date'),
+        'source': 'RemoteOK',
+        'logo': item.get('company_logo')
+    }
+
+
+class FeedIndex:
+    """
+    Inverted index over one RemoteOK feed snapshot.
+    Postings map tag slugs, title tokens and location tokens to job positions
+    in feed order (newest first), so a search is a few set operations.
+    """
+
+    def __init__(self, items):
+        self.jobs = []
+        self.by_term = {}
+        self.by_location = {}
+        self.global_ids = set()
+
+        for item in items:
+            if not isinstance(item, dict) or not item.get('position'):
+                continue
+            job_id = len(self.jobs)
+            self.jobs.append(to_job(item))
+
+            terms = set(tokenize(item.get('position')))
+            for tag in item.get('tags') or []:
+                slug = str(tag).lower().strip().replace(' ', '-')
+                terms.add(slug)
+                terms.update(tokenize(tag))
+            for term in terms:
+                self.by_term.setdefault(term, set()).add(job_id)
+
+            loc_tokens = set(tokenize(item.get('location')))
+            if not loc_tokens or loc_tokens & GLOBAL_LOCATIONS:
+                self.global_ids.add(job_id)
+            for token in loc_tokens:
+                self.by_location.setdefault(token, set()).add(job_id)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _match_query(self, query):
+        if not query or not query.strip():
+            return set(range(len(self.jobs)))
+        # Whole query as a tag slug ('machine learning' -> 'machine-learning'), like ?tag= did
+        ids = set(self.by_term.get(query.lower().strip().replace(' ', '-'), ()))
+        tokens = tokenize(query)
+        if tokens:
+            token_ids = set(self.by_term.get(tokens[0], ()))
+            for token in tokens[1:]:
+                token_ids &= self.by_term.get(token, set())
+            ids |= token_ids
+        return ids
+
+    def _match_location(self, location):
+        tokens = tokenize(location)
+        if not tokens:
+            return None
+        ids = set(self.by_location.get(tokens[0], ()))
+        for token in tokens[1:]:
+            ids &= self.by_location.get(token, set())
+        return ids | self.global_ids
+
+    def search(self, query, location=None, limit=20):
+        ids = self._match_query(query)
+        location_ids = self._match_location(location)
+        if location_ids is not None:
+            ids &= location_ids
+        return [dict(self.jobs[i]) for i in sorted(ids)[:limit]]
+
+
+class RemoteOKFeed:
+    """
+    Periodically refreshed snapshot of the full RemoteOK feed.
+
+    The first search fetches synchronously; after `ttl` seconds the old index
+    keeps serving while one background thread re-fetches with
+    If-None-Match / If-Modified-Since, so a 304 costs no parsing.
+    """
+
+    def __init__(self, url=FEED_URL, ttl=FEED_TTL):
+        self.url = url
+        self.ttl = ttl
+        self.reset()
+
+    def reset(self):
+        self.index = None
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.stats = {"fetches": 0, "not_modified": 0, "errors": 0}
+
+    def refresh(self):
+        headers = dict(HEADERS)
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        print(f"Fetching jobs from: {self.url}")
+        try:
+            rate_limiter.acquire(self.url)
+            resp = requests.get(self.url, headers=headers, timeout=10)
+        except Exception as e:
+            print(f"Error scraping RemoteOK: {e}")
+            self.stats["errors"] += 1
+            return self.index
+
+        if resp.status_code == 304 and self.index is not None:
+            self.stats["not_modified"] += 1
+            self.fetched_at = time.time()
+        elif resp.status_code == 200:
+            try:
+                data = resp.json()
+            except Exception as e:
+                print(f"Error parsing RemoteOK feed: {e}")
+                self.stats["errors"] += 1
+                return self.index
+            # RemoteOK returns a list where the first element is usually legal info
+            self.index = FeedIndex(data[1:] if len(data) > 0 else [])
+            self.etag = resp.headers.get('ETag')
+            self.last_modified = resp.headers.get('Last-Modified')
+            self.fetched_at = time.time()
+            self.stats["fetches"] += 1
+        else:
+            print(f"RemoteOK feed returned status {resp.status_code}")
+            self.stats["errors"] += 1
+        return self.index
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def worker():
+            try:
+                self.refresh()
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=worker, name="remoteok-feed-refresh", daemon=True).start()
+
+    def get_index(self):
+        if self.index is None:
+            with self._lock:
+                if self.index is None:
+                    self.refresh()
+            return self.index
+        if time.time() - self.fetched_at >= self.ttl:
+            self._refresh_in_background()
+        return self.index
+
+
+# Shared snapshot for the whole process
+feed = RemoteOKFeed()
+
 
 def scrape_jobs(query, location=None):
     """
-    Scrapes jobs from RemoteOK API.
-    query: string (e.g. 'python', 'react')
-    location: string (optional filtering)
+    Searches RemoteOK jobs from the local feed snapshot.
+    query: string (e.g. 'python', 'react') matched against tags and title words
+    location: string (optional filtering; worldwide jobs always match)
     """
     results = []
-    
-    # RemoteOK API
-    try:
-        url = "https://remoteok.com/api"
-        if query:
-            # RemoteOK uses query param 'tag' for filtering by tech
-            # For broader search we might need to filter manually or rely on their fuzzy matching
-            url += f"?tag={query.lower().replace(' ', '-')}"
-            
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        print(f"Fetching jobs from: {url}")
-        resp = requests.get(url, headers=headers, timeout=10)
-        
-        if resp.status_code == 200:
-            data = resp.json()
-            # RemoteOK returns a list where the first element is usually legal info
-            jobs_list = data[1:] if len(data) > 0 else []
-            
-            for item in jobs_list:
-                # Basic filtering if location is provided
-                job_loc = (item.get('location', '') or '').lower()
-                if location and location.lower() not in job_loc:
-                     # RemoteOK is mostly remote, so location might be 'Worldwide' or specific countries
-                     # We can be lenient here
-                     pass
-
-                # Clean description (it's HTML)
-                description = item.get('description', '')
-                # We won't strip HTML here, frontend can handle it or we limit it
-                
-                job = {
-                    'title': item.get('position'),
-                    'company': item.get('company'),
-                    'location': item.get('location'),
-                    'url': item.get('apply_url') or item.get('url'),
-                    'tags': item.get('tags', []),
-                    'date_posted': item.get('date'),
-                    'source': 'RemoteOK',
-                    'logo': item.get('company_logo')
-                }
-                results.append(job)
-                
-    except Exception as e:
-        print(f"Error scraping RemoteOK: {e}")
-        # Return empty list or maybe a dummy job for testing if API fails (common with anti-bot)
-        
+
+    index = feed.get_index()
+    if index is not None:
+        results = index.search(query, location, limit=20)
+
     # If no results (maybe API blocked), return some dummy data for testing UI
     if not results and "test" in (query or "").lower():
          results.append({
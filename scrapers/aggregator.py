@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from scrapers.cache import job_cache
+from scrapers.dedup import collapse_near_duplicates
+from scrapers.registry import get_sources, normalize_job
+
+
+def job_key(job):
+    """Identity used to merge the same posting coming from several sources or terms."""
+    url = (job.get('url') or '').strip().rstrip('/').lower()
+    if url and url != '#':
+        return url
+    return f"{(job.get('title') or '').strip().lower()}|{(job.get('company') or '').strip().lower()}"
+
+
+def dedupe_jobs(jobs, seen=None):
+    """Keeps the first occurrence of each job_key(). Pass `seen` to dedupe across calls."""
+    seen = set() if seen is None else seen
+    unique = []
+    for job in jobs:
+        key = job_key(job)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+class JobAggregator:
+    """
+    Queries every enabled source in parallel (through the shared result cache),
+    normalizes jobs to the common schema and merges them.
+
+    Every source has its own thread pool (JobSource.workers, default
+    `max_workers`), so hung fetches of one source only use up that source's
+    threads. A source's timeout counts from when it starts running; one that
+    exceeds it is reported as an error and left running in the background,
+    its result (if any) still lands in the cache. A source that gets no free
+    thread within its timeout is reported as busy and not run at all.
+    """
+
+    def __init__(self, cache=job_cache, max_workers=None):
+        self.cache = cache
+        self.max_workers = max_workers or int(os.environ.get('AGGREGATOR_WORKERS', 4))
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, source):
+        with self._lock:
+            pool = self._pools.get(source.name)
+            if pool is None:
+                pool = self._pools[source.name] = ThreadPoolExecutor(
+                    max_workers=source.workers or self.max_workers,
+                    thread_name_prefix=f"job-source-{source.name}"
+                )
+            return pool
+
+    def _fetch(self, source, query, location):
+        def fetch(q, l):
+            return [normalize_job(job, source.name) for job in source.fetch(q, l) or []]
+        return self.cache.get_or_fetch(source.name, query, location, fetch)
+
+    def iter_batches(self, query, location="", sources=None):
+        """
+        Yields (source_name, jobs, info) as each source completes, where info is
+        {"count", "elapsed_ms", "error"}. Jobs are normalized but not deduplicated.
+        """
+        start = time.perf_counter()
+        started = {}  # source name -> when a worker picked it up
+
+        def run(source):
+            started[source.name] = time.perf_counter()
+            return self._fetch(source, query, location)
+
+        pending = {}
+        for source in get_sources(sources):
+            pending[self._pool(source).submit(run, source)] = source
+
+        def deadline(source):
+            return started.get(source.name, start) + source.timeout
+
+        while pending:
+            next_deadline = min(deadline(source) for source in pending.values())
+            done, _ = wait(pending, timeout=max(0, next_deadline - time.perf_counter()), return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+
+            for future in list(pending):
+                source = pending[future]
+                if future in done:
+                    try:
+                        jobs, error = future.result(), None
+                    except Exception as e:
+                        jobs, error = [], str(e)
+                elif now < deadline(source):
+                    continue
+                elif source.name in started:
+                    jobs, error = [], f"timeout after {source.timeout}s"
+                elif future.cancel():
+                    jobs, error = [], f"busy: no free worker within {source.timeout}s"
+                else:
+                    continue  # picked up just now: its timeout starts from there
+
+                del pending[future]
+                info = {"count": len(jobs), "elapsed_ms": round((now - start) * 1000, 1), "error": error}
+                yield source.name, jobs, info
+
+    def search(self, query, location="", sources=None, near_duplicates=True):
+        """
+        Returns (jobs, summary): merged, deduplicated jobs and per-source info.
+        With near_duplicates, re-listed postings are collapsed into one record
+        carrying all their `urls` and `sources` (see scrapers/dedup.py).
+        """
+        jobs = []
+        seen = set()
+        summary = {}
+        for name, batch, info in self.iter_batches(query, location, sources):
+            jobs.extend(dedupe_jobs(batch, seen))
+            summary[name] = info
+        if near_duplicates:
+            jobs = collapse_near_duplicates(jobs)
+        return jobs, summary
+
+
+# Shared instance used by the web app and the agents
+aggregator = JobAggregator()
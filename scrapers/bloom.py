@@ -0,0 +1,73 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+
+_HEADER = struct.Struct('<4sQIQ')  # magic, bit count, hash count, items added
+_MAGIC = b'BLM1'
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set of strings. Membership tests can return false
+    positives (at roughly `error_rate` once `capacity` items are added) but
+    never false negatives.
+
+    Bit positions use double hashing over one blake2b digest. With a `path`
+    the filter is loaded from disk when present and written back by save().
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001, path=None):
+        self.path = str(path) if path else None
+        self._lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            self._load()
+            return
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        h2 |= 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Adds item; returns True if it was (probably) not present before."""
+        added = False
+        with self._lock:
+            for pos in self._positions(item):
+                byte, bit = divmod(pos, 8)
+                if not self.bits[byte] & (1 << bit):
+                    self.bits[byte] |= 1 << bit
+                    added = True
+            if added:
+                self.count += 1
+        return added
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, self.path)
+
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            magic, self.num_bits, self.num_hashes, self.count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{self.path} is not a Bloom filter file")
+            self.bits = bytearray(f.read())
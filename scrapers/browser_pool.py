@@ -0,0 +1,216 @@
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+DEFAULT_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox'
+]
+
+DEFAULT_CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "viewport": {'width': 1920, 'height': 1080},
+    "locale": "es-CL",
+}
+
+
+def _start_playwright():
+    from playwright.sync_api import sync_playwright
+    return sync_playwright().start()
+
+
+class _BrowserWorker(threading.Thread):
+    """
+    Owns one Chromium and one warm context. Playwright's sync API is bound to
+    the thread that started it, so every page operation for this browser runs
+    here; callers hand work over through the pool's task queue.
+    """
+
+    def __init__(self, pool, index):
+        super().__init__(name=f"browser-pool-{index}", daemon=True)
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.uses = 0
+        self.crashed = False
+
+    def run(self):
+        startup_error = None
+        try:
+            self.playwright = self.pool.playwright_factory()
+            if self.pool.warm:
+                self._launch()
+        except Exception as e:
+            print(f"[BrowserPool] Worker {self.name} failed to start: {e}")
+            if self.playwright is None:
+                startup_error = e
+
+        try:
+            while True:
+                task = self.pool._tasks.get()
+                if task is None:
+                    break
+                fn, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if startup_error is not None:
+                    future.set_exception(startup_error)
+                else:
+                    self._execute(fn, future)
+        finally:
+            self._close()
+            if self.playwright is not None:
+                try:
+                    self.playwright.stop()
+                except Exception:
+                    pass
+
+    def _execute(self, fn, future):
+        try:
+            page = self._checkout()
+        except Exception as e:
+            self._recycle()
+            future.set_exception(e)
+            return
+
+        try:
+            future.set_result(fn(page))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            self._checkin(page)
+
+    def _healthy(self):
+        return self.browser is not None and self.browser.is_connected() and not self.crashed
+
+    def _launch(self):
+        self.browser = self.playwright.chromium.launch(headless=True, args=self.pool.launch_args)
+        self.context = self.browser.new_context(**self.pool.context_options)
+        self.uses = 0
+        self.crashed = False
+        self.pool._count("launches")
+
+    def _close(self):
+        for resource in (self.context, self.browser):
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+        self.context = None
+        self.browser = None
+
+    def _recycle(self):
+        self._close()
+        self.pool._count("recycles")
+
+    def _checkout(self):
+        if not self._healthy():
+            if self.browser is not None:
+                self._recycle()
+            self._launch()
+        page = self.context.new_page()
+        page.on("crash", lambda _page: setattr(self, "crashed", True))
+        self.pool._count("checkouts")
+        return page
+
+    def _checkin(self, page):
+        try:
+            if not page.is_closed():
+                page.close()
+        except Exception:
+            self.crashed = True
+        self.uses += 1
+        if self.crashed or self.uses >= self.pool.max_uses or not self._healthy():
+            self._recycle()
+
+
+class BrowserPool:
+    """
+    Fixed set of long-lived headless browsers shared by all scraping calls.
+
+    - `size` browsers are started (eagerly when `warm=True`) on dedicated threads.
+    - run(fn) hands fn(page) to the next free browser and blocks for the result;
+      calls beyond `size` wait in the queue, so peak memory is bounded by `size`.
+    - A browser is relaunched after `max_uses` pages, on page crash or when it
+      disconnects.
+    """
+
+    def __init__(self, size=2, max_uses=50, warm=True, launch_args=None, context_options=None,
+                 playwright_factory=_start_playwright):
+        self.size = size
+        self.max_uses = max_uses
+        self.warm = warm
+        self.launch_args = launch_args or DEFAULT_LAUNCH_ARGS
+        self.context_options = context_options or DEFAULT_CONTEXT_OPTIONS
+        self.playwright_factory = playwright_factory
+        self._tasks = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"launches": 0, "recycles": 0, "checkouts": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def start(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is shut down")
+            if not self._workers:
+                self._workers = [_BrowserWorker(self, i) for i in range(self.size)]
+                for worker in self._workers:
+                    worker.start()
+        return self
+
+    def submit(self, fn):
+        self.start()
+        future = Future()
+        self._tasks.put((fn, future))
+        return future
+
+    def run(self, fn, timeout=None):
+        """Run fn(page) on a pooled page and return its result."""
+        return self.submit(fn).result(timeout=timeout)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["size"] = self.size
+        stats["queued"] = self._tasks.qsize()
+        return stats
+
+    def shutdown(self, timeout=10):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._tasks.put(None)
+        for worker in workers:
+            worker.join(timeout=timeout)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """
+    Process-wide pool configured from BROWSER_POOL_SIZE (default 2) and
+    BROWSER_POOL_MAX_USES (default 50). Shut down automatically at exit.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                size=int(os.environ.get('BROWSER_POOL_SIZE', 2)),
+                max_uses=int(os.environ.get('BROWSER_POOL_MAX_USES', 50)),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
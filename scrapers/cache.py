@@ -0,0 +1,212 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+
+
+def normalize_key_part(text):
+    """Normalize a query/location so 'Python ', 'python' and 'PYTHON' share an entry."""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('utf-8')
+    return " ".join(text.lower().split())
+
+
+def make_key(source, query, location=""):
+    return "|".join([normalize_key_part(source), normalize_key_part(query), normalize_key_part(location)])
+
+
+class MemoryBackend:
+    """In-process LRU store. Entries are (stored_at, jobs) tuples."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, value, stored_at):
+        with self._lock:
+            self._data[key] = (stored_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskBackend:
+    """
+    SQLite-backed store so several workers (gunicorn processes) share one cache.
+    LRU order is tracked with an `accessed_at` column.
+    """
+
+    def __init__(self, path, max_entries=256):
+        self.path = str(path)
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # sqlite3's own context manager only commits or rolls back, so the
+        # connection is closed here instead of waiting for garbage collection
+        with closing(sqlite3.connect(self.path, timeout=5)) as conn, conn:
+            yield conn
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute("SELECT stored_at, value FROM job_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE job_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return row[0], json.loads(row[1])
+
+    def set(self, key, value, stored_at):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), stored_at, time.time())
+            )
+            conn.execute(
+                "DELETE FROM job_cache WHERE key IN ("
+                "SELECT key FROM job_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM job_cache")
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM job_cache").fetchone()[0]
+
+
+class JobCache:
+    """
+    TTL cache for scraper results keyed on normalized (source, query, location).
+
+    - age < ttl: fresh hit, served from cache.
+    - ttl <= age < ttl + stale_ttl: stale hit, served from cache while a
+      background thread refreshes the entry (stale-while-revalidate).
+    - otherwise: miss, fetched synchronously.
+
+    Empty results are never stored, so a blocked or failing upstream is retried
+    on the next request instead of being pinned for a whole TTL.
+    """
+
+    def __init__(self, ttl=300, stale_ttl=1800, max_entries=256, path=None, stale_while_revalidate=True):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.backend = DiskBackend(path, max_entries) if path else MemoryBackend(max_entries)
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_or_fetch(self, source, query, location, fetch):
+        """Return cached jobs for (source, query, location) or call fetch(query, location)."""
+        key = make_key(source, query, location)
+        entry = self.backend.get(key)
+        now = time.time()
+
+        if entry is not None:
+            stored_at, jobs = entry
+            age = now - stored_at
+            if age < self.ttl:
+                self._count("hits")
+                return jobs
+            if self.stale_while_revalidate and age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, query, location, fetch)
+                return jobs
+
+        self._count("misses")
+        return self._fetch_and_store(key, query, location, fetch)
+
+    def _fetch_and_store(self, key, query, location, fetch):
+        try:
+            jobs = fetch(query, location)
+        except Exception:
+            self._count("errors")
+            raise
+        if jobs:
+            self.backend.set(key, jobs, time.time())
+        return jobs
+
+    def _refresh_in_background(self, key, query, location, fetch):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+
+        def worker():
+            try:
+                self._fetch_and_store(key, query, location, fetch)
+            except Exception as e:
+                print(f"[JobCache] Background refresh failed for '{key}': {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=worker, name=f"job-cache-refresh:{key}", daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        stats["size"] = len(self.backend)
+        stats["backend"] = type(self.backend).__name__
+        return stats
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+def cache_from_env():
+    """
+    Build the shared cache from environment variables:
+    JOB_CACHE_TTL, JOB_CACHE_STALE_TTL, JOB_CACHE_MAX_ENTRIES (ints),
+    JOB_CACHE_PATH (SQLite file, enables the disk backend) and
+    JOB_CACHE_SWR ('0' disables stale-while-revalidate).
+    """
+    return JobCache(
+        ttl=int(os.environ.get('JOB_CACHE_TTL', 300)),
+        stale_ttl=int(os.environ.get('JOB_CACHE_STALE_TTL', 1800)),
+        max_entries=int(os.environ.get('JOB_CACHE_MAX_ENTRIES', 256)),
+        path=os.environ.get('JOB_CACHE_PATH') or None,
+        stale_while_revalidate=os.environ.get('JOB_CACHE_SWR', '1') != '0',
+    )
+
+
+# Shared instance used by the web app and the agents
+job_cache = cache_from_env()
@@ -1,11 +1,17 @@
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+import os
+import re
+import threading
 import time
-import random
 import unicodedata
-import urllib.parse
 import sys
+import requests
+from requests.adapters import HTTPAdapter
+from scrapers.rate_limit import rate_limiter
+from scrapers.browser_pool import get_browser_pool
+from scrapers.bloom import BloomFilter
 
 def normalize_string(text):
     """Normalize string for URL (remove accents, lowercase, replace spaces with hyphens)"""
@@ -15,151 +21,428 @@ def normalize_string(text):
     text = text.lower().strip()
     return text.replace(" ", "-")
 
+# URL Base (Chile)
+BASE_URL = "https://cl.computrabajo.com"
+
+# auto: plain HTTP first, browser only when blocked. http / browser: force one path.
+FETCH_MODE = os.environ.get('COMPUTRABAJO_FETCH_MODE', 'auto')
+
+BLOCK_STATUSES = [403, 429, 503]
+CHALLENGE_MARKERS = ["challenge-platform", "cf-chl", "Just a moment...", "g-recaptcha", "hcaptcha"]
+# "0 ofertas de trabajo" but not "120 ofertas de trabajo"
+NO_RESULTS_RE = re.compile(r'No hemos encontrado ofertas|(?<![\d.,])0 ofertas de trabajo')
+
+# BeautifulSoup backend ('html.parser', or 'lxml' when installed)
+PARSER = os.environ.get('COMPUTRABAJO_PARSER', 'html.parser')
+
+# Only offer containers (and their children) are turned into a tree.
+# A regex because the strainer sees the raw class string ("bRS bClick").
+OFFER_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)(?:box_offer|bClick)(?:\s|$)'))
+
+ARTICLE_SELECTORS = [sv.compile('article.box_offer'), sv.compile('div.bClick')]
+
+# Fallback chains per field, most specific first, compiled once
+FIELD_SELECTORS = {
+    'title': [sv.compile(s) for s in ['h1 a.js-o-link', 'h2 a.js-o-link', 'a.js-o-link']],
+    'company': [sv.compile(s) for s in ['p.fs16.fc_base.mt5 a', 'a.empr', 'p.fs16 span']],
+    'location': [sv.compile(s) for s in ['p.fs16 span.fc_base', 'span[itemprop="addressLocality"]']],
+    'description': [sv.compile(s) for s in ['p.fs13.fc_aux', 'div.fs13']],
+    'date': [sv.compile('span.fc_aux')],
+}
+
+# Browser path: skip non-essential downloads ('0' loads everything)
+BLOCK_RESOURCES = os.environ.get('COMPUTRABAJO_BLOCK_RESOURCES', '1') != '0'
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "other"}
+BLOCKED_HOSTS = ["google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net",
+                 "hotjar.com", "criteo", "adnxs.com", "googlesyndication.com"]
+
+OFFER_CSS = "article.box_offer, div.bClick"
+
+# True once the offer count is non-zero and unchanged between two polls
+OFFERS_STABLE_JS = """() => {
+    const count = document.querySelectorAll('%s').length;
+    const previous = window.__offerCount;
+    window.__offerCount = count;
+    return count > 0 && count === previous;
+}""" % OFFER_CSS
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "es-CL,es;q=0.9",
+}
+
+
+class FetchStats:
+    """
+    Counts and latency per fetch path ('http', 'browser'), escalation reasons
+    and per-phase browser timings (navigate, settle, extract).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self._paths = {}
+        self._escalations = {}
+        self._phases = {}
+
+    def record(self, path, elapsed, ok=True):
+        with self._lock:
+            entry = self._paths.setdefault(path, {"count": 0, "failures": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed * 1000
+            if not ok:
+                entry["failures"] += 1
+
+    def record_phase(self, phase, elapsed):
+        with self._lock:
+            entry = self._phases.setdefault(phase, {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed * 1000
+
+    def escalate(self, reason):
+        with self._lock:
+            self._escalations[reason] = self._escalations.get(reason, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            paths = {
+                path: {
+                    "count": entry["count"],
+                    "failures": entry["failures"],
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 1) if entry["count"] else 0.0,
+                }
+                for path, entry in self._paths.items()
+            }
+            phases = {
+                phase: {"count": entry["count"], "avg_ms": round(entry["total_ms"] / entry["count"], 1)}
+                for phase, entry in self._phases.items()
+            }
+            return {"mode": FETCH_MODE, "paths": paths, "escalations": dict(self._escalations), "browser_phases": phases}
+
+
+fetch_stats = FetchStats()
+
+_seen_filter = None
+_seen_lock = threading.Lock()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Keep-alive session shared by all threads; connections to Computrabajo are pooled."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HTTP_HEADERS)
+            _session = session
+        return _session
+
+
+def detect_block(status, content):
+    """Returns why a plain HTTP response can't be used (block, challenge, empty page) or None."""
+    if status in BLOCK_STATUSES:
+        return f"status_{status}"
+    if status != 200 or content is None:
+        return "error"
+    head = content[:20000]
+    if any(marker in head for marker in CHALLENGE_MARKERS):
+        return "challenge"
+    if NO_RESULTS_RE.search(content):
+        return None
+    if "box_offer" not in content and "bClick" not in content:
+        return "no_articles"
+    return None
+
+
+def _fetch_http(url):
+    """Fetches a listing with the pooled session. Returns (status, html) or (None, None) on network errors."""
+    start = time.perf_counter()
+    try:
+        resp = get_http_session().get(url, timeout=10)
+    except Exception as e:
+        print(f"[ComputrabajoScraper] HTTP error: {e}")
+        fetch_stats.record("http", time.perf_counter() - start, ok=False)
+        return None, None
+    fetch_stats.record("http", time.perf_counter() - start, ok=resp.status_code == 200)
+    return resp.status_code, resp.text
+
+
+def _fetch_browser(url):
+    start = time.perf_counter()
+    try:
+        status, content = get_browser_pool().run(lambda page: _render_listing(page, url), timeout=60)
+    except Exception as e:
+        print(f"[ComputrabajoScraper] Critical Error: {e}")
+        fetch_stats.record("browser", time.perf_counter() - start, ok=False)
+        return None, None
+    fetch_stats.record("browser", time.perf_counter() - start, ok=content is not None)
+    return status, content
+
+
 def scrape_computrabajo(query, location=""):
     """
     Scrapes jobs from Computrabajo (Chile domain by default).
+    Listing HTML is fetched with a plain keep-alive HTTP session first; the
+    shared browser pool (see scrapers/browser_pool.py) is used only when that
+    response looks blocked, is a challenge page or carries no offers.
     Returns a list of job dicts.
     """
-    results = []
-    
-    # URL Base (Chile)
-    base_url = "https://cl.computrabajo.com" 
-    
+    url = listing_url(query, location)
+    status, content = fetch_listing(url)
+    if content is None:
+        return []
+
+    return parse_listing(content, BASE_URL, location)[:15]
+
+
+def listing_url(query, location="", page=1):
     # Construct optimized URL path
     # Example: https://cl.computrabajo.com/trabajo-de-programador-en-santiago
     # Query path
     clean_query = normalize_string(query)
     path = f"trabajo-de-{clean_query}"
-    
+
     # Location path (optional)
     if location:
         clean_loc = normalize_string(location)
         path += f"-en-{clean_loc}"
 
-    url = f"{base_url}/{path}"
-    
+    url = f"{BASE_URL}/{path}"
+    if page > 1:
+        url += f"?p={page}"
+    return url
+
+
+def fetch_listing(url):
+    """
+    Fetches one listing page, HTTP first with browser fallback (see FETCH_MODE).
+    Returns (status, html); html is None when the page could not be used.
+    """
     print(f"[ComputrabajoScraper] Visiting: {url}")
     sys.stdout.flush()
 
+    status, content = None, None
+    if FETCH_MODE != "browser":
+        rate_limiter.acquire(url)
+        status, content = _fetch_http(url)
+        reason = detect_block(status, content)
+        if reason:
+            fetch_stats.escalate(reason)
+            content = None
+            if FETCH_MODE == "http":
+                print(f"[ComputrabajoScraper] HTTP fetch unusable ({reason}), browser fallback disabled.")
+                return status, None
+            print(f"[ComputrabajoScraper] HTTP fetch unusable ({reason}), escalating to browser.")
+
+    if content is None:
+        rate_limiter.acquire(url)
+        status, content = _fetch_browser(url)
+
+    # Check for blocking status codes
+    if status in [403, 429, 503]:
+        print(f"[ComputrabajoScraper] BLOCKED! Status code: {status}")
+        return status, None
+    return status, content
+
+
+def get_seen_filter():
+    """
+    Persistent Bloom filter of offer URLs already crawled, stored at
+    COMPUTRABAJO_SEEN_PATH (default data/computrabajo_seen.bloom).
+    """
+    global _seen_filter
+    with _seen_lock:
+        if _seen_filter is None:
+            path = os.environ.get('COMPUTRABAJO_SEEN_PATH') or \
+                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "computrabajo_seen.bloom")
+            _seen_filter = BloomFilter(capacity=200000, error_rate=0.001, path=path)
+        return _seen_filter
+
+
+def crawl_computrabajo(query, location="", max_pages=None, seen=None):
+    """
+    Incremental multi-page crawl. Walks result pages 1..max_pages
+    (COMPUTRABAJO_MAX_PAGES, default 5) and returns only offers whose URL is
+    not in `seen` (the persistent filter by default). Stops early at the first
+    page that is empty or contains only already-seen offers, so a re-crawl
+    costs roughly the new listings.
+    """
+    max_pages = max_pages or int(os.environ.get('COMPUTRABAJO_MAX_PAGES', 5))
+    seen = get_seen_filter() if seen is None else seen
+    new_jobs = []
+
+    for page in range(1, max_pages + 1):
+        status, content = fetch_listing(listing_url(query, location, page))
+        if content is None:
+            break
+        jobs = parse_listing(content, BASE_URL, location)
+        if not jobs:
+            break
+
+        fresh = [job for job in jobs if job['url'] and job['url'] not in seen]
+        print(f"[ComputrabajoScraper] Page {page}: {len(fresh)} new of {len(jobs)} offers.")
+        if not fresh:
+            break
+        for job in fresh:
+            seen.add(job['url'])
+        new_jobs.extend(fresh)
+
+    if hasattr(seen, "save"):
+        seen.save()
+    return new_jobs
+
+
+def _block_resources(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _render_listing(page, url):
+    """
+    Loads a listing page on a pooled Playwright page.
+    Runs on the browser pool's thread. Returns (status, html); html is None on navigation errors.
+
+    Images, fonts, stylesheets and trackers are aborted at the route level,
+    and the page is considered settled as soon as the offer count stops
+    changing (or no offer container shows up) instead of after a fixed sleep.
+    """
+    if BLOCK_RESOURCES:
+        page.route("**/*", _block_resources)
+
+    start = time.perf_counter()
     try:
-        with sync_playwright() as p:
-            # Launch browser (headless=True usually, but False helps debug visual blocks)
-            # Add extra args to mimic real user better
-            browser = p.chromium.launch(headless=True, args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox'
-            ])
-            
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={'width': 1920, 'height': 1080},
-                locale="es-CL"
-            )
-            
-            page = context.new_page()
-            
-            # Go to page
-            try:
-                # Wait until dom content loaded, not just network idle
-                response = page.goto(url, timeout=30000, wait_until="domcontentloaded")
-                
-                # Check for blocking status codes
-                if response and response.status in [403, 429, 503]:
-                    print(f"[ComputrabajoScraper] BLOCKED! Status code: {response.status}")
-                    return []
-                
-            except Exception as e:
-                print(f"[ComputrabajoScraper] Navigation error: {e}")
-                return []
-
-            # Wait for content to load properly
-            # Try to wait for the job list container
-            try:
-                page.wait_for_selector("#offersGridOfferContainer", timeout=5000)
-            except:
-                pass # Maybe different layout
-
-            # Scroll down to trigger lazy loading if any
-            page.mouse.wheel(0, 1000)
-            time.sleep(2)
-            
-            # Get content
-            content = page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Debug: check if we hit a "No results" page
-            if "No hemos encontrado ofertas" in content or "0 ofertas de trabajo" in content:
-                print("[ComputrabajoScraper] No jobs found for this query.")
-                return []
-
-            # Selectors
-            # New layout: <article class="box_offer"> inside #offersGridOfferContainer
-            articles = soup.select('article.box_offer')
-            
-            if not articles:
-                 # Fallback for old layouts
-                 articles = soup.select('div.bClick')
-            
-            print(f"[ComputrabajoScraper] Found {len(articles)} articles.")
-            sys.stdout.flush()
-
-            for article in articles:
-                try:
-                    # Title
-                    title_elem = article.select_one('h1 a.js-o-link') or \
-                                 article.select_one('h2 a.js-o-link') or \
-                                 article.select_one('a.js-o-link')
-                    
-                    if not title_elem: continue
-                    
-                    title = title_elem.text.strip()
-                    link = title_elem.get('href', '')
-                    if link and link.startswith("/"):
-                        link = base_url + link
-                        
-                    # Company
-                    company_elem = article.select_one('p.fs16.fc_base.mt5 a') or \
-                                   article.select_one('a.empr') or \
-                                   article.select_one('p.fs16 span') 
-                                   
-                    company = company_elem.text.strip() if company_elem else "Confidencial"
-                    
-                    # Location
-                    loc_elem = article.select_one('p.fs16 span.fc_base') or \
-                               article.select_one('span[itemprop="addressLocality"]')
-                    
-                    loc = loc_elem.text.strip() if loc_elem else location
-
-                    # Description snippet
-                    desc_elem = article.select_one('p.fs13.fc_aux') or \
-                                article.select_one('div.fs13')
-                    
-                    description = desc_elem.text.strip() if desc_elem else ""
-                    
-                    # Date
-                    date_elem = article.select_one('span.fc_aux')
-                    date_posted = date_elem.text.strip() if date_elem else ""
-
-                    job = {
-                        'title': title,
-                        'company': company,
-                        'location': loc,
-                        'url': link,
-                        'description': description, 
-                        'date_posted': date_posted,
-                        'source': 'Computrabajo',
-                        'logo': '' # Hard to get without loading details page
-                    }
-                    results.append(job)
-                    
-                except Exception as e:
-                    # print(f"Error parsing job: {e}")
-                    continue
-
-            browser.close()
-            
+        # Wait until dom content loaded, not just network idle
+        response = page.goto(url, timeout=30000, wait_until="domcontentloaded")
     except Exception as e:
-        print(f"[ComputrabajoScraper] Critical Error: {e}")
+        print(f"[ComputrabajoScraper] Navigation error: {e}")
+        return None, None
+    finally:
+        fetch_stats.record_phase("navigate", time.perf_counter() - start)
+
+    status = response.status if response else None
+    if status in [403, 429, 503]:
+        return status, None
+
+    start = time.perf_counter()
+    try:
+        page.wait_for_selector(f"#offersGridOfferContainer, {OFFER_CSS}", state="attached", timeout=5000)
+        # Scroll down to trigger lazy loading if any, then wait for the list to stop growing
+        page.mouse.wheel(0, 1000)
+        page.wait_for_function(OFFERS_STABLE_JS, polling=250, timeout=3000)
+    except Exception:
+        pass # Maybe different layout or a no-results page; extract whatever is there
+    fetch_stats.record_phase("settle", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    content = page.content()
+    fetch_stats.record_phase("extract", time.perf_counter() - start)
+    return status, content
+
+
+def detect_layout(article):
+    """
+    Picks, for each field, the selector that matches this (first) article and
+    tries it first on every other article of the page; the remaining
+    selectors are only walked when an article lacks that field.
+    """
+    layout = {}
+    for field, selectors in FIELD_SELECTORS.items():
+        hit = next((sel for sel in selectors if sel.select_one(article) is not None), None)
+        layout[field] = [hit] + [sel for sel in selectors if sel is not hit] if hit else selectors
+    return layout
+
+
+def _first(article, selectors):
+    for sel in selectors:
+        elem = sel.select_one(article)
+        if elem is not None:
+            return elem
+    return None
+
+
+def parse_listing(content, base_url, location="", parser=None):
+    """
+    Extracts job dicts from the HTML of a Computrabajo listing page.
+    Only offer containers are built into a tree (SoupStrainer); `parser`
+    defaults to COMPUTRABAJO_PARSER.
+    """
+    results = []
+
+    # Debug: check if we hit a "No results" page
+    if NO_RESULTS_RE.search(content):
+        print("[ComputrabajoScraper] No jobs found for this query.")
         return []
-        
-    return results[:15]
+
+    soup = BeautifulSoup(content, parser or PARSER, parse_only=OFFER_STRAINER)
+
+    # Selectors
+    # New layout: <article class="box_offer"> inside #offersGridOfferContainer
+    # Fallback for old layouts: <div class="bClick">
+    articles = []
+    for sel in ARTICLE_SELECTORS:
+        articles = sel.select(soup)
+        if articles:
+            break
+
+    print(f"[ComputrabajoScraper] Found {len(articles)} articles.")
+    sys.stdout.flush()
+
+    if not articles:
+        return []
+    layout = detect_layout(articles[0])
+
+    for article in articles:
+        try:
+            title_elem = _first(article, layout['title'])
+            if not title_elem: continue
+
+            title = title_elem.get_text().strip()
+            link = title_elem.get('href', '')
+            if link and link.startswith("/"):
+                link = base_url + link
+
+            company_elem = _first(article, layout['company'])
+            loc_elem = _first(article, layout['location'])
+            desc_elem = _first(article, layout['description'])
+            date_elem = _first(article, layout['date'])
+
+            job = {
+                'title': title,
+                'company': company_elem.get_text().strip() if company_elem else "Confidencial",
+                'location': loc_elem.get_text().strip() if loc_elem else location,
+                'url': link,
+                'description': desc_elem.get_text().strip() if desc_elem else "",
+                'date_posted': date_elem.get_text().strip() if date_elem else "",
+                'source': 'Computrabajo',
+                'logo': '' # Hard to get without loading details page
+            }
+            results.append(job)
+
+        except Exception as e:
+            # print(f"Error parsing job: {e}")
+            continue
+
+    return results
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Incremental Computrabajo crawl (only new offers are printed).")
+    parser.add_argument("query")
+    parser.add_argument("--location", default="")
+    parser.add_argument("--pages", type=int, default=None)
+    args = parser.parse_args()
+
+    for job in crawl_computrabajo(args.query, args.location, max_pages=args.pages):
+        print(f"{job['title']} | {job['company']} | {job['url']}")
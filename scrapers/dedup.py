@@ -0,0 +1,156 @@
+import os
+import re
+import unicodedata
+import hashlib
+import struct
+
+_MAX_HASH = (1 << 32) - 1
+_unpack_block = struct.Struct('<16I').unpack
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+NEAR_DUP_THRESHOLD = float(os.environ.get('NEAR_DUP_THRESHOLD', 0.7))
+
+
+def _tokens(text):
+    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('utf-8').lower()
+    return TOKEN_RE.findall(text)
+
+
+def company_key(job):
+    """Normalized company name; only jobs with the same one are compared."""
+    return " ".join(_tokens(str(job.get('company') or "")))
+
+
+def job_text(job):
+    """Text compared within a company block: title, location and description."""
+    return " ".join(str(job.get(f) or "") for f in ("title", "location", "description"))
+
+
+def shingles(text, k=2):
+    """Word k-grams (as bytes) of the normalized text (unigrams for very short texts)."""
+    tokens = _tokens(text)
+    if len(tokens) < k:
+        grams = tokens
+    else:
+        grams = [" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)]
+    return {g.encode('utf-8') for g in grams}
+
+
+class MinHasher:
+    """
+    MinHash signatures with `num_perm` hash functions, split into `bands` LSH
+    bands. Two jobs become candidates when any band matches exactly; with the
+    defaults (32 hashes, 8 bands of 4 rows) pairs above ~0.6 Jaccard collide
+    with high probability while dissimilar pairs almost never do.
+
+    One salted 64-byte blake2b digest yields 16 independent 32-bit hashes, so
+    a shingle costs num_perm / 16 digest calls and the per-slot minimum is
+    taken in C with map(min, zip(...)).
+    """
+
+    def __init__(self, num_perm=32, bands=8, seed=1):
+        if num_perm % 16:
+            raise ValueError("num_perm must be a multiple of 16")
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._salts = [f"{seed}:{i}".encode('utf-8') for i in range(num_perm // 16)]
+
+    def _hashes(self, shingle):
+        values = ()
+        for salt in self._salts:
+            values += _unpack_block(hashlib.blake2b(shingle, digest_size=64, salt=salt).digest())
+        return values
+
+    def signature(self, shingle_set):
+        if not shingle_set:
+            return (_MAX_HASH,) * self.num_perm
+        return tuple(map(min, zip(*[self._hashes(s) for s in shingle_set])))
+
+    def band_keys(self, signature):
+        return [(i, signature[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+_default_hasher = MinHasher()
+
+
+def find_near_duplicates(jobs, threshold=NEAR_DUP_THRESHOLD, hasher=None):
+    """
+    Groups jobs of the same company (company_key) whose estimated Jaccard
+    similarity is >= threshold. Only pairs sharing an LSH bucket are
+    compared, and buckets are per company, so cost grows with the number of
+    bucket collisions, not with len(jobs) ** 2. Returns a list of index
+    groups in first-seen order.
+    """
+    hasher = hasher or _default_hasher
+    signatures = [hasher.signature(shingles(job_text(job))) for job in jobs]
+    companies = [company_key(job) for job in jobs]
+
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    compared = set()
+    for i, sig in enumerate(signatures):
+        for band in hasher.band_keys(sig):
+            key = (companies[i], band)
+            for j in buckets.get(key, ()):
+                if (j, i) in compared:
+                    continue
+                compared.add((j, i))
+                if find(i) != find(j) and hasher.similarity(signatures[i], sig) >= threshold:
+                    parent[max(find(i), find(j))] = min(find(i), find(j))
+            buckets.setdefault(key, []).append(i)
+
+    groups = {}
+    for i in range(len(jobs)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values(), key=lambda g: g[0])
+
+
+def merge_group(jobs):
+    """
+    Collapses near-duplicate jobs into one canonical record: the first job,
+    with the longest description, the union of tags and every source URL.
+    """
+    canonical = dict(jobs[0])
+    canonical['description'] = max((j.get('description') or "" for j in jobs), key=len)
+
+    tags = []
+    for job in jobs:
+        for tag in job.get('tags') or []:
+            if tag not in tags:
+                tags.append(tag)
+    if tags or 'tags' in canonical:
+        canonical['tags'] = tags
+
+    urls, sources = [], []
+    for job in jobs:
+        for url in job.get('urls') or [job.get('url')]:
+            if url and url not in urls:
+                urls.append(url)
+        for source in job.get('sources') or [job.get('source')]:
+            if source and source not in sources:
+                sources.append(source)
+    canonical['urls'] = urls
+    canonical['sources'] = sources
+    return canonical
+
+
+def collapse_near_duplicates(jobs, threshold=NEAR_DUP_THRESHOLD, hasher=None):
+    """Returns jobs with near-duplicates merged (see merge_group), keeping first-seen order."""
+    if len(jobs) < 2:
+        return [merge_group([job]) for job in jobs]
+    return [merge_group([jobs[i] for i in group]) for group in find_near_duplicates(jobs, threshold, hasher)]
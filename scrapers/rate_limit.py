@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+import urllib.parse
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens are added per second up to `capacity`.
+    acquire() blocks the calling thread until a token is available.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens without waiting. Returns 0 on success, else seconds until they are available."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1, timeout=None):
+        """Wait for tokens. Returns False if `timeout` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created lazily, so each job board gets its own budget."""
+
+    def __init__(self, rate=1.0, capacity=3, overrides=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.overrides = overrides or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url_or_host):
+        parsed = urllib.parse.urlparse(url_or_host)
+        return (parsed.hostname or url_or_host).lower()
+
+    def bucket(self, url_or_host):
+        host = self.host_of(url_or_host)
+        with self._lock:
+            if host not in self._buckets:
+                rate, capacity = self.overrides.get(host, (self.rate, self.capacity))
+                self._buckets[host] = TokenBucket(rate, capacity)
+            return self._buckets[host]
+
+    def acquire(self, url_or_host, timeout=None):
+        return self.bucket(url_or_host).acquire(timeout=timeout)
+
+
+# Shared limiter for all scrapers.
+# SCRAPER_RATE_LIMIT: requests per second per host. SCRAPER_BURST: bucket size.
+rate_limiter = HostRateLimiter(
+    rate=float(os.environ.get('SCRAPER_RATE_LIMIT', 1.0)),
+    capacity=int(os.environ.get('SCRAPER_BURST', 3)),
+)
@@ -0,0 +1,88 @@
+import os
+import threading
+
+# Common job schema shared by every source
+JOB_FIELDS = ['title', 'company', 'location', 'url', 'description', 'tags', 'date_posted', 'source', 'logo']
+
+
+def normalize_job(job, source_name=""):
+    """Maps a source-specific job dict onto JOB_FIELDS (missing fields become '' or [])."""
+    normalized = {}
+    for field in JOB_FIELDS:
+        value = job.get(field)
+        if field == 'tags':
+            normalized[field] = [str(t).strip() for t in (value or []) if str(t).strip()]
+        else:
+            normalized[field] = str(value).strip() if value is not None else ""
+    if not normalized['source']:
+        normalized['source'] = source_name
+    # Keep extra keys (e.g. match_score) that callers may have attached
+    for key, value in job.items():
+        normalized.setdefault(key, value)
+    return normalized
+
+
+class JobSource:
+    def __init__(self, name, fetch, timeout=15, enabled=True, workers=None):
+        self.name = name
+        self.fetch = fetch
+        self.timeout = timeout
+        self.enabled = enabled
+        # Concurrent fetches of this source (None: the aggregator's default)
+        self.workers = workers
+
+    def __repr__(self):
+        return f"<JobSource {self.name} timeout={self.timeout}s enabled={self.enabled}>"
+
+
+_sources = {}
+_lock = threading.Lock()
+_builtins_loaded = False
+
+
+def register_source(name, fetch, timeout=15, enabled=True, workers=None):
+    """
+    Registers a job source. `fetch(query, location)` must return a list of job dicts;
+    they are normalized with normalize_job(), so partial dicts are fine. Each
+    source runs on its own pool of `workers` threads, so a slow one cannot
+    hold up the others.
+    """
+    with _lock:
+        _sources[name] = JobSource(name, fetch, timeout=timeout, enabled=enabled, workers=workers)
+    return _sources[name]
+
+
+def unregister_source(name):
+    with _lock:
+        _sources.pop(name, None)
+
+
+def _load_builtin_sources():
+    global _builtins_loaded
+    if _builtins_loaded:
+        return
+    _builtins_loaded = True
+
+    # Imported here: scraper.py itself imports from this package
+    from scraper import scrape_jobs
+    from scrapers.computrabajo import scrape_computrabajo
+
+    enabled = os.environ.get('JOB_SOURCES')
+    enabled = {n.strip() for n in enabled.split(',')} if enabled else None
+
+    # Computrabajo may need a Playwright render per search: few at a time
+    for name, fetch, timeout, workers in [
+        ("remoteok", scrape_jobs, 15, None),
+        ("computrabajo", scrape_computrabajo, 45, int(os.environ.get('COMPUTRABAJO_WORKERS', 2))),
+    ]:
+        if name not in _sources:
+            register_source(name, fetch, timeout=timeout, enabled=enabled is None or name in enabled, workers=workers)
+
+
+def get_sources(names=None):
+    """Returns the requested sources (by name) or every enabled source."""
+    _load_builtin_sources()
+    with _lock:
+        if names:
+            return [_sources[n] for n in names if n in _sources]
+        return [s for s in _sources.values() if s.enabled]
@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import numpy as np
+
+from skills.content_analysis import ContentAnalysisSkill, NON_ALNUM_RE, STOP_WORDS
+from skills.keyword_cache import content_key, keyword_cache
+
+# Record separator: whitespace for str.split(), never produced by the keyword regex
+_SEP = "\x1e"
+
+
+class BatchATSScorer:
+    """
+    Ranks many job descriptions against one resume.
+
+    Keyword Counters come from the shared keyword cache; descriptions not
+    cached yet are cleaned with a single lower()/regex pass over all of them
+    and stored. The Counters are packed into a CSR term matrix (indptr /
+    indices / counts over a shared vocabulary) so matched and total weight
+    for every job come from two np.bincount calls. Matched / missing keyword
+    lists are only built for the rows that are returned.
+
+    Scores are identical to ContentAnalysisSkill.calculated_ats_score.
+    """
+
+    def __init__(self, resume_text: str, cache=keyword_cache):
+        self.cache = cache
+        self.resume_terms = set(ContentAnalysisSkill.keyword_counts(resume_text))
+
+    @staticmethod
+    def tokenize_many(job_descriptions: list) -> list:
+        """Keyword Counters for several texts, same rules as extract_keywords."""
+        # Joined by a record separator so one regex call covers every text;
+        # str.split() treats the separator as whitespace, as extract_keywords would
+        joined = _SEP.join((text or "").replace(_SEP, " ") for text in job_descriptions).lower()
+        counters = []
+        for doc in NON_ALNUM_RE.sub('', joined).split(_SEP):
+            counter = Counter(doc.split())
+            for word in [w for w in counter if len(w) <= 3 or w in STOP_WORDS]:
+                del counter[word]
+            counters.append(counter)
+        return counters
+
+    def keyword_counts(self, job_descriptions: list) -> list:
+        """Cached Counters for every description, tokenizing the misses in one batch."""
+        keys = [content_key(text) for text in job_descriptions]
+        counters = [self.cache.get(key) for key in keys]
+        misses = [i for i, counter in enumerate(counters) if counter is None]
+        if misses:
+            for i, counter in zip(misses, self.tokenize_many([job_descriptions[i] for i in misses])):
+                counters[i] = counter
+                self.cache.set(keys[i], counter)
+        return counters
+
+    @staticmethod
+    def build_matrix(counters: list):
+        """Returns (terms, indptr, indices, counts) for a list of keyword Counters."""
+        terms = list(dict.fromkeys(chain.from_iterable(counters)))
+        vocab = dict(zip(terms, range(len(terms))))
+
+        indptr = np.zeros(len(counters) + 1, dtype=np.int64)
+        np.cumsum([len(counter) for counter in counters], out=indptr[1:])
+        nnz = int(indptr[-1])
+        indices = np.fromiter(map(vocab.__getitem__, chain.from_iterable(counters)), dtype=np.int64, count=nnz)
+        counts = np.fromiter(chain.from_iterable(c.values() for c in counters), dtype=np.float64, count=nnz)
+        return terms, indptr, indices, counts
+
+    def _details(self, counter) -> tuple:
+        """(matched, missing) for one Counter, as in calculated_ats_score."""
+        matched = [w for w in counter if w in self.resume_terms]
+        missing = sorted((w for w in counter if w not in self.resume_terms), key=counter.__getitem__, reverse=True)
+        return matched, missing[:10]
+
+    def score(self, job_descriptions: list, top_k: int = None) -> list:
+        """
+        Returns one dict per job: {"index", "score", "matched", "missing"}.
+        In input order, or, with top_k, the best k by score (ties keep input
+        order) selected with argpartition instead of a full sort.
+        """
+        n = len(job_descriptions)
+        if n == 0:
+            return []
+
+        counters = self.keyword_counts(job_descriptions)
+        terms, indptr, indices, counts = self.build_matrix(counters)
+        in_resume = np.fromiter((t in self.resume_terms for t in terms), dtype=bool, count=len(terms))
+
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        totals = np.bincount(rows, weights=counts, minlength=n)
+        points = np.bincount(rows, weights=counts * in_resume[indices], minlength=n)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(totals > 0, np.floor(points / totals * 100), 100).astype(np.int64)
+
+        if top_k is not None:
+            # Unique rank key: higher score first, then lower input index
+            key = (100 - scores) * n + np.arange(n)
+            k = max(0, min(top_k, n))
+            order = np.argpartition(key, k - 1)[:k] if 0 < k < n else np.arange(n)[:k]
+            order = order[np.argsort(key[order])]
+        else:
+            order = np.arange(n)
+
+        results = []
+        for i in order:
+            matched, missing = self._details(counters[i])
+            results.append({"index": int(i), "score": int(scores[i]), "matched": matched, "missing": missing})
+        return results
+
+
+def score_chunk(resume_text: str, job_descriptions: list, offset: int = 0):
+    """
+    Process-pool task: scores one chunk and returns (results, cpu_seconds).
+    Result indexes are shifted by offset so they refer to the whole batch.
+    """
+    start = time.process_time()
+    results = BatchATSScorer(resume_text).score(job_descriptions)
+    for result in results:
+        result["index"] += offset
+    return results, time.process_time() - start
+
+
+class ATSBatchRun:
+    """
+    One batch request on an ATSBatchPool. Iterating yields the result dicts in
+    input order as their chunks finish. Once the CPU time reported by the
+    finished chunks exceeds the budget, queued chunks are cancelled and the
+    remaining jobs are yielded as {"index", "error"}.
+
+    The budget is checked between chunks, so a run can overshoot it by up to
+    one chunk per worker.
+    """
+
+    def __init__(self, pool, resume_text, job_descriptions):
+        self.pool = pool
+        self.resume_text = resume_text or ""
+        self.job_descriptions = list(job_descriptions)
+        self.cpu_seconds = 0.0
+        self.budget_exceeded = False
+
+    def _chunks(self):
+        size = self.pool.chunk_size
+        return [(start, self.job_descriptions[start:start + size])
+                for start in range(0, len(self.job_descriptions), size)]
+
+    def _over_budget(self):
+        budget = self.pool.cpu_budget
+        return bool(budget) and self.cpu_seconds > budget
+
+    def _cut_off(self, start):
+        self.budget_exceeded = True
+        for index in range(start, len(self.job_descriptions)):
+            yield {"index": index, "error": "cpu budget exceeded"}
+
+    def __iter__(self):
+        chunks = self._chunks()
+        if len(chunks) <= 1 or self.pool.workers <= 1:
+            # Not worth the IPC: score in this process, chunk by chunk
+            for start, texts in chunks:
+                if self._over_budget():
+                    yield from self._cut_off(start)
+                    return
+                results, cpu = score_chunk(self.resume_text, texts, start)
+                self.cpu_seconds += cpu
+                yield from results
+            return
+
+        executor = self.pool.executor()
+        futures = [(start, executor.submit(score_chunk, self.resume_text, texts, start)) for start, texts in chunks]
+        try:
+            for position, (start, future) in enumerate(futures):
+                results, cpu = future.result()
+                self.cpu_seconds += cpu
+                yield from results
+                if self._over_budget() and position + 1 < len(futures):
+                    yield from self._cut_off(futures[position + 1][0])
+                    return
+        finally:
+            # Over budget or the consumer went away: drop chunks not started yet
+            for _, future in futures:
+                future.cancel()
+
+    def stats(self):
+        return {
+            "count": len(self.job_descriptions),
+            "cpu_ms": round(self.cpu_seconds * 1000, 1),
+            "budget_exceeded": self.budget_exceeded,
+        }
+
+
+class ATSBatchPool:
+    """
+    Scores large audit batches across a process pool (one worker per core by
+    default), in chunks of BatchATSScorer calls. The pool is created on first
+    use and shared by all requests.
+
+    Configured with ATS_BATCH_WORKERS, ATS_BATCH_CHUNK (jobs per task) and
+    ATS_BATCH_CPU_BUDGET (CPU seconds per request, 0 disables the limit).
+    """
+
+    def __init__(self, workers=None, chunk_size=None, cpu_budget=None):
+        self.workers = workers or int(os.environ.get('ATS_BATCH_WORKERS', 0)) or os.cpu_count() or 1
+        self.chunk_size = chunk_size or int(os.environ.get('ATS_BATCH_CHUNK', 250))
+        self.cpu_budget = float(os.environ.get('ATS_BATCH_CPU_BUDGET', 10)) if cpu_budget is None else cpu_budget
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def run(self, resume_text: str, job_descriptions: list) -> ATSBatchRun:
+        return ATSBatchRun(self, resume_text, job_descriptions)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# Shared pool used by the web app
+ats_pool = ATSBatchPool()
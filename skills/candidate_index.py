@@ -0,0 +1,178 @@
+import heapq
+import os
+import threading
+import time
+
+from skills.content_analysis import ContentAnalysisSkill
+
+
+def candidate_text(candidate):
+    """Resume text of a Candidate row: title, summary, skills, experiences and projects."""
+    parts = [candidate.professional_title, candidate.summary]
+    parts += [skill.name for skill in candidate.skills]
+    for exp in candidate.experiences:
+        parts += [exp.role, exp.description]
+    for project in candidate.projects:
+        parts += [project.name, project.description, project.technologies]
+    return " ".join(part for part in parts if part)
+
+
+def document_text(data):
+    """candidate_text() of a Candidate.template_data() dict (e.g. its stored document)."""
+    candidate = data.get("candidate") or {}
+    parts = [candidate.get("professional_title"), candidate.get("summary")]
+    parts += [skill.get("name") for skill in data.get("skills") or []]
+    for exp in data.get("experiences") or []:
+        parts += [exp.get("role"), exp.get("description")]
+    for project in data.get("projects") or []:
+        parts += [project.get("name"), project.get("description"), project.get("technologies")]
+    return " ".join(part for part in parts if part)
+
+
+class CandidateIndex:
+    """
+    Inverted index from keyword to the candidate ids whose resume contains it,
+    for the reverse match: given a job description, which stored candidates
+    fit best.
+
+    Scores are the same as ContentAnalysisSkill.calculated_ats_score(resume,
+    job), but only candidates sharing at least one keyword with the job are
+    touched: a query costs the size of the posting lists of the job's
+    keywords, not the number of candidates.
+    """
+
+    def __init__(self, ttl=None):
+        self._postings = {}  # keyword -> set of candidate ids
+        self._terms = {}     # candidate id -> set of keywords, to update/remove
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._built = threading.Event()
+        self.loaded = False
+        # Highest candidate id indexed; rows above it were written by other
+        # processes (or after load) and are picked up by catch_up()
+        self.synced_id = 0
+        self.loaded_at = 0.0
+        self.ttl = ttl if ttl is not None else float(os.environ.get('CANDIDATE_INDEX_TTL', 300))
+
+    @staticmethod
+    def _keywords(text):
+        return set(ContentAnalysisSkill.extract_keywords(text or ""))
+
+    def add(self, candidate_id, text):
+        """Indexes (or re-indexes) one candidate's resume text and moves synced_id past it."""
+        terms = self._keywords(text)
+        with self._lock:
+            self._discard(candidate_id)
+            self._terms[candidate_id] = terms
+            for term in terms:
+                self._postings.setdefault(term, set()).add(candidate_id)
+            self.synced_id = max(self.synced_id, candidate_id)
+
+    def remove(self, candidate_id):
+        with self._lock:
+            self._discard(candidate_id)
+
+    def _discard(self, candidate_id):
+        for term in self._terms.pop(candidate_id, ()):
+            ids = self._postings[term]
+            ids.discard(candidate_id)
+            if not ids:
+                del self._postings[term]
+
+    def load(self, candidates):
+        """
+        Rebuilds the index from Candidate rows. The new index is built on the
+        side and swapped in at once, so queries meanwhile see the old one.
+        """
+        postings, terms, synced_id = {}, {}, 0
+        try:
+            for candidate in candidates:
+                words = self._keywords(candidate_text(candidate))
+                terms[candidate.id] = words
+                for word in words:
+                    postings.setdefault(word, set()).add(candidate.id)
+                synced_id = max(synced_id, candidate.id)
+            with self._lock:
+                self._postings, self._terms = postings, terms
+                # Rows added to the old index during the scan are above this
+                # id (or were scanned), so catch_up() brings them back
+                self.synced_id = synced_id
+                self.loaded = True
+                self.loaded_at = time.monotonic()
+            self._built.set()
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def catch_up(self, candidates):
+        """Indexes Candidate rows newer than synced_id (e.g. submitted to another worker)."""
+        for candidate in candidates:
+            self.add(candidate.id, candidate_text(candidate))
+
+    def refresh(self, all_rows, rows_after, wait=30):
+        """
+        Brings the index up to date before a query. When stale, one caller
+        rebuilds it from all_rows() while the others keep using the current
+        index (or, before the first build, wait up to `wait` seconds for it);
+        otherwise it is extended with rows_after(synced_id).
+        """
+        if self.stale() and self._claim_rebuild():
+            self.load(all_rows())
+        elif self._built.wait(wait):
+            self.catch_up(rows_after(self.synced_id))
+
+    def _claim_rebuild(self):
+        with self._lock:
+            if self._rebuilding:
+                return False
+            self._rebuilding = True
+            return True
+
+    def stale(self):
+        """
+        True when the index must be rebuilt: not loaded yet, or older than ttl
+        seconds (catch_up() only sees new ids, not edits or deletions, nor ids
+        committed out of order by concurrent writers).
+        """
+        return not self.loaded or time.monotonic() - self.loaded_at > self.ttl
+
+    def clear(self):
+        with self._lock:
+            self._postings = {}
+            self._terms = {}
+            self.loaded = False
+            self.synced_id = 0
+            self._built.clear()
+
+    def top_k(self, job_description, k=10):
+        """
+        Returns up to k dicts {"candidate_id", "score", "matched"}, best first
+        (ties: lower id first). Candidates without any matching keyword are
+        left out, as is everything when the job has no keywords.
+        """
+        job_counter = ContentAnalysisSkill.keyword_counts(job_description)
+        total_weight = sum(job_counter.values())
+        if total_weight == 0 or k <= 0:
+            return []
+
+        points = {}
+        with self._lock:
+            for term, count in job_counter.items():
+                for candidate_id in self._postings.get(term, ()):
+                    points[candidate_id] = points.get(candidate_id, 0) + count
+            best = heapq.nsmallest(k, points.items(), key=lambda item: (-item[1], item[0]))
+            return [
+                {
+                    "candidate_id": candidate_id,
+                    "score": int((score_points / total_weight) * 100),
+                    "matched": [w for w in job_counter if w in self._terms[candidate_id]],
+                }
+                for candidate_id, score_points in best
+            ]
+
+    def __len__(self):
+        return len(self._terms)
+
+
+# Shared instance, filled lazily from the database by the web app
+candidate_index = CandidateIndex()
@@ -2,6 +2,16 @@
 import re
 from collections import Counter
 
+from skills.keyword_cache import keyword_cache
+
+NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+STOP_WORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "your", "will",
+    "have", "work", "team", "experience", "skill", "year", "role", "knowledge",
+    "proficiency", "ability", "strong", "excellent", "proven", "track", "record"
+})
+
 class ContentAnalysisSkill:
     """
     Skill for analyzing text content (ATS Simulation).
@@ -15,18 +25,20 @@ class ContentAnalysisSkill:
         """
         text = text.lower()
         # Remove special chars
-        text = re.sub(r'[^a-z0-9\s]', '', text)
+        text = NON_ALNUM_RE.sub('', text)
         words = text.split()
-        
-        stop_words = {
-            "the", "and", "for", "with", "that", "this", "from", "your", "will", 
-            "have", "work", "team", "experience", "skill", "year", "role", "knowledge",
-            "proficiency", "ability", "strong", "excellent", "proven", "track", "record"
-        }
-        
-        keywords = [w for w in words if len(w) > 3 and w not in stop_words]
+
+        keywords = [w for w in words if len(w) > 3 and w not in STOP_WORDS]
         return keywords
 
+    @staticmethod
+    def keyword_counts(text: str) -> Counter:
+        """
+        Counter of extract_keywords(text), memoized by content hash in
+        skills/keyword_cache.py. The Counter is shared: do not modify it.
+        """
+        return keyword_cache.get_or_compute(text or "", lambda t: Counter(ContentAnalysisSkill.extract_keywords(t)))
+
     @staticmethod
     def calculated_ats_score(resume_text: str, job_description: str) -> dict:
         """
@@ -36,11 +48,8 @@ class ContentAnalysisSkill:
             - missing_keywords (list)
             - matched_keywords (list)
         """
-        job_keywords = ContentAnalysisSkill.extract_keywords(job_description)
-        resume_keywords = ContentAnalysisSkill.extract_keywords(resume_text)
-        
-        job_counter = Counter(job_keywords)
-        resume_counter = Counter(resume_keywords)
+        job_counter = ContentAnalysisSkill.keyword_counts(job_description)
+        resume_counter = ContentAnalysisSkill.keyword_counts(resume_text)
         
         # Calculate overlap
         matched = []
@@ -69,3 +78,12 @@ class ContentAnalysisSkill:
             "missing": missing_sorted[:10], # Top 10 missing
             "matched": matched
         }
+
+    @staticmethod
+    def batch_ats_scores(resume_text: str, job_descriptions: list, top_k: int = None) -> list:
+        """
+        Scores one resume against many job descriptions at once.
+        Same scoring as calculated_ats_score; see skills/ats_batch.py.
+        """
+        from skills.ats_batch import BatchATSScorer
+        return BatchATSScorer(resume_text).score(job_descriptions, top_k=top_k)
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
+def content_key(text):
+    """Digest of the raw text; identical descriptions share one entry whatever their source."""
+    return hashlib.blake2b((text or "").encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+# Per keyword: str object header plus a small int count
+_ENTRY_OVERHEAD = sys.getsizeof("") + sys.getsizeof(1)
+
+
+def estimate_size(counter):
+    """Rough footprint in bytes of a keyword Counter (container + ASCII key strings + counts)."""
+    return sys.getsizeof(counter) + sum(map(len, counter)) + _ENTRY_OVERHEAD * len(counter)
+
+
+class KeywordCache:
+    """
+    LRU cache of tokenized keyword Counters keyed on the content hash of the text.
+
+    Evicts least recently used entries once either `max_entries` or
+    `max_bytes` (estimated, see estimate_size) is exceeded. Cached Counters
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=4096, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def set(self, key, counter):
+        size = estimate_size(counter)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (counter, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def get_or_compute(self, text, compute):
+        """Returns the cached Counter for text, or compute(text) stored under its content hash."""
+        key = content_key(text)
+        counter = self.get(key)
+        if counter is None:
+            counter = compute(text)
+            self.set(key, counter)
+        return counter
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._data)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Shared instance used by ContentAnalysisSkill and the batch scorer.
+# KEYWORD_CACHE_MAX_ENTRIES / KEYWORD_CACHE_MAX_MB size it; 0 entries disables it.
+keyword_cache = KeywordCache(
+    max_entries=int(os.environ.get('KEYWORD_CACHE_MAX_ENTRIES', 4096)),
+    max_bytes=int(float(os.environ.get('KEYWORD_CACHE_MAX_MB', 32)) * 1024 * 1024),
+)
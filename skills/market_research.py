@@ -1,6 +1,6 @@
 
 from agents.base import BaseAgent
-from scrapers.computrabajo import scrape_computrabajo
+from scrapers.aggregator import aggregator
 
 class MarketResearchSkill:
     """Skill capability for Market Research (Job Searching)"""
@@ -8,7 +8,11 @@ class MarketResearchSkill:
     @staticmethod
     def search_jobs(query: str, location: str = "") -> list:
         """
-        Searches for jobs using the underlying scraper.
+        Searches for jobs across every enabled source (see scrapers/registry.py).
         """
-        print(f"[Skill:MarketResearch] Searching for '{query}' in '{location}' via Computrabajo...")
-        return scrape_computrabajo(query, location)
+        print(f"[Skill:MarketResearch] Searching for '{query}' in '{location}'...")
+        jobs, summary = aggregator.search(query, location)
+        for name, info in summary.items():
+            if info["error"]:
+                print(f"[Skill:MarketResearch] Source {name} failed: {info['error']}")
+        return jobs
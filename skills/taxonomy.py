@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+import unicodedata
+from array import array
+from collections import deque
+from pathlib import Path
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent / "skill_taxonomy.json"
+
+
+def normalize_term(text):
+    """Lowercase, accent-free, single-spaced; keeps symbols such as '#', '+' and '.' (c#, c++, node.js)."""
+    text = unicodedata.normalize('NFKD', text or "").encode('ASCII', 'ignore').decode('utf-8')
+    return " ".join(text.lower().split())
+
+
+class PatternAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of patterns. finditer() scans a
+    text once and reports every occurrence of every pattern, so matching cost
+    depends on the text length and the number of matches, not on how many
+    patterns there are.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern, value in patterns:
+            self._insert(pattern, value)
+        self._build()
+
+    def _insert(self, pattern, value):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), value))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text):
+        """Yields (start, end, value) for every pattern occurrence, in order of end position."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in out[state]:
+                yield i + 1 - length, i + 1, value
+
+
+def _csr(lists):
+    """Packs a list of int lists into (indptr, indices) arrays."""
+    indptr, indices = array('i', [0]), array('i')
+    for items in lists:
+        indices.extend(items)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+class SkillTaxonomy:
+    """
+    Skill / role graph loaded from JSON (see skills/skill_taxonomy.json):
+    every entry has optional `aliases`, `parents` and `related` lists, and
+    roles may list `requires` groups ({"any": [...], "advice": "..."}).
+
+    At load time each term gets an integer id and the transitive closures
+    (ancestors, descendants, and the expansion list: related terms followed by
+    descendants) are packed into CSR arrays. Titles and queries are matched
+    with one Aho-Corasick pass over all names and aliases, so a lookup costs
+    O(text + matches) however large the taxonomy is.
+    """
+
+    def __init__(self, data):
+        entries = {}
+        for kind in ("skills", "roles"):
+            for name, entry in (data.get(kind) or {}).items():
+                entries[normalize_term(name)] = entry or {}
+
+        self.names = list(entries)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+        def resolve(names):
+            return [self.ids[n] for n in map(normalize_term, names or []) if n in self.ids]
+
+        parents = [resolve(entry.get("parents")) for entry in entries.values()]
+        children = [[] for _ in self.names]
+        for child, ids in enumerate(parents):
+            for parent in ids:
+                children[parent].append(child)
+
+        ancestors = [self._closure(i, parents) for i in range(len(self.names))]
+        descendants = [self._closure(i, children) for i in range(len(self.names))]
+        expansions = []
+        for i, entry in enumerate(entries.values()):
+            ordered = dict.fromkeys(resolve(entry.get("related")) + descendants[i])
+            ordered.pop(i, None)
+            expansions.append(list(ordered))
+
+        self._ancestors = _csr(ancestors)
+        self._descendants = _csr(descendants)
+        self._expansions = _csr(expansions)
+
+        # Role id -> [(frozenset of acceptable skill ids, advice)]
+        self.requirements = {}
+        for i, entry in enumerate(entries.values()):
+            for group in entry.get("requires") or []:
+                self.requirements.setdefault(i, []).append((frozenset(resolve(group.get("any"))), group.get("advice", "")))
+
+        patterns = [(name, i) for name, i in self.ids.items()]
+        for i, entry in enumerate(entries.values()):
+            patterns += [(normalize_term(alias), i) for alias in entry.get("aliases") or []]
+        self._automaton = PatternAutomaton(p for p in patterns if p[0])
+
+    @staticmethod
+    def _closure(start, edges):
+        """Nodes reachable from start (excluded), breadth-first."""
+        seen = {start: None}
+        queue = deque(edges[start])
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen[node] = None
+            queue.extend(edges[node])
+        del seen[start]
+        return list(seen)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _slice(csr, term_id):
+        indptr, indices = csr
+        return indices[indptr[term_id]:indptr[term_id + 1]]
+
+    def ancestors(self, term_id):
+        return self._slice(self._ancestors, term_id)
+
+    def descendants(self, term_id):
+        return self._slice(self._descendants, term_id)
+
+    def match(self, text):
+        """
+        Ids of the taxonomy terms mentioned in text, in order of appearance.
+        Whole words only, leftmost-longest: "data scientist" is one mention,
+        not also "data".
+        """
+        text = normalize_term(text)
+        spans = [
+            (start, -end, term_id) for start, end, term_id in self._automaton.finditer(text)
+            if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+        ]
+        found, last_end = {}, 0
+        for start, neg_end, term_id in sorted(spans):
+            if start >= last_end:
+                found.setdefault(term_id, None)
+                last_end = -neg_end
+        return list(found)
+
+    def expand(self, text):
+        """Related and narrower terms for everything mentioned in text, excluding the mentions themselves."""
+        matched = self.match(text)
+        terms = {}
+        for term_id in matched:
+            for other in self._slice(self._expansions, term_id):
+                terms.setdefault(other, None)
+        for term_id in matched:
+            terms.pop(term_id, None)
+        return [self.names[i] for i in terms]
+
+    def gaps(self, title, skills):
+        """
+        Advice for every requirement group of the roles in title (and their
+        parent roles) that none of the skills satisfies. A skill satisfies a
+        group through itself or any of its ancestors (next.js counts as react).
+        """
+        covered = set()
+        for skill in skills:
+            for term_id in self.match(skill or ""):
+                covered.add(term_id)
+                covered.update(self.ancestors(term_id))
+
+        advice = []
+        for role in self.match(title):
+            for term_id in (role, *self.ancestors(role)):
+                for group, text in self.requirements.get(term_id, ()):
+                    if group.isdisjoint(covered) and text not in advice:
+                        advice.append(text)
+        return advice
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy():
+    """Shared taxonomy, loaded once from SKILL_TAXONOMY_PATH (defaults to skills/skill_taxonomy.json)."""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = SkillTaxonomy.from_file(os.environ.get('SKILL_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH)
+        return _taxonomy
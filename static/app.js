@@ -225,6 +225,52 @@ function showStep(step) {
   }
 }
 
+function renderJobCard(job) {
+  const card = document.createElement('div');
+  card.className = 'item';
+  card.innerHTML = `
+            <div class="item-header">
+                <strong>${job.title}</strong>
+                <span class="text-muted" style="font-size: 0.85rem">${job.company}</span>
+            </div>
+            <div style="font-size: 0.9rem; margin-bottom: 8px;">
+                ${job.location} | ${new Date(job.date_posted).toLocaleDateString()}
+            </div>
+            <div class="actions" style="justify-content: flex-end; gap: 8px;">
+                <a href="${job.url}" target="_blank" class="btn ghost" style="font-size: 0.8rem">Ver Original</a>
+                <button class="btn primary small apply-btn" data-url="${job.url}">Aplicar con CV</button>
+            </div>
+        `;
+
+  // Attach apply listener
+  card.querySelector('.apply-btn').addEventListener('click', () => applyJob(job));
+  return card;
+}
+
+// Reads an NDJSON response line by line, calling onRecord for each parsed object
+async function readNdjson(res, onRecord) {
+  if (!res.body || !res.body.getReader) {
+    (await res.text()).split("\n").filter(Boolean).forEach(line => onRecord(JSON.parse(line)));
+    return;
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.filter(Boolean).forEach(line => onRecord(JSON.parse(line)));
+  }
+
+  if (buffer.trim()) onRecord(JSON.parse(buffer));
+}
+
 async function searchJobs() {
   const query = document.getElementById("job-query").value;
   const location = document.getElementById("job-location").value;
@@ -232,37 +278,37 @@ async function searchJobs() {
 
   resultsContainer.innerHTML = '<p class="text-center">Buscando...</p>';
 
-  try {
-    const res = await fetch(`/api/search?q=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}`);
-    const jobs = await res.json();
-
-    resultsContainer.innerHTML = '';
-
-    if (jobs.length === 0) {
-      resultsContainer.innerHTML = '<p class="text-center text-muted">No se encontraron ofertas.</p>';
-      return;
-    }
+  const status = resultsContainer.firstElementChild;
+  const seenUrls = new Set();
+  let rendered = 0;
 
-    jobs.forEach(job => {
-      const card = document.createElement('div');
-      card.className = 'item';
-      card.innerHTML = `
-                <div class="item-header">
-                    <strong>${job.title}</strong>
-                    <span class="text-muted" style="font-size: 0.85rem">${job.company}</span>
-                </div>
-                <div style="font-size: 0.9rem; margin-bottom: 8px;">
-                    ${job.location} | ${new Date(job.date_posted).toLocaleDateString()}
-                </div>
-                <div class="actions" style="justify-content: flex-end; gap: 8px;">
-                    <a href="${job.url}" target="_blank" class="btn ghost" style="font-size: 0.8rem">Ver Original</a>
-                    <button class="btn primary small apply-btn" data-url="${job.url}">Aplicar con CV</button>
-                </div>
-            `;
-
-      // Attach apply listener
-      card.querySelector('.apply-btn').addEventListener('click', () => applyJob(job));
-      resultsContainer.appendChild(card);
+  try {
+    const res = await fetch(`/api/search/stream?q=${encodeURIComponent(query)}&location=${encodeURIComponent(location)}`);
+
+    await readNdjson(res, (record) => {
+      if (record.type === 'batch') {
+        record.jobs.forEach(job => {
+          if (seenUrls.has(job.url)) return;
+          seenUrls.add(job.url);
+          resultsContainer.appendChild(renderJobCard(job));
+          rendered++;
+        });
+        status.textContent = `Buscando... ${rendered} ofertas encontradas`;
+      } else if (record.type === 'summary') {
+        const failed = Object.entries(record.sources)
+          .filter(([, info]) => info.error)
+          .map(([name]) => name);
+        status.remove();
+        if (rendered === 0) {
+          resultsContainer.innerHTML = '<p class="text-center text-muted">No se encontraron ofertas.</p>';
+        }
+        if (failed.length) {
+          const warning = document.createElement('p');
+          warning.className = 'text-center text-muted';
+          warning.textContent = `Algunas fuentes no respondieron: ${failed.join(', ')}`;
+          resultsContainer.appendChild(warning);
+        }
+      }
     });
 
   } catch (e) {
@@ -1,22 +1,56 @@
-
 import os
 import tempfile
+
+# The app binds its database when it is imported, so point it at a
+# throwaway file before anything imports app (instead of data/cv.db)
+_db_dir = tempfile.mkdtemp(prefix="jobassistant-tests-")
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_db_dir, 'cv.db')}"
+os.environ['PDF_CACHE_DIR'] = os.path.join(_db_dir, 'pdf_cache')
+
+import sys
+
 import pytest
 from app import app
 from models import db
+from pdf_cache import PDFCache
+from scrapers.cache import job_cache
+from skills.candidate_index import candidate_index
+
+SAMPLE_CV = {
+    "candidate": {"full_name": "Ana", "email": "ana@example.com", "professional_title": "Developer", "phone": "",
+                  "location": "", "linkedin": "", "github": "", "portfolio": "", "summary": ""},
+    "experiences": [], "educations": [], "skills": [{"name": "Python", "level": "Expert"}],
+    "languages": [], "certifications": [], "projects": [], "links": [],
+}
+
 
 @pytest.fixture
-def client():
-    # Create a temporary file to use as a database
-    db_fd, db_path = tempfile.mkstemp()
+def sample_cv():
+    """Builds minimal template data for a candidate called `name`."""
+    def make(name="Ana"):
+        return dict(SAMPLE_CV, candidate=dict(SAMPLE_CV["candidate"], full_name=name))
+    return make
+
+
+@pytest.fixture
+def app_pdf_cache(tmp_path, monkeypatch):
+    """Per-test PDF cache for the app, so downloads never write to the shared one."""
+    cache = PDFCache(tmp_path / "pdf_cache")
+    monkeypatch.setattr(sys.modules['app'], 'pdf_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def client(app_pdf_cache):
     app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{db_path}"
 
+    # Every test starts from empty tables
     with app.app_context():
+        db.session.remove()
+        db.drop_all()
         db.create_all()
+    job_cache.clear()
+    candidate_index.clear()
 
     with app.test_client() as client:
         yield client
-
-    os.close(db_fd)
-    os.unlink(db_path)
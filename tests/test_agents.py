@@ -0,0 +1,49 @@
+import threading
+import time
+from agents.job_scout import JobScout
+
+
+def test_job_scout_runs_terms_concurrently_and_dedupes():
+    scout = JobScout()
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_search(query, location=""):
+        with lock:
+            active.append(query)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(query)
+        return [
+            {"title": "Shared posting", "company": "Shared", "url": "http://shared"},
+            {"title": f"{query} dev", "company": f"{query} co", "url": f"http://{query}"},
+        ]
+
+    scout.add_tool("search_jobs", fake_search)
+    jobs = scout.run("python")
+
+    urls = [job["url"] for job in jobs]
+    assert len(urls) == len(set(urls)) == 4
+    assert max(peak) > 1
+
+
+def test_job_scout_ranks_with_one_batch_call():
+    scout = JobScout()
+    scout.add_tool("search_jobs", lambda query, location="": [
+        {"title": "Frontend", "company": "A", "url": "http://a", "description": "react typescript css"},
+        {"title": "Backend", "company": "B", "url": "http://b", "description": "python django postgres"},
+        {"title": "Data", "company": "C", "url": "http://c", "description": "python pandas spark"},
+    ])
+    calls = []
+    original = scout.tools["rank_matches"]
+    scout.add_tool("rank_matches", lambda **kwargs: calls.append(kwargs) or original(**kwargs))
+    scout.add_tool("analyze_match", None)
+
+    profile = {"professional_title": "Backend Developer", "skills": [{"name": "Python"}, {"name": "Django"}]}
+    jobs = scout.run("golang", profile_data=profile)
+
+    assert len(calls) == 1
+    assert [job["url"] for job in jobs] == ["http://b", "http://c", "http://a"]
+    assert [job["match_score"] for job in jobs] == [66, 33, 0]
@@ -0,0 +1,90 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from scrapers import registry
+from scrapers.aggregator import JobAggregator, dedupe_jobs
+from scrapers.cache import JobCache
+from scrapers.registry import normalize_job, JOB_FIELDS
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    monkeypatch.setattr(registry, "_sources", {})
+    monkeypatch.setattr(registry, "_builtins_loaded", True)
+    return registry
+
+
+def test_normalize_job_fills_common_schema():
+    job = normalize_job({"title": " Dev ", "url": "http://a", "match_score": 80}, "remoteok")
+    assert set(JOB_FIELDS) <= set(job)
+    assert job["title"] == "Dev"
+    assert job["tags"] == [] and job["description"] == ""
+    assert job["source"] == "remoteok"
+    assert job["match_score"] == 80
+
+
+def test_dedupe_by_url_and_title_company():
+    jobs = [
+        {"url": "http://a/", "title": "x", "company": "c"},
+        {"url": "http://A", "title": "y", "company": "c"},
+        {"url": "#", "title": "Dev", "company": "Co"},
+        {"url": "", "title": "dev", "company": "co"},
+    ]
+    assert len(dedupe_jobs(jobs)) == 2
+
+
+def test_aggregator_parallel_with_timeout(sources):
+    def slow(query, location):
+        time.sleep(0.5)
+        return [{"title": "late", "url": "http://late"}]
+
+    sources.register_source("fast", lambda q, l: [{"title": "Dev", "url": "http://a"}])
+    sources.register_source("slow", slow, timeout=0.1)
+    sources.register_source("disabled", lambda q, l: [{"title": "X", "url": "http://x"}], enabled=False)
+
+    aggregator = JobAggregator(cache=JobCache(ttl=60))
+    start = time.perf_counter()
+    jobs, summary = aggregator.search("python")
+
+    assert time.perf_counter() - start < 0.4
+    assert [j["url"] for j in jobs] == ["http://a"]
+    assert set(summary) == {"fast", "slow"}
+    assert summary["slow"]["error"].startswith("timeout")
+
+
+def test_timeout_counts_from_when_the_source_runs(sources):
+    def slow(query, location):
+        time.sleep(0.2)
+        return [{"title": query, "url": f"http://{query}"}]
+
+    sources.register_source("slow", slow, timeout=0.3, workers=1)
+    aggregator = JobAggregator(cache=JobCache(ttl=60))
+
+    # The second search waits ~0.2s for the only worker, then runs for 0.2s:
+    # past 0.3s since it was submitted, but within its timeout once running
+    with ThreadPoolExecutor(max_workers=2) as callers:
+        results = list(callers.map(lambda q: aggregator.search(q)[1]["slow"], ["a", "b"]))
+    assert [info["error"] for info in results] == [None, None]
+
+
+def test_hung_source_only_blocks_itself(sources):
+    release = threading.Event()
+
+    def hung(query, location):
+        release.wait(5)
+        return []
+
+    sources.register_source("hung", hung, timeout=0.1, workers=1)
+    sources.register_source("fast", lambda q, l: [{"title": "Dev", "url": "http://a"}])
+    aggregator = JobAggregator(cache=JobCache(ttl=60))
+    try:
+        assert aggregator.search("python")[1]["hung"]["error"].startswith("timeout")
+        # Its only worker is still stuck: the next search reports it busy,
+        # and other sources are unaffected
+        jobs, summary = aggregator.search("java")
+        assert summary["hung"]["error"].startswith("busy")
+        assert summary["fast"]["error"] is None and len(jobs) == 1
+    finally:
+        release.set()
@@ -0,0 +1,24 @@
+from scrapers.bloom import BloomFilter
+
+
+def test_membership_and_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        assert bloom.add(f"https://cl.computrabajo.com/oferta-{i}")
+    assert all(f"https://cl.computrabajo.com/oferta-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"https://other/{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+    assert not bloom.add("https://cl.computrabajo.com/oferta-1")
+    assert len(bloom) == 1000
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "seen.bloom"
+    bloom = BloomFilter(capacity=100, path=path)
+    bloom.add("a")
+    bloom.save()
+
+    reloaded = BloomFilter(capacity=100, path=path)
+    assert "a" in reloaded and "b" not in reloaded
+    assert len(reloaded) == 1
+    assert len(reloaded.bits) == len(bloom.bits)
@@ -0,0 +1,112 @@
+import threading
+import pytest
+from scrapers.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+
+        class Context:
+            def new_page(self):
+                return FakePage()
+
+            def close(self):
+                pass
+        return Context()
+
+    def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.launched = []
+        self.stopped = False
+        self.chromium = self
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def playwrights():
+    instances = []
+
+    def factory():
+        instance = FakePlaywright()
+        instances.append(instance)
+        return instance
+    return instances, factory
+
+
+def test_pool_runs_on_worker_threads(playwrights):
+    instances, factory = playwrights
+    pool = BrowserPool(size=2, playwright_factory=factory)
+    names = [pool.run(lambda page: threading.current_thread().name) for _ in range(4)]
+    pool.shutdown()
+
+    assert all(name.startswith("browser-pool-") for name in names)
+    assert len(instances) == 2
+    assert all(p.stopped for p in instances)
+
+
+def test_pool_recycles_after_max_uses(playwrights):
+    instances, factory = playwrights
+    pool = BrowserPool(size=1, max_uses=2, playwright_factory=factory)
+    for _ in range(5):
+        pool.run(lambda page: None)
+    pool.shutdown()
+
+    assert len(instances[0].launched) == 3
+    assert pool.stats()["recycles"] >= 2
+
+
+def test_pool_relaunches_after_crash(playwrights):
+    instances, factory = playwrights
+    pool = BrowserPool(size=1, playwright_factory=factory)
+
+    def crash(page):
+        page.handlers["crash"](page)
+        raise RuntimeError("Target crashed")
+
+    with pytest.raises(RuntimeError):
+        pool.run(crash)
+    assert pool.run(lambda page: "ok") == "ok"
+    pool.shutdown()
+    assert len(instances[0].launched) == 2
+
+
+def test_pool_reports_startup_failure():
+    def factory():
+        raise ImportError("playwright not installed")
+
+    pool = BrowserPool(size=1, playwright_factory=factory)
+    with pytest.raises(ImportError):
+        pool.run(lambda page: None, timeout=5)
+    pool.shutdown()
@@ -0,0 +1,99 @@
+import io
+import json
+import sys
+import zipfile
+
+import pytest
+
+from bulk_export import ExportBusy, ExportPool, export_zip, parse_styles
+from pdf_cache import PDFCache
+
+
+def test_parse_styles():
+    assert parse_styles("all") == ["classic", "modern", "uno"]
+    assert parse_styles("uno, classic") == ["uno", "classic"]
+    with pytest.raises(ValueError):
+        parse_styles("classic,fancy")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_zip_streams_every_entry(workers, tmp_path, sample_cv):
+    candidates = [(i, sample_cv(f"Person {i}")) for i in range(1, 5)]
+    chunks = list(export_zip(iter(candidates), ["classic", "uno"], workers=workers, cache=PDFCache(tmp_path)))
+
+    # One chunk per entry plus the central directory
+    assert len(chunks) == 9
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert sorted(archive.namelist()) == sorted(f"cv_{i}_{s}.pdf" for i in range(1, 5) for s in ("classic", "uno"))
+    assert all(archive.read(name).startswith(b"%PDF") for name in archive.namelist())
+
+
+def test_export_zip_reuses_cache_and_reports_errors(tmp_path, monkeypatch, sample_cv):
+    cache = PDFCache(tmp_path)
+    list(export_zip([(1, sample_cv("Ana"))], ["classic"], workers=1, cache=cache))
+    assert cache.stats()["misses"] == 1
+
+    monkeypatch.setattr('bulk_export.render_pdf', lambda data, style: (_ for _ in ()).throw(ValueError("boom")))
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(
+        export_zip([(1, sample_cv("Ana")), (2, sample_cv("Luis"))], ["classic"], workers=1, cache=cache)
+    )))
+    assert archive.read("cv_1_classic.pdf").startswith(b"%PDF")  # served from the cache
+    assert archive.read("errors.txt") == b"cv_2_classic.pdf: boom\n"
+
+
+def test_export_pool_is_shared_and_bounded(tmp_path, sample_cv):
+    pool = ExportPool(workers=2, max_exports=1)
+    try:
+        executor = pool.executor()
+        assert pool.executor() is executor
+        for i in range(2):
+            chunks = export_zip([(i, sample_cv())], ["classic"], workers=2, cache=PDFCache(tmp_path / str(i)), executor=executor)
+            assert zipfile.ZipFile(io.BytesIO(b"".join(chunks))).namelist() == [f"cv_{i}_classic.pdf"]
+        assert pool.executor() is executor  # still running for the next export
+
+        pool.acquire()
+        with pytest.raises(ExportBusy):
+            pool.acquire()
+        pool.release()
+        pool.acquire()
+        pool.release()
+    finally:
+        pool.shutdown()
+
+
+@pytest.fixture
+def app_export_pool(monkeypatch):
+    app_module = sys.modules['app']
+    pool = ExportPool(workers=1)
+    monkeypatch.setattr(app_module, 'export_pool', pool)
+    monkeypatch.setattr(app_module, 'BULK_EXPORT_TOKEN', "s3cret")
+    return pool
+
+
+def test_export_endpoint(client, app_export_pool):
+    auth = {"Authorization": "Bearer s3cret"}
+    ids = [json.loads(client.post('/api/submit', json={"full_name": n, "email": f"{n}@example.com"}).data)['candidate_id']
+           for n in ("ana", "luis")]
+
+    rv = client.get(f'/api/export?styles=modern&ids={ids[0]},{ids[1]}', headers=auth)
+    assert rv.status_code == 200
+    assert rv.mimetype == "application/zip"
+    assert sorted(zipfile.ZipFile(io.BytesIO(rv.data)).namelist()) == [f"cv_{i}_modern.pdf" for i in sorted(ids)]
+    rv.close()
+
+    assert client.get('/api/export?styles=fancy', headers=auth).status_code == 400
+
+    # One export at a time: the slot is released when the stream is closed
+    app_export_pool.acquire()
+    rv = client.get('/api/export', headers=auth)
+    assert rv.status_code == 429 and rv.headers['Retry-After']
+    app_export_pool.release()
+    assert client.get('/api/export', headers=auth).status_code == 200
+
+
+def test_export_endpoint_needs_token(client, app_export_pool, monkeypatch):
+    assert client.get('/api/export').status_code == 401
+    assert client.get('/api/export', headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    monkeypatch.setattr(sys.modules['app'], 'BULK_EXPORT_TOKEN', None)
+    assert client.get('/api/export', headers={"Authorization": "Bearer s3cret"}).status_code == 404
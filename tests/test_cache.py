@@ -0,0 +1,89 @@
+import sqlite3
+import time
+
+import pytest
+
+from scrapers.cache import JobCache, make_key
+
+
+def make_fetch(results):
+    calls = []
+
+    def fetch(query, location):
+        calls.append((query, location))
+        return list(results)
+    return fetch, calls
+
+
+def test_make_key_normalizes():
+    assert make_key("RemoteOK", " Python  Dev ", "Santiágo") == make_key("remoteok", "python dev", "santiago")
+
+
+def test_hit_after_miss():
+    cache = JobCache(ttl=60)
+    fetch, calls = make_fetch([{"url": "a"}])
+
+    assert cache.get_or_fetch("remoteok", "python", "", fetch) == [{"url": "a"}]
+    assert cache.get_or_fetch("remoteok", "PYTHON", "", fetch) == [{"url": "a"}]
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_empty_results_not_cached():
+    cache = JobCache(ttl=60)
+    fetch, calls = make_fetch([])
+    cache.get_or_fetch("remoteok", "python", "", fetch)
+    cache.get_or_fetch("remoteok", "python", "", fetch)
+    assert len(calls) == 2
+
+
+def test_stale_while_revalidate():
+    cache = JobCache(ttl=0, stale_ttl=60)
+    cache.backend.set(make_key("remoteok", "python", ""), [{"url": "old"}], time.time() - 1)
+    fetch, calls = make_fetch([{"url": "new"}])
+
+    assert cache.get_or_fetch("remoteok", "python", "", fetch) == [{"url": "old"}]
+    for _ in range(50):
+        if cache.backend.get(make_key("remoteok", "python", ""))[1] == [{"url": "new"}]:
+            break
+        time.sleep(0.01)
+    assert calls == [("python", "")]
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_lru_eviction():
+    cache = JobCache(ttl=60, max_entries=2)
+    fetch, _ = make_fetch([{"url": "a"}])
+    for q in ["a", "b", "a", "c"]:
+        cache.get_or_fetch("remoteok", q, "", fetch)
+    assert cache.backend.get(make_key("remoteok", "b", "")) is None
+    assert cache.backend.get(make_key("remoteok", "a", "")) is not None
+
+
+def test_disk_backend_shared(tmp_path):
+    path = tmp_path / "cache.db"
+    fetch, calls = make_fetch([{"url": "a"}])
+    JobCache(ttl=60, path=path).get_or_fetch("computrabajo", "react", "santiago", fetch)
+    other = JobCache(ttl=60, path=path)
+    assert other.get_or_fetch("computrabajo", "react", "santiago", fetch) == [{"url": "a"}]
+    assert len(calls) == 1
+    assert other.stats()["backend"] == "DiskBackend"
+
+
+def test_disk_backend_closes_connections(tmp_path, monkeypatch):
+    opened, real_connect = [], sqlite3.connect
+
+    def connect(*args, **kwargs):
+        opened.append(real_connect(*args, **kwargs))
+        return opened[-1]
+
+    cache = JobCache(ttl=60, path=tmp_path / "cache.db")
+    monkeypatch.setattr("scrapers.cache.sqlite3.connect", connect)
+    cache.backend.set("k", [{"url": "a"}], time.time())
+    assert cache.backend.get("k")[1] == [{"url": "a"}]
+    assert len(cache.backend) == 1
+    assert len(opened) == 3
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
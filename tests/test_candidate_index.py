@@ -0,0 +1,74 @@
+import threading
+from types import SimpleNamespace
+
+from skills.candidate_index import CandidateIndex
+
+
+def candidate(candidate_id, skills):
+    return SimpleNamespace(id=candidate_id, professional_title="", summary="", experiences=[], projects=[],
+                           skills=[SimpleNamespace(name=name) for name in skills])
+
+
+def blocking_rows(rows, started, release):
+    """Yields half the rows, then waits for `release`: a rebuild caught mid-scan."""
+    half = len(rows) // 2
+    yield from rows[:half]
+    started.set()
+    release.wait(5)
+    yield from rows[half:]
+
+
+def ids(index, job):
+    return [match["candidate_id"] for match in index.top_k(job)]
+
+
+def test_queries_during_rebuild_see_the_old_index():
+    index = CandidateIndex()
+    index.load([candidate(1, ["Python"]), candidate(2, ["Python", "Django"])])
+
+    started, release = threading.Event(), threading.Event()
+    rows = [candidate(i, ["Python", "Django"]) for i in range(3, 7)]
+    rebuild = threading.Thread(target=index.load, args=(blocking_rows(rows, started, release),))
+    rebuild.start()
+    try:
+        assert started.wait(5)
+        assert ids(index, "Python Django") == [2, 1]
+        assert len(index) == 2
+    finally:
+        release.set()
+        rebuild.join(5)
+
+    assert ids(index, "Python Django") == [3, 4, 5, 6]
+    assert index.synced_id == 6
+
+
+def test_refresh_rebuilds_once_and_catches_up():
+    index = CandidateIndex(ttl=0)
+    started, release = threading.Event(), threading.Event()
+    scans = []
+
+    def all_rows():
+        scans.append(1)
+        return blocking_rows([candidate(1, ["Python"]), candidate(2, ["Django"])], started, release)
+
+    index.load([candidate(1, ["Python"])])  # loaded, but stale at once (ttl=0)
+    first = threading.Thread(target=index.refresh, args=(all_rows, lambda synced_id: []))
+    first.start()
+    try:
+        assert started.wait(5)
+        # Another request meanwhile: no second scan, it queries the current index
+        index.refresh(all_rows, lambda synced_id: [])
+        assert ids(index, "Python") == [1]
+    finally:
+        release.set()
+        first.join(5)
+    assert len(scans) == 1
+    assert ids(index, "Django") == [2]
+
+    # Submits on this worker move synced_id, so catch_up does not read them again
+    index.ttl = 300
+    index.add(3, "Django")
+    requested = []
+    index.refresh(all_rows, lambda synced_id: requested.append(synced_id) or [])
+    assert requested == [3]
+    assert len(scans) == 1
@@ -0,0 +1,147 @@
+import pytest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from scrapers import computrabajo
+from scrapers.computrabajo import detect_block, parse_listing, scrape_computrabajo
+
+LISTING_HTML = """
+<html><body><div id="offersGridOfferContainer">
+  <article class="box_offer">
+    <h2><a class="js-o-link" href="/ofertas-de-trabajo/oferta-1">Desarrollador Python</a></h2>
+    <p class="fs16 fc_base mt5"><a>Acme SpA</a></p>
+    <p class="fs16"><span class="fc_base">Santiago, RM</span></p>
+    <p class="fs13 fc_aux">Buscamos desarrollador con Django y AWS.</p>
+    <span class="fc_aux">Hace 2 horas</span>
+  </article>
+</div></body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    computrabajo.fetch_stats.reset()
+
+
+def test_detect_block():
+    assert detect_block(403, "") == "status_403"
+    assert detect_block(200, "<script src='/cdn-cgi/challenge-platform/x.js'></script>") == "challenge"
+    assert detect_block(200, "<html><body>nada</body></html>") == "no_articles"
+    assert detect_block(200, "<p>No hemos encontrado ofertas</p>") is None
+    assert detect_block(200, LISTING_HTML) is None
+
+
+def test_parse_listing():
+    jobs = parse_listing(LISTING_HTML, "https://cl.computrabajo.com", "Santiago")
+    assert jobs == [{
+        'title': 'Desarrollador Python',
+        'company': 'Acme SpA',
+        'location': 'Santiago, RM',
+        'url': 'https://cl.computrabajo.com/ofertas-de-trabajo/oferta-1',
+        'description': 'Buscamos desarrollador con Django y AWS.',
+        'date_posted': 'Hace 2 horas',
+        'source': 'Computrabajo',
+        'logo': ''
+    }]
+
+
+@pytest.mark.parametrize("fixture", ["computrabajo_listing.html", "computrabajo_listing_legacy.html"])
+def test_parse_fixture_layouts(fixture):
+    content = (Path(__file__).parent / "fixtures" / fixture).read_text(encoding="utf-8")
+    jobs = parse_listing(content, "https://cl.computrabajo.com", "Chile")
+    assert len(jobs) == 20
+    assert all(job["title"] and job["url"].startswith("https://cl.computrabajo.com/") for job in jobs)
+    assert all(job["company"] != "Confidencial" or "Confidencial" in content for job in jobs)
+    assert all(job["description"] and job["date_posted"] for job in jobs)
+
+
+def test_offer_count_is_not_mistaken_for_no_results():
+    assert detect_block(200, "<h1>120 ofertas de trabajo</h1>") == "no_articles"
+    assert detect_block(200, "<h1>0 ofertas de trabajo</h1>") is None
+
+
+def test_http_path_skips_browser():
+    resp = MagicMock(status_code=200, text=LISTING_HTML)
+    with patch.object(computrabajo.get_http_session(), 'get', return_value=resp), \
+         patch.object(computrabajo, '_fetch_browser') as browser:
+        jobs = scrape_computrabajo("python", "santiago")
+
+    assert len(jobs) == 1
+    browser.assert_not_called()
+    assert computrabajo.fetch_stats.snapshot()["paths"]["http"]["count"] == 1
+
+
+def test_blocked_http_escalates_to_browser():
+    resp = MagicMock(status_code=429, text="")
+    with patch.object(computrabajo.get_http_session(), 'get', return_value=resp), \
+         patch.object(computrabajo, '_fetch_browser', return_value=(200, LISTING_HTML)) as browser:
+        jobs = scrape_computrabajo("python")
+
+    assert len(jobs) == 1
+    browser.assert_called_once()
+    assert computrabajo.fetch_stats.snapshot()["escalations"] == {"status_429": 1}
+
+
+def listing(*ids):
+    articles = "".join(
+        f'<article class="box_offer"><h2><a class="js-o-link" href="/oferta-{i}">Oferta {i}</a></h2></article>'
+        for i in ids
+    )
+    return f"<html><body>{articles}</body></html>"
+
+
+def test_crawl_stops_at_seen_page(tmp_path):
+    from scrapers.bloom import BloomFilter
+    pages = {1: listing(1, 2), 2: listing(3, 4), 3: listing(5), 4: listing()}
+
+    def fake_fetch(url):
+        page = int(url.split("?p=")[1]) if "?p=" in url else 1
+        return 200, pages[page]
+
+    seen = BloomFilter(capacity=100, path=tmp_path / "seen.bloom")
+    with patch.object(computrabajo, 'fetch_listing', side_effect=fake_fetch) as fetch:
+        first = computrabajo.crawl_computrabajo("python", max_pages=10, seen=seen)
+        assert [j["title"] for j in first] == ["Oferta 1", "Oferta 2", "Oferta 3", "Oferta 4", "Oferta 5"]
+        assert fetch.call_count == 4
+
+        pages[1] = listing(6, 1, 2)
+        fetch.reset_mock()
+        second = computrabajo.crawl_computrabajo("python", max_pages=10, seen=BloomFilter(path=tmp_path / "seen.bloom"))
+        assert [j["title"] for j in second] == ["Oferta 6"]
+        assert fetch.call_count == 2
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = MagicMock(resource_type=resource_type, url=url)
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def continue_(self):
+        self.outcome = "continue"
+
+
+def test_render_listing_blocks_resources_and_records_phases():
+    page = MagicMock()
+    page.goto.return_value = MagicMock(status=200)
+    page.content.return_value = LISTING_HTML
+
+    with patch.object(computrabajo.time, 'sleep', side_effect=AssertionError("fixed sleep")):
+        status, content = computrabajo._render_listing(page, "https://cl.computrabajo.com/trabajo-de-python")
+
+    assert (status, content) == (200, LISTING_HTML)
+    page.wait_for_function.assert_called_once()
+
+    handler = page.route.call_args.args[1]
+    routes = [
+        FakeRoute("document", "https://cl.computrabajo.com/trabajo-de-python"),
+        FakeRoute("image", "https://cdn.computrabajo.com/logo.png"),
+        FakeRoute("script", "https://www.googletagmanager.com/gtm.js"),
+    ]
+    for route in routes:
+        handler(route)
+    assert [r.outcome for r in routes] == ["continue", "abort", "abort"]
+
+    phases = computrabajo.fetch_stats.snapshot()["browser_phases"]
+    assert set(phases) == {"navigate", "settle", "extract"}
@@ -0,0 +1,68 @@
+import random
+from skills.content_analysis import ContentAnalysisSkill
+from skills.keyword_cache import keyword_cache
+
+WORDS = ["python", "django", "flask", "docker", "kubernetes", "react", "typescript", "postgres",
+         "agile", "scrum", "aws", "terraform", "pandas", "experience", "team", "with", "api", "rest", "graphql"]
+
+
+def random_text(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)) + "."
+
+
+def test_batch_matches_single_scoring():
+    rng = random.Random(3)
+    resume = "Python developer: Django, Flask, REST APIs, Docker and PostgreSQL."
+    jobs = [random_text(rng, rng.randint(0, 40)) for _ in range(200)] + ["", "the and with", "Python\x1eDjango, Ünïcode!"]
+    # Batch tokenization must agree with extract_keywords, not just read its cached output
+    keyword_cache.clear()
+
+    batch = ContentAnalysisSkill.batch_ats_scores(resume, jobs)
+    for i, job in enumerate(jobs):
+        single = ContentAnalysisSkill.calculated_ats_score(resume, job)
+        assert batch[i]["index"] == i
+        assert batch[i]["score"] == single["score"]
+        assert batch[i]["matched"] == single["matched"]
+        assert batch[i]["missing"] == single["missing"]
+
+
+def test_batch_top_k():
+    rng = random.Random(5)
+    resume = "python django docker aws"
+    jobs = [random_text(rng, 15) for _ in range(300)]
+    full = ContentAnalysisSkill.batch_ats_scores(resume, jobs)
+    expected = sorted(full, key=lambda r: r["score"], reverse=True)[:7]
+
+    top = ContentAnalysisSkill.batch_ats_scores(resume, jobs, top_k=7)
+    assert [r["index"] for r in top] == [r["index"] for r in expected]
+    assert len(ContentAnalysisSkill.batch_ats_scores(resume, jobs[:3], top_k=10)) == 3
+
+
+def test_batch_pool_keeps_input_order():
+    from skills.ats_batch import ATSBatchPool
+
+    rng = random.Random(7)
+    resume = "python django docker aws"
+    jobs = [random_text(rng, 12) for _ in range(23)]
+    expected = ContentAnalysisSkill.batch_ats_scores(resume, jobs)
+
+    pool = ATSBatchPool(workers=2, chunk_size=5, cpu_budget=0)
+    try:
+        run = pool.run(resume, jobs)
+        assert list(run) == expected
+        assert run.stats()["budget_exceeded"] is False
+    finally:
+        pool.shutdown()
+
+
+def test_batch_pool_cpu_budget_cuts_off():
+    from skills.ats_batch import ATSBatchPool
+
+    jobs = [f"python developer {i}" for i in range(10)]
+    run = ATSBatchPool(workers=1, chunk_size=4, cpu_budget=1e-9).run("python", jobs)
+    results = list(run)
+
+    assert [r["index"] for r in results] == list(range(10))
+    assert all("score" in r for r in results[:4])
+    assert all(r["error"] == "cpu budget exceeded" for r in results[4:])
+    assert run.stats()["budget_exceeded"] is True
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from db_profiles import build_profile, engine_profile, profile_name
+
+
+@pytest.mark.parametrize("url,vercel,expected", [
+    ("sqlite:////app/data/cv.db", None, "sqlite"),
+    ("sqlite:////tmp/cv.db", "1", "sqlite-ephemeral"),
+    ("postgresql://u:p@db/cv", None, "postgres"),
+    ("postgresql+psycopg2://u:p@db/cv", "1", "postgres-serverless"),
+    ("mysql://u:p@db/cv", None, "default"),
+])
+def test_profile_selection(monkeypatch, url, vercel, expected):
+    monkeypatch.delenv("DB_ENGINE_PROFILE", raising=False)
+    if vercel:
+        monkeypatch.setenv("VERCEL", vercel)
+    else:
+        monkeypatch.delenv("VERCEL", raising=False)
+    assert profile_name(url) == expected
+
+    monkeypatch.setenv("DB_ENGINE_PROFILE", "default")
+    assert engine_profile(url).name == "default"
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        build_profile("oracle")
+
+
+def test_sqlite_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "2500")
+    profile = build_profile("sqlite")
+    engine = create_engine(f"sqlite:///{tmp_path / 'cv.db'}", **profile.options)
+    profile.install(engine)
+    with engine.connect() as conn:
+        values = [conn.execute(text(f"PRAGMA {name}")).scalar()
+                  for name in ("journal_mode", "synchronous", "busy_timeout", "mmap_size")]
+    engine.dispose()
+    assert values == ["wal", 1, 2500, 64 * 1024 * 1024]
+
+
+def test_postgres_pooling():
+    # Engines connect lazily, so no server is needed to inspect the pool
+    pooled = build_profile("postgres")
+    engine = create_engine("postgresql://u:p@localhost/cv", **pooled.options)
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 5 and engine.pool._pre_ping
+
+    serverless = build_profile("postgres-serverless")
+    assert isinstance(create_engine("postgresql://u:p@localhost/cv", **serverless.options).pool, NullPool)
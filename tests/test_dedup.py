@@ -0,0 +1,47 @@
+from scrapers.dedup import collapse_near_duplicates, find_near_duplicates
+
+DESC = "Buscamos desarrollador backend con experiencia en Python, Django y AWS para unirse a nuestro equipo de plataforma en Santiago."
+
+
+def job(url, title="Desarrollador Python", company="Acme", description=DESC, source="Computrabajo", tags=None):
+    return {"title": title, "company": company, "description": description, "url": url, "source": source, "tags": tags or []}
+
+
+def test_relisted_posting_is_collapsed():
+    jobs = [
+        job("http://ct/1", tags=["python"]),
+        job("http://ro/9", title="Desarrollador Python Sr", source="RemoteOK", tags=["django"]),
+        job("http://ct/2", title="Diseñador UX", company="Beta", description="Diseño de interfaces en Figma para productos móviles y web."),
+    ]
+    merged = collapse_near_duplicates(jobs)
+
+    assert len(merged) == 2
+    assert merged[0]["urls"] == ["http://ct/1", "http://ro/9"]
+    assert merged[0]["sources"] == ["Computrabajo", "RemoteOK"]
+    assert merged[0]["tags"] == ["python", "django"]
+    assert merged[1]["urls"] == ["http://ct/2"]
+
+
+def test_distinct_jobs_stay_separate():
+    jobs = [job(f"http://ct/{i}", title=f"Role {i}", company=f"Company {i}", description=f"unique text number {i} about topic {i * 7}") for i in range(50)]
+    assert len(find_near_duplicates(jobs)) == 50
+
+
+def test_collapse_is_idempotent():
+    once = collapse_near_duplicates([job("http://a"), job("http://b")])
+    twice = collapse_near_duplicates(once + [job("http://c")])
+    assert len(twice) == 1
+    assert twice[0]["urls"] == ["http://a", "http://b", "http://c"]
+
+
+def test_same_title_at_different_companies_stays_separate():
+    # RemoteOK postings have no description: the title alone must not merge employers
+    title = "Senior Full Stack Software Engineer"
+    jobs = [job(f"http://ro/{i}", title=title, company=company, description="", source="RemoteOK")
+            for i, company in enumerate(["Acme", "Globex", "Initech"])]
+    assert len(collapse_near_duplicates(jobs)) == 3
+
+    # Same employer, spelled differently by another source, is still one job
+    same = [job("http://ro/1", title=title, company="Acme Inc.", description=""),
+            job("http://ct/1", title=title, company="acme inc", description="")]
+    assert len(collapse_near_duplicates(same)) == 1
@@ -0,0 +1,56 @@
+from collections import Counter
+from unittest.mock import patch
+
+from skills.content_analysis import ContentAnalysisSkill
+from skills.keyword_cache import KeywordCache, content_key, estimate_size, keyword_cache
+
+
+def test_get_or_compute_memoizes_by_content():
+    cache = KeywordCache()
+    compute = lambda text: Counter(text.split())
+
+    first = cache.get_or_compute("python django python", compute)
+    second = cache.get_or_compute("python django python", compute)
+
+    assert first is second
+    assert first == Counter({"python": 2, "django": 1})
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_lru_eviction_by_entries():
+    cache = KeywordCache(max_entries=2)
+    for text in ("a", "b"):
+        cache.set(content_key(text), Counter(text))
+    cache.get(content_key("a"))  # "b" is now least recently used
+    cache.set(content_key("c"), Counter("c"))
+
+    assert cache.get(content_key("b")) is None
+    assert cache.get(content_key("a")) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_eviction_by_memory():
+    small, large = Counter({"python": 1}), Counter({f"keyword{i}": 1 for i in range(200)})
+    cache = KeywordCache(max_bytes=estimate_size(large) + estimate_size(small))
+    cache.set(b"small", small)
+    cache.set(b"large", large)
+    cache.set(b"other", Counter({"django": 1}))
+
+    assert cache.get(b"small") is None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    # An entry larger than the whole budget is simply not cached
+    cache.set(b"huge", Counter({f"word{i}": 1 for i in range(5000)}))
+    assert cache.get(b"huge") is None
+
+
+def test_repeated_scoring_reuses_tokens():
+    keyword_cache.clear()
+    job = "Senior Python developer: Django, Docker and AWS."
+    first = ContentAnalysisSkill.calculated_ats_score("python docker", job)
+
+    with patch.object(ContentAnalysisSkill, "extract_keywords", side_effect=AssertionError("re-tokenized")):
+        assert ContentAnalysisSkill.calculated_ats_score("python docker", job) == first
+        assert ContentAnalysisSkill.batch_ats_scores("python docker", [job])[0]["score"] == first["score"]
+    assert keyword_cache.stats()["hits"] >= 4
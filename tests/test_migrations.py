@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from migrations import MIGRATIONS, applied_versions, migrate
+from models import db, Application, Candidate, Job, Skill
+
+MIGRATION_INDEXES = [stmt.split()[5] for _, _, statements in MIGRATIONS for stmt in statements]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A database as created before the indexes existed."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for name in MIGRATION_INDEXES:
+            conn.execute(text(f"DROP INDEX {name}"))
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine):
+    inspector = inspect(engine)
+    return {index["name"] for table in inspector.get_table_names() for index in inspector.get_indexes(table)}
+
+
+def test_migrate_is_versioned_and_idempotent(engine):
+    assert not index_names(engine) & set(MIGRATION_INDEXES)
+
+    assert migrate(engine) == [version for version, _, _ in MIGRATIONS]
+    assert set(MIGRATION_INDEXES) <= index_names(engine)
+    assert applied_versions(engine) == {version for version, _, _ in MIGRATIONS}
+    assert migrate(engine) == []
+
+
+def test_models_declare_the_migration_indexes(tmp_path):
+    # Fresh databases get the same indexes from create_all()
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    db.metadata.create_all(engine)
+    assert set(MIGRATION_INDEXES) <= index_names(engine)
+    engine.dispose()
+
+
+def query_plan(engine, statement):
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+def hot_queries():
+    queries = []
+    for section in Candidate.CV_SECTIONS:
+        model = getattr(Candidate, section).property.mapper.class_
+        queries.append((f"{section} by candidate", select(model).where(model.candidate_id == 1)))
+        # What selectinload emits for a batch of candidates
+        queries.append((f"{section} selectin", select(model).where(model.candidate_id.in_([1, 2, 3]))))
+    queries += [
+        ("application", select(Application).where(Application.candidate_id == 1, Application.job_id == 2)),
+        ("applications by candidate", select(Application).where(Application.candidate_id == 1)),
+        ("applications by job", select(Application).where(Application.job_id == 2)),
+        ("skills by name", select(Skill.candidate_id).where(Skill.name == "python")),
+        ("job by url", select(Job).where(Job.url == "https://example.com/job/1")),
+    ]
+    return queries
+
+
+@pytest.mark.parametrize("label,statement", hot_queries(), ids=[label for label, _ in hot_queries()])
+def test_hot_queries_use_indexes(engine, label, statement):
+    migrate(engine)
+    plan = query_plan(engine, statement)
+    assert any("USING INDEX" in step or "USING COVERING INDEX" in step for step in plan), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
@@ -65,3 +65,40 @@ def test_uno_pdf(sample_data):
     pdf.generate()
     output = pdf.output(dest='S').encode('latin-1')
     assert output.startswith(b'%PDF')
+
+@pytest.mark.parametrize("style", ["classic", "modern", "uno"])
+def test_section_profiler(sample_data, style):
+    from pdf_profiling import SectionProfiler, SectionStats
+    from pdf_templates import render_pdf
+
+    profiler = SectionProfiler()
+    output = render_pdf(sample_data, style, profiler=profiler)
+    assert output.startswith(b"%PDF")
+
+    report = profiler.report()
+    assert list(report)[0] == "header"
+    assert list(report)[-1] == "output"
+    assert {"summary", "experience", "education", "skills"} <= set(report)
+    assert all(entry["ms"] >= 0 for entry in report.values())
+
+    stats = SectionStats()
+    stats.record(style, profiler)
+    stats.record(style, profiler)
+    assert stats.snapshot()[style]["experience"]["renders"] == 2
+
+def test_render_bytes_offsets(sample_data, tmp_path):
+    pdf = ClassicPDF(sample_data)
+    pdf.generate()
+    content = pdf.render_bytes()
+    # FPDF's own output() still works for every destination
+    assert bytes(content) == pdf.output(dest='S').encode('latin-1')
+    pdf.output(str(tmp_path / "cv.pdf"))
+    assert (tmp_path / "cv.pdf").read_bytes() == bytes(content)
+
+    # The byte buffer must keep FPDF's xref offsets right
+    startxref = int(content[content.rindex(b"startxref") + 10:].split()[0])
+    assert content[startxref:startxref + 4] == b"xref"
+    offsets = content[startxref:].split(b"\n")[3:5]
+    for line in offsets:
+        offset = int(line.split()[0])
+        assert content[offset:].split(b"\n")[0].endswith(b"0 obj")
@@ -0,0 +1,66 @@
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from pdf_cache import PDFCache, pdf_cache_key
+
+
+def test_cache_key_is_stable():
+    data = {"candidate": {"full_name": "Ana", "email": "a@b.c"}, "skills": [{"name": "Python"}]}
+    reordered = {"skills": [{"name": "Python"}], "candidate": {"email": "a@b.c", "full_name": "Ana"}}
+
+    assert pdf_cache_key(data, "modern") == pdf_cache_key(reordered, "modern")
+    assert pdf_cache_key(data, "modern") != pdf_cache_key(data, "classic")
+    # Unknown styles render as classic, so they share its entry
+    assert pdf_cache_key(data, "nope") == pdf_cache_key(data, "classic")
+    # A template change invalidates every entry
+    before = pdf_cache_key(data, "classic")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('pdf_cache.TEMPLATE_VERSION', "999")
+        assert pdf_cache_key(data, "classic") != before
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = PDFCache(tmp_path, max_bytes=250)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.set(key, b"x" * 100)
+        os.utime(tmp_path / f"{key}.pdf", (time.time() - 100 + i, time.time() - 100 + i))
+    assert cache.get("a") is None  # evicted when "c" pushed the total to 300 bytes
+
+    assert cache.get("b") == b"x" * 100  # bumps "b" ahead of "c"
+    cache.set("d", b"y" * 100)
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["bytes"] <= 250
+
+
+def test_download_uses_cache_and_etag(client, app_pdf_cache):
+    candidate_id = json.loads(client.post('/api/submit', json={
+        "full_name": "Ana", "email": "ana@example.com", "skills": [{"name": "Python"}]
+    }).data)['candidate_id']
+    url = f'/api/download/{candidate_id}?style=modern'
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers['X-PDF-Cache'] == "MISS"
+    assert first.data.startswith(b"%PDF")
+    assert first.headers['Content-Length'] == str(len(first.data))
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control'] == 'private, no-cache'
+
+    second = client.get(url)
+    assert second.headers['X-PDF-Cache'] == "HIT"
+    assert second.headers['ETag'] == etag
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys.modules['app'], 'render_pdf', lambda *a: pytest.fail("rendered on revalidation"))
+        not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+
+    # Another style is another document
+    assert client.get(f'/api/download/{candidate_id}?style=uno').headers['ETag'] != etag
@@ -0,0 +1,27 @@
+import time
+from scrapers.rate_limit import TokenBucket, HostRateLimiter
+
+
+def test_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=100, capacity=2)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() > 0
+
+    start = time.monotonic()
+    assert bucket.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+def test_bucket_timeout():
+    bucket = TokenBucket(rate=0.01, capacity=1)
+    bucket.acquire()
+    assert bucket.acquire(timeout=0.01) is False
+
+
+def test_limiter_is_per_host():
+    limiter = HostRateLimiter(rate=0.01, capacity=1)
+    assert limiter.acquire("https://remoteok.com/api?tag=python", timeout=0)
+    assert limiter.acquire("https://cl.computrabajo.com/trabajo-de-python", timeout=0)
+    assert not limiter.acquire("https://remoteok.com/api", timeout=0)
+    assert limiter.bucket("remoteok.com") is limiter.bucket("https://REMOTEOK.com/api")
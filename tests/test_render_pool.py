@@ -0,0 +1,142 @@
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pdf_render_pool import QueueFull, RenderPool
+
+
+def thread_pool(n):
+    return ThreadPoolExecutor(max_workers=n)
+
+
+def blocking_render(release):
+    def render(data, style):
+        release.wait(5)
+        return b"%PDF-fake", 0.01
+    return render
+
+
+def test_queue_full_and_coalescing(sample_cv):
+    data = sample_cv()
+    release = threading.Event()
+    pool = RenderPool(workers=1, max_queue=2, render=blocking_render(release), executor_factory=thread_pool)
+    try:
+        first = pool.submit("a", data, "classic")
+        assert pool.submit("a", data, "classic") is first  # same document: shared job
+        pool.submit("b", data, "classic")
+        with pytest.raises(QueueFull):
+            pool.submit("c", data, "classic")
+
+        stats = pool.stats()
+        assert (stats["queue_depth"], stats["coalesced"], stats["rejected"]) == (2, 1, 1)
+
+        release.set()
+        assert pool.wait(first.id, 5).status == "done"
+        assert pool.wait(pool.submit("c", data, "classic").id, 5).content == b"%PDF-fake"
+        assert pool.stats()["completed"] == 3
+        assert "render_ms_p95" in pool.stats()
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_failed_render_is_reported(sample_cv):
+    def broken(data, style):
+        raise ValueError("bad template")
+
+    pool = RenderPool(workers=1, render=broken, executor_factory=thread_pool)
+    job = pool.wait(pool.submit("k", sample_cv(), "classic").id, 5)
+    assert job.to_dict() == {"render_id": job.id, "status": "failed", "error": "bad template"}
+    assert pool.stats()["failed"] == 1
+    pool.shutdown()
+
+
+def test_finished_jobs_are_capped(sample_cv):
+    pool = RenderPool(workers=1, max_finished=2, render=lambda data, style: (b"%PDF-fake", 0.01),
+                      executor_factory=thread_pool)
+    try:
+        jobs = [pool.wait(pool.submit(key, sample_cv(), "classic").id, 5) for key in "abc"]
+        assert [pool.get(key) for key in "abc"] == [None, jobs[1], jobs[2]]
+    finally:
+        pool.shutdown()
+
+
+def test_process_pool_renders_pdf(sample_cv):
+    pool = RenderPool(workers=1)
+    try:
+        job = pool.wait(pool.submit("k", sample_cv(), "modern").id, 30)
+        assert job.status == "done"
+        assert job.content.startswith(b"%PDF")
+    finally:
+        pool.shutdown()
+
+
+@pytest.fixture
+def app_render_pool(app_pdf_cache, monkeypatch):
+    app_module = sys.modules['app']
+    pool = RenderPool(workers=1, max_queue=1, executor_factory=thread_pool)
+    monkeypatch.setattr(app_module, 'render_pool', pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_async_download_flow(client, app_render_pool):
+    candidate_id = json.loads(client.post('/api/submit', json={"full_name": "Ana", "email": "ana@example.com"}).data)['candidate_id']
+
+    rv = client.get(f'/api/download/{candidate_id}?style=uno&async=1')
+    assert rv.status_code == 202
+    queued = json.loads(rv.data)
+    assert rv.headers['Location'] == queued["status_url"]
+
+    rv = client.get(f'{queued["status_url"]}?wait=10')
+    assert rv.status_code == 200
+    assert json.loads(rv.data)["status"] == "done"
+
+    # The finished job hands its PDF to the cache instead of keeping it in memory
+    assert app_render_pool.get(queued["render_id"]).content is None
+    pdf = client.get(queued["download_url"])
+    assert pdf.status_code == 200
+    assert pdf.data.startswith(b"%PDF")
+    assert pdf.headers['Content-Disposition'].endswith(f"cv_{candidate_id}_uno.pdf")
+
+    # The finished render went to the PDF cache: a plain download is now a hit
+    assert client.get(f'/api/download/{candidate_id}?style=uno').headers['X-PDF-Cache'] == "HIT"
+    stats = json.loads(client.get('/api/renders/stats').data)
+    assert stats["pool"]["completed"] == 1
+    assert client.get('/api/renders/unknown').status_code == 404
+
+
+def test_render_served_by_another_worker(client, app_render_pool, monkeypatch):
+    candidate_id = json.loads(client.post('/api/submit', json={"full_name": "Ana", "email": "ana@example.com"}).data)['candidate_id']
+    queued = json.loads(client.get(f'/api/download/{candidate_id}?async=1').data)
+    assert client.get(f'{queued["status_url"]}?wait=10').status_code == 200
+
+    # A worker that never saw the job answers from the shared PDF cache
+    monkeypatch.setattr(sys.modules['app'], 'render_pool', RenderPool(workers=1, executor_factory=thread_pool))
+    status = client.get(queued["status_url"])
+    assert status.status_code == 200
+    assert json.loads(status.data)["status"] == "done"
+    pdf = client.get(queued["download_url"])
+    assert pdf.status_code == 200 and pdf.data.startswith(b"%PDF")
+    assert pdf.headers['ETag'].strip('"') == queued["render_id"]
+    assert client.get(f'/api/renders/{"0" * 64}').status_code == 404
+
+
+def test_async_download_backpressure(client, app_render_pool):
+    release = threading.Event()
+    app_render_pool.render = blocking_render(release)
+    ids = [json.loads(client.post('/api/submit', json={"full_name": n, "email": f"{n}@example.com"}).data)['candidate_id']
+           for n in ("ana", "luis")]
+    try:
+        first = client.get(f'/api/download/{ids[0]}?async=1')
+        assert first.status_code == 202
+        assert client.get(json.loads(first.data)["download_url"]).status_code == 409
+
+        rv = client.get(f'/api/download/{ids[1]}?async=1')
+        assert rv.status_code == 429
+        assert rv.headers['Retry-After']
+    finally:
+        release.set()
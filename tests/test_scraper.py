@@ -1,12 +1,20 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from scraper import scrape_jobs
+from scraper import scrape_jobs, feed, FeedIndex
+from scrapers.rate_limit import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def reset_feed():
+    feed.reset()
+    rate_limiter._buckets.clear()
+    yield
+    feed.reset()
 
 def test_scrape_jobs_success():
     with patch('requests.get') as mock_get:
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
+        mock_resp = MagicMock(status_code=200, headers={})
         mock_resp.json.return_value = [
             {"legal": "info"},
             {
@@ -27,8 +35,7 @@ def test_scrape_jobs_success():
 
 def test_scrape_jobs_failure():
     with patch('requests.get') as mock_get:
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
+        mock_resp = MagicMock(status_code=404, headers={})
         mock_get.return_value = mock_resp
         
         jobs = scrape_jobs("fail")
@@ -36,8 +43,7 @@ def test_scrape_jobs_failure():
         
 def test_scrape_jobs_empty():
     with patch('requests.get') as mock_get:
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
+        mock_resp = MagicMock(status_code=200, headers={})
         mock_resp.json.return_value = []
         mock_get.return_value = mock_resp
         
@@ -45,3 +51,40 @@ def test_scrape_jobs_empty():
         # Depending on our fallback logic "test" might trigger mock data
         # But "empty" should yield empty list unless fallback triggers
         assert isinstance(jobs, list)
+
+
+FEED_ITEMS = [
+    {"position": "Senior Python Engineer", "company": "A", "location": "Worldwide", "url": "http://a", "tags": ["python", "django"]},
+    {"position": "React Developer", "company": "B", "location": "Santiago, Chile", "url": "http://b", "tags": ["react", "javascript"]},
+    {"position": "Python Data Engineer", "company": "C", "location": "Berlin, Germany", "url": "http://c", "tags": ["python", "machine learning"]},
+]
+
+
+def test_feed_index_query_and_location():
+    index = FeedIndex(FEED_ITEMS)
+    assert [j["company"] for j in index.search("python")] == ["A", "C"]
+    assert [j["company"] for j in index.search("machine learning")] == ["C"]
+    assert [j["company"] for j in index.search("data engineer")] == ["C"]
+    # Worldwide postings stay visible for any location
+    assert [j["company"] for j in index.search("python", "Germany")] == ["A", "C"]
+    assert [j["company"] for j in index.search("", "chile")] == ["A", "B"]
+    assert index.search("python", "Chile") == [index.search("python")[0]]
+
+
+def test_feed_is_fetched_once_and_revalidated():
+    with patch('requests.get') as mock_get:
+        ok = MagicMock(status_code=200, headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Jun 2025 10:00:00 GMT"})
+        ok.json.return_value = [{"legal": "info"}] + FEED_ITEMS
+        mock_get.return_value = ok
+
+        assert len(scrape_jobs("python")) == 2
+        assert len(scrape_jobs("react", "santiago")) == 1
+        assert mock_get.call_count == 1
+
+        mock_get.return_value = MagicMock(status_code=304, headers={})
+        feed.refresh()
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Mon, 02 Jun 2025 10:00:00 GMT"
+        assert len(scrape_jobs("python")) == 2
+        assert feed.stats["not_modified"] == 1
@@ -0,0 +1,61 @@
+from agents.career_strategist import CareerStrategist
+from agents.job_scout import JobScout
+from skills.taxonomy import PatternAutomaton, SkillTaxonomy, get_taxonomy
+
+
+def test_automaton_reports_overlapping_matches():
+    automaton = PatternAutomaton([("he", "he"), ("she", "she"), ("his", "his"), ("hers", "hers")])
+    assert sorted(automaton.finditer("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_match_whole_words_leftmost_longest():
+    taxonomy = get_taxonomy()
+    names = lambda text: [taxonomy.names[i] for i in taxonomy.match(text)]
+
+    assert names("Senior Data Scientist (Python)") == ["data scientist", "python"]
+    assert names("Full-Stack Node.js dev") == ["full stack developer", "node"]
+    assert names("Database administrator, Javanese speaker") == []
+
+
+def test_closure_handles_cycles_and_depth():
+    taxonomy = SkillTaxonomy({"skills": {
+        "a": {"parents": ["b"]},
+        "b": {"parents": ["c"]},
+        "c": {"parents": ["a"]},
+        "d": {"parents": ["a"], "related": ["b"]},
+    }})
+    ids = taxonomy.ids
+    assert sorted(taxonomy.ancestors(ids["d"])) == sorted([ids["a"], ids["b"], ids["c"]])
+    assert sorted(taxonomy.descendants(ids["c"])) == sorted([ids["a"], ids["b"], ids["d"]])
+    assert taxonomy.expand("d") == ["b"]
+
+
+def test_large_taxonomy_matches_the_same():
+    skills = {f"skill{i}": {"parents": [f"skill{i // 10}"] if i else []} for i in range(1000)}
+    skills["python"] = {"related": ["django"]}
+    skills["django"] = {}
+    taxonomy = SkillTaxonomy({"skills": skills})
+
+    assert taxonomy.expand("python developer") == ["django"]
+    assert [taxonomy.names[i] for i in taxonomy.ancestors(taxonomy.ids["skill999"])] == ["skill99", "skill9", "skill0"]
+
+
+def test_job_scout_expand_query():
+    scout = JobScout()
+    assert scout.expand_query("Python Developer") == ["Python Developer", "django", "flask"]
+    assert scout.expand_query("Data Scientist") == ["Data Scientist", "data analyst", "machine learning"]
+    assert scout.expand_query("Cobol") == ["Cobol"]
+
+
+def test_career_strategist_gaps():
+    strategist = CareerStrategist()
+    assert strategist.identify_gaps("Full Stack Developer", ["Python"]) == [
+        "Consider learning a modern frontend framework (React/Vue)."
+    ]
+    # Child skills satisfy their parents: Next.js covers React, Express covers Node
+    assert strategist.identify_gaps("Full Stack Developer", ["Next.js", "Express"]) == []
+    # Data roles inherit the requirements of the "data" role
+    assert strategist.identify_gaps("Senior Data Engineer", ["Excel"]) == [
+        "Data roles require strong SQL and Python foundations."
+    ]
+    assert strategist.identify_gaps("Data Analyst", ["PostgreSQL"]) == []